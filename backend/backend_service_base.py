@@ -1,7 +1,9 @@
 import time
+import asyncio
 import grpc
-from concurrent import futures
 import threading
+import multiprocessing
+import signal
 import sys
 import os
 
@@ -12,7 +14,14 @@ from generated import backend_pb2, backend_pb2_grpc, db_pb2, db_pb2_grpc
 from common.logging_config import setup_logging
 from common.circuit_breaker import CircuitBreaker
 from common.backpressure import BackpressureController
-from common.deadline import DeadlineHandler, AdaptiveDeadlineHandler
+from common.deadline import DeadlineHandler, DeadlineRegistry, DeadlineBudgetExhausted
+from common.channel_pool import ChannelPool, AsyncChannelPool
+from common.server_factory import create_server, create_aio_server, get_server_max_workers
+from common.bulkhead import create_bulkhead_from_env
+from common.priority import get_request_priority, parse_priority_shares
+from common.admission import create_backpressure_interceptor
+from common.shared_state import create_shared_state_store_from_env
+from common.cancellation import CancellationStats, DownstreamCancelled, call_cancellable
 
 class BaseBackendServicer(backend_pb2_grpc.BackendServiceServicer):
     def __init__(self, service_name, port=50052, use_circuit_breaker=False, use_deadline=False, use_backpressure=False):
@@ -28,55 +37,174 @@ class BaseBackendServicer(backend_pb2_grpc.BackendServiceServicer):
         # 환경 변수에서 설정 가져오기
         fail_threshold = int(os.environ.get("CIRCUIT_BREAKER_FAIL_THRESHOLD", "3"))
         reset_timeout = int(os.environ.get("CIRCUIT_BREAKER_RESET_TIMEOUT", "10"))
+        cb_window_type = os.environ.get("CIRCUIT_BREAKER_WINDOW_TYPE", "count")
+        cb_window_size = int(os.environ.get("CIRCUIT_BREAKER_WINDOW_SIZE", "20"))
+        cb_failure_rate = float(os.environ.get("CIRCUIT_BREAKER_FAILURE_RATE", "50"))
+        cb_minimum_calls = int(os.environ.get("CIRCUIT_BREAKER_MIN_CALLS", str(fail_threshold)))
+        cb_slow_call_threshold = float(os.environ.get("CIRCUIT_BREAKER_SLOW_CALL_THRESHOLD", "0"))
+        cb_slow_call_rate = float(os.environ.get("CIRCUIT_BREAKER_SLOW_CALL_RATE", "80"))
+        cb_half_open_permits = int(os.environ.get("CIRCUIT_BREAKER_HALF_OPEN_PERMITS", "2"))
+        cb_half_open_successes = int(os.environ.get("CIRCUIT_BREAKER_HALF_OPEN_SUCCESSES", "2"))
         backpressure_window = int(os.environ.get("BACKPRESSURE_WINDOW", "5"))
         backpressure_max_requests = int(os.environ.get("BACKPRESSURE_MAX_REQUESTS", "30"))
         backpressure_max_concurrency = int(os.environ.get("BACKPRESSURE_MAX_CONCURRENCY", "8"))
+        backpressure_strategy = os.environ.get("BACKPRESSURE_STRATEGY", "window")
+        backpressure_burst = int(os.environ.get("BACKPRESSURE_BURST", "0"))
+        concurrency_algorithm = os.environ.get("BACKPRESSURE_CONCURRENCY_LIMITER", "static")
+        min_concurrency = int(os.environ.get("BACKPRESSURE_MIN_CONCURRENCY", "1"))
+        max_concurrency_limit = int(os.environ.get("BACKPRESSURE_MAX_CONCURRENCY_LIMIT", "200"))
+        backpressure_queue_size = int(os.environ.get("BACKPRESSURE_QUEUE_SIZE", "0"))
+        backpressure_queue_target = float(os.environ.get("BACKPRESSURE_QUEUE_TARGET", "0.005"))
+        backpressure_queue_interval = float(os.environ.get("BACKPRESSURE_QUEUE_INTERVAL", "0.1"))
+        priority_shares = parse_priority_shares(os.environ.get("BACKPRESSURE_PRIORITY_SHARES", ""))
+        backpressure_shared_key = os.environ.get("BACKPRESSURE_SHARED_KEY", "db")
         deadline_timeout = float(os.environ.get("DEADLINE_TIMEOUT", "0.5"))
+        deadline_safety_margin = float(os.environ.get("DEADLINE_SAFETY_MARGIN", "0.05"))
+        deadline_max_routes = int(os.environ.get("DEADLINE_MAX_ROUTES", "64"))
+        db_pool_size = int(os.environ.get("DB_CHANNEL_POOL_SIZE", "4"))
         
         # 에러 처리 패턴 초기화
         self.circuit_breaker = CircuitBreaker(
             fail_threshold=fail_threshold,
             reset_timeout=reset_timeout,
-            name=f"{service_name}_to_db"
+            name=f"{service_name}_to_db",
+            window_type=cb_window_type,
+            window_size=cb_window_size,
+            failure_rate_threshold=cb_failure_rate,
+            minimum_calls=cb_minimum_calls,
+            slow_call_threshold=cb_slow_call_threshold,
+            slow_call_rate_threshold=cb_slow_call_rate,
+            half_open_permits=cb_half_open_permits,
+            half_open_required_successes=cb_half_open_successes
         )
+        # 레플리카 간 공유 상태 저장소 (BACKPRESSURE_STRATEGY=shared_token_bucket 일 때 전체 예산 공유)
+        self.shared_state_store = create_shared_state_store_from_env(service_name)
         self.backpressure = BackpressureController(
             window_size=backpressure_window,
             max_requests=backpressure_max_requests,
             max_concurrency=backpressure_max_concurrency,
-            name=service_name
+            name=service_name,
+            strategy=backpressure_strategy,
+            burst=backpressure_burst,
+            concurrency_algorithm=concurrency_algorithm,
+            min_concurrency=min_concurrency,
+            max_concurrency_limit=max_concurrency_limit,
+            queue_size=backpressure_queue_size,
+            queue_target=backpressure_queue_target,
+            queue_interval=backpressure_queue_interval,
+            priority_shares=priority_shares,
+            shared_store=self.shared_state_store,
+            shared_key=backpressure_shared_key
         )
-        self.deadline_handler = AdaptiveDeadlineHandler(
+        # 서비스 공통 데드라인 (상위 호출 예산 확인, 로컬 데드라인 없는 하위 호출)
+        self.deadline_handler = DeadlineHandler(
+            timeout_seconds=deadline_timeout,
+            name=f"{service_name}_to_db",
+            safety_margin=deadline_safety_margin
+        )
+        # 경로(대상, 메서드, 요청 유형)별 적응형 데드라인
+        self.deadline_registry = DeadlineRegistry(
             initial_timeout=deadline_timeout,
-            name=f"{service_name}_to_db"
+            name=f"{service_name}_to_db",
+            max_routes=deadline_max_routes,
+            safety_margin=deadline_safety_margin
         )
         
-        # 서킷브레이커와 데드라인 핸들러 연동
-        self.deadline_handler.set_circuit_breaker(self.circuit_breaker)
+        # 서킷브레이커와 데드라인 레지스트리 연동
+        self.deadline_registry.set_circuit_breaker(self.circuit_breaker)
         
         # DB 서비스 주소 (환경 변수에서 읽기)
         self.db_address = os.environ.get("DB_SERVICE_ADDRESS", "localhost:50057")
+        
+        # DB 채널/스텁 풀 (요청마다 채널을 만들지 않고 워커 스레드가 공유)
+        self.db_pool = self._create_db_pool(db_pool_size)
+        
+        # 서버 실행기 (run_server 에서 설정, 큐 대기 시간 지표용)
+        self.server_executor = None
+        
+        # 디스패치 시점 백프레셔 인터셉터 (run_server 에서 설정, 설정되면 핸들러는 백프레셔 등록/완료를 하지 않음)
+        self.backpressure_interceptor = None
+        
+        # 프리포크 모드의 워커 번호 (패턴 상태는 워커 프로세스별로 독립)
+        self.worker_index = 0
+        
+        # 호출자가 떠나(취소/데드라인 만료) 처리 중에 중단한 요청 수
+        self.cancellation_stats = CancellationStats()
+        
+        # 벌크헤드 (BULKHEAD_ENABLED 일 때만 생성, slow/normal 요청 격리)
+        self.bulkhead = self._create_bulkhead(service_name)
         self.logger.info(f"[{service_name}] 초기화 - DB 주소: {self.db_address}")
         self.logger.info(f"[{service_name}] 초기화 - 패턴 설정: 서킷브레이커={use_circuit_breaker}, 데드라인={use_deadline}, 백프레셔={use_backpressure}")
-        self.logger.info(f"[{service_name}] 백프레셔 설정 - 창={backpressure_window}초, 최대요청={backpressure_max_requests}개, 최대동시={backpressure_max_concurrency}개")
-        self.logger.info(f"[{service_name}] 서킷브레이커 설정 - 실패임계값={fail_threshold}, 초기화시간={reset_timeout}초")
-        self.logger.info(f"[{service_name}] 데드라인 설정 - 초기타임아웃={deadline_timeout}초")
+        self.logger.info(f"[{service_name}] 백프레셔 설정 - 창={backpressure_window}초, 최대요청={backpressure_max_requests}개, 최대동시={backpressure_max_concurrency}개, 전략={backpressure_strategy}, 버스트={backpressure_burst or '자동'}, 동시성제한={concurrency_algorithm}, 대기열={backpressure_queue_size}개")
+        self.logger.info(f"[{service_name}] 서킷브레이커 설정 - 창={cb_window_type}/{cb_window_size}, 실패율임계값={cb_failure_rate}%, 최소호출={cb_minimum_calls}건, 느린호출={cb_slow_call_threshold}초/{cb_slow_call_rate}%, 시험요청={cb_half_open_permits}개/성공{cb_half_open_successes}건, 초기화시간={reset_timeout}초")
+        self.logger.info(f"[{service_name}] 데드라인 설정 - 초기타임아웃={deadline_timeout}초, 안전여유={deadline_safety_margin}초")
+        self.logger.info(f"[{service_name}] DB 채널풀 설정 - 크기={db_pool_size}")
+    
+    def _create_db_pool(self, size):
+        """DB 채널풀 생성"""
+        return ChannelPool(
+            address=self.db_address,
+            stub_class=db_pb2_grpc.DbServiceStub,
+            size=size,
+            name=f"{self.service_name}_to_db"
+        )
+    
+    def _create_bulkhead(self, service_name):
+        """벌크헤드 생성 - 구획 슬롯 합계가 서버 워커 스레드 수를 넘지 않아야 함"""
+        return create_bulkhead_from_env(service_name, max_workers=get_server_max_workers())
     
-    # 수정 후 (수정된 코드)
     def Process(self, request, context):
+        # 벌크헤드 모드: 요청 분류별 동시 처리 한도 적용 (핸들러 스레드에서 바로 처리)
+        if self.bulkhead is None:
+            return self._process(request, context)
+        
+        request_class = self.bulkhead.classify(request.request_type)
+        if not self.bulkhead.try_acquire(request_class):
+            return self._reject_bulkhead(request_class, context)
+        try:
+            return self._process(request, context)
+        finally:
+            self.bulkhead.release(request_class)
+    
+    def _reject_bulkhead(self, request_class, context):
+        """벌크헤드 구획 포화로 요청 거부"""
+        self.logger.warning(f"[{self.service_name}] 벌크헤드 패턴 발동 - {request_class} 구획 포화")
+        context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+        context.set_details(f"{request_class} 요청 처리 한도 초과입니다. 잠시 후 다시 시도해주세요.")
+        return backend_pb2.BackendResponse(
+            success=False,
+            error_message=f"벌크헤드 포화 ({request_class})"
+        )
+    
+    def _reject_deadline_budget(self, budget_error, context):
+        """상위 호출의 데드라인 예산 소진으로 요청 거부"""
+        context.set_code(grpc.StatusCode.DEADLINE_EXCEEDED)
+        context.set_details(budget_error.details())
+        return backend_pb2.BackendResponse(
+            success=False,
+            error_message="데드라인 예산 소진"
+        )
+    
+    # 수정 후 (수정된 코드)
+    def _process(self, request, context):
         # 요청별 패턴 설정 (요청에서 지정되지 않으면 기본값 사용)
         use_circuit_breaker = request.use_circuit_breaker if hasattr(request, "use_circuit_breaker") and request.use_circuit_breaker else self.default_use_circuit_breaker
         use_deadline = request.use_deadline if hasattr(request, "use_deadline") and request.use_deadline else self.default_use_deadline
         use_backpressure = request.use_backpressure if hasattr(request, "use_backpressure") and request.use_backpressure else self.default_use_backpressure
+        # 인터셉터가 디스패치 시점에 백프레셔를 적용했으면 핸들러에서는 등록/완료하지 않음
+        manage_backpressure = use_backpressure and self.backpressure_interceptor is None
+        
+        priority = get_request_priority(context, request.request_type)
         
-        self.logger.info(f"[{self.service_name}] 요청 받음: {request.request_type}")
+        self.logger.info(f"[{self.service_name}] 요청 받음: {request.request_type}, 우선순위: {priority}")
         self.logger.info(f"[{self.service_name}] 패턴 설정 - 서킷브레이커: {use_circuit_breaker}, " +
                         f"데드라인: {use_deadline}, 백프레셔: {use_backpressure}")
         
         # 백프레셔 패턴 적용
-        if use_backpressure:
-            if not self.backpressure.register_request():
+        if manage_backpressure:
+            if not self.backpressure.register_request(priority):
                 # 과부하 상태로 요청 거부
-                self.logger.warning(f"[{self.service_name}] 백프레셔 패턴 발동 - 과부하 상태")
+                self.logger.warning(f"[{self.service_name}] 백프레셔 패턴 발동 - 과부하 상태 (우선순위: {priority})")
                 context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
                 context.set_details("서버 과부하 상태입니다. 잠시 후 다시 시도해주세요.")
                 return backend_pb2.BackendResponse(
@@ -84,18 +212,28 @@ class BaseBackendServicer(backend_pb2_grpc.BackendServiceServicer):
                     error_message="서버 과부하 상태"
                 )
         
+        backpressure_start_time = time.time()   # 적응형 동시성 표본 (등록 ~ 완료 시간)
+        
         try:
-            db_channel = grpc.insecure_channel(self.db_address)
-            db_stub = db_pb2_grpc.DbServiceStub(db_channel)
+            db_stub = self.db_pool.get_stub()
+            
+            # 상위 호출이 이미 포기했을 요청이면 DB 를 호출하지 않고 바로 실패
+            budget_error = self.deadline_handler.check_budget(context)
+            if budget_error is not None:
+                if manage_backpressure:
+                    self.backpressure.complete_request()
+                return self._reject_deadline_budget(budget_error, context)
             
             # 서킷 브레이커 패턴 적용
+            circuit_permit = None   # HALF_OPEN 이면 시험 요청 허가 - 결과 보고 시 그대로 넘김
             if use_circuit_breaker:
                 self.logger.info(f"[{self.service_name}] 서킷브레이커 상태 확인 중...")
-                if not self.circuit_breaker.allow_request():
+                circuit_permit = self.circuit_breaker.allow_request()
+                if not circuit_permit:
                     self.logger.warning(f"[{self.service_name}] 서킷브레이커 오픈 상태 - 요청 차단됨")
                     context.set_code(grpc.StatusCode.UNAVAILABLE)
                     context.set_details("서비스 일시적으로 사용 불가")
-                    if use_backpressure:
+                    if manage_backpressure:
                         self.backpressure.complete_request()
                     return backend_pb2.BackendResponse(
                         success=False,
@@ -106,37 +244,45 @@ class BaseBackendServicer(backend_pb2_grpc.BackendServiceServicer):
             try:
                 # 데드라인 패턴 적용
                 query_type = "slow" if request.request_type == "slow" else "normal"
+                query_start_time = time.time()
                 
                 if use_deadline:
-                    self.logger.info(f"[{self.service_name}] 데드라인 패턴 사용 ({self.deadline_handler.get_timeout()}초)")
+                    deadline_handler = self.deadline_registry.get("db", "Query", query_type)
+                    self.logger.info(f"[{self.service_name}] 데드라인 패턴 사용 ({deadline_handler.get_timeout():.3f}초)")
                     # call_with_deadline_and_record 메소드 사용으로 변경
-                    response, error = self.deadline_handler.call_with_deadline_and_record(
+                    response, error = deadline_handler.call_with_deadline_and_record(
                         db_stub.Query,
-                        db_pb2.DbRequest(query_type=query_type)
+                        db_pb2.DbRequest(query_type=query_type),
+                        context
                     )
                     
                     if error:
-                        if use_circuit_breaker:
-                            self.circuit_breaker.report_failure()
                         raise error
                 else:
-                    self.logger.info(f"[{self.service_name}] DB 서비스 호출 (데드라인 없음)")
+                    self.logger.info(f"[{self.service_name}] DB 서비스 호출 (로컬 데드라인 없음, 상위 호출 남은 시간만 적용)")
                     # 실행 시간 측정을 위해 시작 시간 기록
                     start_time = time.time()
-                    response = db_stub.Query(db_pb2.DbRequest(query_type=query_type))
+                    response = call_cancellable(
+                        db_stub.Query,
+                        db_pb2.DbRequest(query_type=query_type),
+                        context,
+                        timeout=self.deadline_handler.outbound_timeout(context, use_local_timeout=False)
+                    )
                     execution_time = time.time() - start_time
                     
                     # 실행 시간 기록
                     if use_circuit_breaker:
                         self.circuit_breaker.record_execution_time(execution_time)
                 
+                self.db_pool.record_query_time(time.time() - query_start_time)
+                
                 # 성공 처리
                 if use_circuit_breaker:
-                    self.circuit_breaker.report_success()
+                    self.circuit_breaker.report_success(circuit_permit)
                 
                 self.logger.info(f"[{self.service_name}] DB 응답 수신: {response.result}")
-                if use_backpressure:
-                    self.backpressure.complete_request()
+                if manage_backpressure:
+                    self.backpressure.complete_request(rtt=time.time() - backpressure_start_time)
                 
                 # 응답 반환
                 return backend_pb2.BackendResponse(
@@ -145,9 +291,35 @@ class BaseBackendServicer(backend_pb2_grpc.BackendServiceServicer):
                     error_message=response.error_message
                 )
             
+            except DownstreamCancelled as e:
+                # 호출자가 떠나 DB 호출을 취소함 (DB 장애가 아니므로 서킷브레이커에 기록하지 않고 허가만 반환)
+                if use_circuit_breaker:
+                    self.circuit_breaker.release_permit(circuit_permit)
+                cancelled_count = self.cancellation_stats.record()
+                self.logger.warning(f"[{self.service_name}] 호출자 취소로 DB 호출 중단 (누적 {cancelled_count}건)")
+                context.set_code(grpc.StatusCode.CANCELLED)
+                context.set_details(e.details())
+                
+                if manage_backpressure:
+                    self.backpressure.complete_request()
+                
+                return backend_pb2.BackendResponse(
+                    success=False,
+                    error_message="호출자 취소"
+                )
+            
+            except DeadlineBudgetExhausted as e:
+                # 호출 직전에 상위 예산이 소진됨 - DB 를 호출하지 않았으므로 실패로 기록하지 않고 허가만 반환
+                if use_circuit_breaker:
+                    self.circuit_breaker.release_permit(circuit_permit)
+                if manage_backpressure:
+                    self.backpressure.complete_request()
+                return self._reject_deadline_budget(e, context)
+            
             except grpc.RpcError as e:
+                self.db_pool.record_query_time(time.time() - query_start_time)
                 if use_circuit_breaker:
-                    self.circuit_breaker.report_failure()
+                    self.circuit_breaker.report_failure(circuit_permit)
                 
                 status_code = e.code()
                 details = e.details()
@@ -161,8 +333,8 @@ class BaseBackendServicer(backend_pb2_grpc.BackendServiceServicer):
                     context.set_code(status_code)
                     context.set_details(f"DB 서비스 오류: {details}")
                 
-                if use_backpressure:
-                    self.backpressure.complete_request()
+                if manage_backpressure:
+                    self.backpressure.complete_request(dropped=True)
                     
                 return backend_pb2.BackendResponse(
                     success=False,
@@ -174,7 +346,7 @@ class BaseBackendServicer(backend_pb2_grpc.BackendServiceServicer):
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(f"내부 서버 오류: {str(e)}")
             
-            if use_backpressure:
+            if manage_backpressure:
                 self.backpressure.complete_request()
                 
             return backend_pb2.BackendResponse(
@@ -208,19 +380,73 @@ class BaseBackendServicer(backend_pb2_grpc.BackendServiceServicer):
                 message=f"리셋 실패: {str(e)}"
             )
     
+    def _collect_metrics(self):
+        """GetStatus 로 내보낼 부가 지표 수집"""
+        # 응답한 워커 프로세스
+        metrics = {
+            "worker.index": str(self.worker_index),
+            "worker.pid": str(os.getpid()),
+        }
+        
+        # DB 채널풀 통계 (연결 수립 시간 vs 쿼리 시간)
+        for key, value in self.db_pool.get_stats().items():
+            metrics[f"db_pool.{key}"] = str(value)
+        
+        # 서킷브레이커 실패율 창
+        for key, value in self.circuit_breaker.get_stats().items():
+            metrics[f"circuit_breaker.{key}"] = str(value)
+        
+        # 하위 호출 실행 시간 분포 (1m/5m/1h 창별 p50/p95/p99)
+        for key, value in self.circuit_breaker.get_latency_stats().items():
+            metrics[f"latency.{key}"] = str(value)
+        
+        # 데드라인 (기본 타임아웃, 예산 소진으로 생략한 DB 호출 수)
+        for key, value in self.deadline_handler.get_stats().items():
+            metrics[f"deadline.{key}"] = str(value)
+        
+        # 경로별 적응형 데드라인 (활성 경로의 현재 타임아웃)
+        for key, value in self.deadline_registry.get_stats().items():
+            metrics[f"deadline.{key}"] = str(value)
+        
+        # 백프레셔 요청률 제한 전략 상태
+        for key, value in self.backpressure.get_stats().items():
+            metrics[f"backpressure.{key}"] = str(value)
+        
+        # 서버 실행기 큐 대기 시간
+        if self.server_executor is not None:
+            for key, value in self.server_executor.get_stats().items():
+                metrics[f"server.{key}"] = str(value)
+        
+        # 호출자 취소로 중단한 진행 중 요청
+        for key, value in self.cancellation_stats.get_stats().items():
+            metrics[f"cancellation.{key}"] = str(value)
+        
+        # 벌크헤드 구획별 상태
+        if self.bulkhead is not None:
+            for request_class, stats in self.bulkhead.get_stats().items():
+                for key, value in stats.items():
+                    metrics[f"bulkhead.{request_class}.{key}"] = str(value)
+        
+        # 디스패치 시점 어드미션 (임대 슬롯 반환/회수)
+        if self.backpressure_interceptor is not None:
+            for key, value in self.backpressure_interceptor.get_stats().items():
+                metrics[f"admission.{key}"] = str(value)
+        
+        return metrics
+    
     def GetStatus(self, request, context):
         self.logger.info(f"[{self.service_name}] 상태 확인 요청")
         
         try:
-            # 서킷브레이커 평균 실행 시간 계산
-            recent_exec_times = self.circuit_breaker.get_recent_execution_times(3600)  # 최근 1시간
-            avg_exec_time = sum(recent_exec_times) / len(recent_exec_times) if recent_exec_times else 0
+            # 부가 지표 (DB 채널풀, 실행기, 벌크헤드)
+            metrics = self._collect_metrics()
             
             return backend_pb2.StatusResponse(
                 circuit_breaker_state=self.circuit_breaker.state,
                 circuit_breaker_failures=self.circuit_breaker.failure_count,
                 backpressure_active_requests=self.backpressure.active_requests,
-                backpressure_overloaded=self.backpressure.is_overloaded()
+                backpressure_overloaded=self.backpressure.is_overloaded(),
+                metrics=metrics
             )
         except Exception as e:
             self.logger.exception(f"[{self.service_name}] 상태 조회 중 오류")
@@ -233,30 +459,317 @@ class BaseBackendServicer(backend_pb2_grpc.BackendServiceServicer):
                 backpressure_overloaded=False
             )
 
+class AsyncBackendServicer(BaseBackendServicer):
+    """grpc.aio 기반 백엔드 구현 - DB 응답 대기 중 스레드를 점유하지 않음
+
+    서킷브레이커/데드라인/백프레셔 플래그 처리는 동기 구현과 같고, DB 호출만 aio 스텁으로 await 한다.
+    """
+    
+    def _create_db_pool(self, size):
+        """aio DB 채널풀 생성 (이벤트 루프 안에서 호출되어야 함)"""
+        return AsyncChannelPool(
+            address=self.db_address,
+            stub_class=db_pb2_grpc.DbServiceStub,
+            size=size,
+            name=f"{self.service_name}_to_db_aio"
+        )
+    
+    def _create_bulkhead(self, service_name):
+        """벌크헤드 생성 (aio 서버는 워커 스레드를 점유하지 않으므로 구획 합계 제한 없음)"""
+        return create_bulkhead_from_env(service_name)
+    
+    async def Process(self, request, context):
+        # 벌크헤드 모드: 요청 분류별 동시 처리 한도 적용
+        if self.bulkhead is None:
+            return await self._process(request, context)
+        
+        request_class = self.bulkhead.classify(request.request_type)
+        if not self.bulkhead.try_acquire(request_class):
+            return self._reject_bulkhead(request_class, context)
+        try:
+            return await self._process(request, context)
+        finally:
+            self.bulkhead.release(request_class)
+    
+    async def _process(self, request, context):
+        # 요청별 패턴 설정 (요청에서 지정되지 않으면 기본값 사용)
+        use_circuit_breaker = request.use_circuit_breaker if hasattr(request, "use_circuit_breaker") and request.use_circuit_breaker else self.default_use_circuit_breaker
+        use_deadline = request.use_deadline if hasattr(request, "use_deadline") and request.use_deadline else self.default_use_deadline
+        use_backpressure = request.use_backpressure if hasattr(request, "use_backpressure") and request.use_backpressure else self.default_use_backpressure
+        # 인터셉터가 디스패치 시점에 백프레셔를 적용했으면 핸들러에서는 등록/완료하지 않음
+        manage_backpressure = use_backpressure and self.backpressure_interceptor is None
+        
+        priority = get_request_priority(context, request.request_type)
+        
+        self.logger.info(f"[{self.service_name}-aio] 요청 받음: {request.request_type}, 우선순위: {priority}")
+        self.logger.info(f"[{self.service_name}-aio] 패턴 설정 - 서킷브레이커: {use_circuit_breaker}, " +
+                        f"데드라인: {use_deadline}, 백프레셔: {use_backpressure}")
+        
+        # 백프레셔 패턴 적용
+        if manage_backpressure:
+            if not await self.backpressure.register_request_async(priority):
+                self.logger.warning(f"[{self.service_name}-aio] 백프레셔 패턴 발동 - 과부하 상태 (우선순위: {priority})")
+                context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+                context.set_details("서버 과부하 상태입니다. 잠시 후 다시 시도해주세요.")
+                return backend_pb2.BackendResponse(
+                    success=False,
+                    error_message="서버 과부하 상태"
+                )
+        
+        # 적응형 동시성 표본 (등록 ~ 완료 시간, 하위 호출 실패는 드롭) - finally 에서 슬롯과 함께 반환
+        backpressure_start_time = time.time()
+        backpressure_rtt = None
+        backpressure_dropped = False
+        
+        try:
+            db_stub = self.db_pool.get_stub()
+            
+            # 상위 호출이 이미 포기했을 요청이면 DB 를 호출하지 않고 바로 실패
+            budget_error = self.deadline_handler.check_budget(context)
+            if budget_error is not None:
+                return self._reject_deadline_budget(budget_error, context)
+            
+            # 서킷 브레이커 패턴 적용
+            circuit_permit = None   # HALF_OPEN 이면 시험 요청 허가 - 결과 보고 시 그대로 넘김
+            if use_circuit_breaker:
+                circuit_permit = self.circuit_breaker.allow_request()
+                if not circuit_permit:
+                    self.logger.warning(f"[{self.service_name}-aio] 서킷브레이커 오픈 상태 - 요청 차단됨")
+                    context.set_code(grpc.StatusCode.UNAVAILABLE)
+                    context.set_details("서비스 일시적으로 사용 불가")
+                    return backend_pb2.BackendResponse(
+                        success=False,
+                        error_message="서킷브레이커가 오픈 상태입니다"
+                    )
+            
+            # DB 서비스 호출
+            try:
+                query_type = "slow" if request.request_type == "slow" else "normal"
+                query_start_time = time.time()
+                
+                if use_deadline:
+                    deadline_handler = self.deadline_registry.get("db", "Query", query_type)
+                    self.logger.info(f"[{self.service_name}-aio] 데드라인 패턴 사용 ({deadline_handler.get_timeout():.3f}초)")
+                    response, error = await deadline_handler.call_with_deadline_and_record_async(
+                        db_stub.Query,
+                        db_pb2.DbRequest(query_type=query_type),
+                        context
+                    )
+                    
+                    if error:
+                        raise error
+                else:
+                    self.logger.info(f"[{self.service_name}-aio] DB 서비스 호출 (로컬 데드라인 없음, 상위 호출 남은 시간만 적용)")
+                    start_time = time.time()
+                    response = await db_stub.Query(
+                        db_pb2.DbRequest(query_type=query_type),
+                        timeout=self.deadline_handler.outbound_timeout(context, use_local_timeout=False)
+                    )
+                    execution_time = time.time() - start_time
+                    
+                    if use_circuit_breaker:
+                        self.circuit_breaker.record_execution_time(execution_time)
+                
+                self.db_pool.record_query_time(time.time() - query_start_time)
+                
+                # 성공 처리
+                if use_circuit_breaker:
+                    self.circuit_breaker.report_success(circuit_permit)
+                
+                self.logger.info(f"[{self.service_name}-aio] DB 응답 수신: {response.result}")
+                backpressure_rtt = time.time() - backpressure_start_time
+                return backend_pb2.BackendResponse(
+                    result=f"{self.service_name} 처리 결과: {response.result}",
+                    success=response.success,
+                    error_message=response.error_message
+                )
+            
+            except asyncio.CancelledError:
+                # 호출자 취소는 DB 장애가 아니므로 서킷브레이커에 기록하지 않고 허가만 반환
+                if use_circuit_breaker:
+                    self.circuit_breaker.release_permit(circuit_permit)
+                raise
+            
+            except DeadlineBudgetExhausted as e:
+                # 호출 직전에 상위 예산이 소진됨 - DB 를 호출하지 않았으므로 실패로 기록하지 않고 허가만 반환
+                if use_circuit_breaker:
+                    self.circuit_breaker.release_permit(circuit_permit)
+                return self._reject_deadline_budget(e, context)
+            
+            except grpc.RpcError as e:
+                self.db_pool.record_query_time(time.time() - query_start_time)
+                if use_circuit_breaker:
+                    self.circuit_breaker.report_failure(circuit_permit)
+                backpressure_dropped = True
+                
+                status_code = e.code()
+                details = e.details()
+                
+                self.logger.error(f"[{self.service_name}-aio] DB 호출 중 오류: {status_code} - {details}")
+                
+                if status_code == grpc.StatusCode.DEADLINE_EXCEEDED:
+                    context.set_code(grpc.StatusCode.DEADLINE_EXCEEDED)
+                    context.set_details("DB 서비스 응답 시간 초과")
+                else:
+                    context.set_code(status_code)
+                    context.set_details(f"DB 서비스 오류: {details}")
+                
+                return backend_pb2.BackendResponse(
+                    success=False,
+                    error_message=f"DB 호출 오류: {details}"
+                )
+        
+        except asyncio.CancelledError:
+            # 호출자가 떠나 핸들러가 취소됨 - 대기 중이던 DB 호출도 함께 취소되어 DB 슬롯이 바로 반환됨
+            cancelled_count = self.cancellation_stats.record()
+            self.logger.warning(f"[{self.service_name}-aio] 호출자 취소로 처리 중단 (누적 {cancelled_count}건)")
+            raise
+        
+        except Exception as e:
+            self.logger.exception(f"[{self.service_name}-aio] 예기치 않은 오류")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"내부 서버 오류: {str(e)}")
+            return backend_pb2.BackendResponse(
+                success=False,
+                error_message=f"내부 서버 오류: {str(e)}"
+            )
+        
+        finally:
+            # 모든 종료 경로(취소 포함)에서 백프레셔 슬롯 반환
+            if manage_backpressure:
+                self.backpressure.complete_request(rtt=backpressure_rtt, dropped=backpressure_dropped)
+    
+    async def ResetPattern(self, request, context):
+        return BaseBackendServicer.ResetPattern(self, request, context)
+    
+    async def GetStatus(self, request, context):
+        return BaseBackendServicer.GetStatus(self, request, context)
+
+# 같은 포트를 여러 워커 프로세스가 함께 바인딩하도록 허용
+SERVER_OPTIONS = [("grpc.so_reuseport", 1)]
+
 def run_server(service_name, port, use_circuit_breaker=False, use_deadline=False, use_backpressure=False):
+    # BACKEND_WORKERS > 1 이면 같은 포트를 공유하는 워커 프로세스 여러 개로 실행
+    workers = int(os.environ.get("BACKEND_WORKERS", "1"))
+    if workers > 1:
+        run_prefork_server(service_name, port, workers, use_circuit_breaker, use_deadline, use_backpressure)
+        return
+    
+    run_worker(service_name, port, use_circuit_breaker, use_deadline, use_backpressure)
+
+def run_worker(service_name, port, use_circuit_breaker=False, use_deadline=False, use_backpressure=False, worker_index=0):
+    """서버 프로세스 하나 실행 (BACKEND_SERVER_MODE 에 따라 스레드풀 또는 aio)"""
+    if os.environ.get("BACKEND_SERVER_MODE", "thread").lower() == "aio":
+        asyncio.run(run_server_aio(service_name, port, use_circuit_breaker, use_deadline, use_backpressure, worker_index))
+    else:
+        run_thread_server(service_name, port, use_circuit_breaker, use_deadline, use_backpressure, worker_index)
+
+def run_prefork_server(service_name, port, workers, use_circuit_breaker=False, use_deadline=False, use_backpressure=False):
+    """SO_REUSEPORT 로 같은 포트에 바인딩하는 워커 프로세스 실행 (GIL 을 코어 수만큼 분산)"""
+    # gRPC 는 fork 이전에 생성된 채널/서버를 자식에서 쓸 수 없으므로 부모에서는 아무것도 만들지 않음
+    logger = setup_logging(f"{service_name}_master")
+    
+    processes = []
+    for worker_index in range(workers):
+        process = multiprocessing.Process(
+            target=run_worker,
+            args=(service_name, port, use_circuit_breaker, use_deadline, use_backpressure, worker_index),
+            name=f"{service_name}_worker_{worker_index}"
+        )
+        process.start()
+        processes.append(process)
+        logger.info(f"{service_name} 워커 {worker_index} 시작됨: PID {process.pid}")
+    
+    logger.info(f"{service_name} 프리포크 모드 시작: 워커 {workers}개 (패턴 상태는 워커별로 독립)")
+    
+    # 컨테이너 종료(SIGTERM) 시에도 워커를 함께 정리
+    def handle_sigterm(signum, frame):
+        raise KeyboardInterrupt
+    signal.signal(signal.SIGTERM, handle_sigterm)
+    
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        logger.info(f"{service_name} 워커 종료 중...")
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+
+def run_thread_server(service_name, port, use_circuit_breaker=False, use_deadline=False, use_backpressure=False, worker_index=0):
     logger = setup_logging(f"{service_name}_server")
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
     
     # 환경 변수에서 포트 설정 가져오기 (지정된 값이 있으면 우선 사용)
     port = int(os.environ.get("PORT", port))
     
-    backend_pb2_grpc.add_BackendServiceServicer_to_server(
-        BaseBackendServicer(
-            service_name=service_name,
-            port=port,
-            use_circuit_breaker=use_circuit_breaker,
-            use_deadline=use_deadline,
-            use_backpressure=use_backpressure
-        ), 
-        server
+    servicer = BaseBackendServicer(
+        service_name=service_name,
+        port=port,
+        use_circuit_breaker=use_circuit_breaker,
+        use_deadline=use_deadline,
+        use_backpressure=use_backpressure
     )
     
+    # 백프레셔가 기본 적용되는 서비스는 디스패치 시점에 적용 (BACKPRESSURE_ADMISSION=interceptor)
+    if use_backpressure:
+        servicer.backpressure_interceptor = create_backpressure_interceptor(servicer.backpressure, service_name)
+    interceptors = [servicer.backpressure_interceptor] if servicer.backpressure_interceptor is not None else None
+    
+    server, executor = create_server(service_name, options=SERVER_OPTIONS, interceptors=interceptors)
+    servicer.server_executor = executor
+    servicer.worker_index = worker_index
+    backend_pb2_grpc.add_BackendServiceServicer_to_server(servicer, server)
+    
+    # DB 채널풀 워밍업 (첫 요청이 연결 수립 비용을 부담하지 않도록)
+    warmup_timeout = float(os.environ.get("DB_CHANNEL_WARMUP_TIMEOUT", "5.0"))
+    servicer.db_pool.warm_up(timeout=warmup_timeout)
+    
     server.add_insecure_port(f"[::]:{port}")
     server.start()
-    logger.info(f"{service_name} 서비스 시작됨: 포트 {port}")
+    logger.info(f"{service_name} 서비스 시작됨: 포트 {port} (워커 {worker_index}, PID {os.getpid()})")
     
     try:
         server.wait_for_termination()
     except KeyboardInterrupt:
         logger.info(f"{service_name} 서비스 종료 중...")
-        server.stop(0)
\ No newline at end of file
+        server.stop(0)
+        servicer.db_pool.close()
+
+async def run_server_aio(service_name, port, use_circuit_breaker=False, use_deadline=False, use_backpressure=False, worker_index=0):
+    logger = setup_logging(f"{service_name}_server")
+    
+    # 환경 변수에서 포트 설정 가져오기 (지정된 값이 있으면 우선 사용)
+    port = int(os.environ.get("PORT", port))
+    
+    servicer = AsyncBackendServicer(
+        service_name=service_name,
+        port=port,
+        use_circuit_breaker=use_circuit_breaker,
+        use_deadline=use_deadline,
+        use_backpressure=use_backpressure
+    )
+    
+    # 백프레셔가 기본 적용되는 서비스는 디스패치 시점에 적용 (BACKPRESSURE_ADMISSION=interceptor)
+    if use_backpressure:
+        servicer.backpressure_interceptor = create_backpressure_interceptor(servicer.backpressure, service_name, use_aio=True)
+    interceptors = [servicer.backpressure_interceptor] if servicer.backpressure_interceptor is not None else None
+    
+    server = create_aio_server(service_name, options=SERVER_OPTIONS, interceptors=interceptors)
+    servicer.worker_index = worker_index
+    backend_pb2_grpc.add_BackendServiceServicer_to_server(servicer, server)
+    
+    # DB 채널풀 워밍업 (첫 요청이 연결 수립 비용을 부담하지 않도록)
+    warmup_timeout = float(os.environ.get("DB_CHANNEL_WARMUP_TIMEOUT", "5.0"))
+    await servicer.db_pool.warm_up(timeout=warmup_timeout)
+    
+    server.add_insecure_port(f"[::]:{port}")
+    await server.start()
+    logger.info(f"{service_name} 서비스 시작됨 (aio 모드): 포트 {port} (워커 {worker_index}, PID {os.getpid()})")
+    
+    try:
+        await server.wait_for_termination()
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        logger.info(f"{service_name} 서비스 종료 중...")
+        await server.stop(0)
+        await servicer.db_pool.close()
\ No newline at end of file
@@ -0,0 +1,72 @@
+import sys
+import os
+import time
+import logging
+# 프로젝트 루트 디렉토리를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from common.backpressure import BackpressureController
+
+# 창 하나에 담기는 요청 수별로 측정
+WINDOW_SIZES = [30, 1000, 10000, 100000]
+ITERATIONS = 20000
+LEGACY_ITERATIONS = 200
+
+class ListWindowController:
+    """비교용 - 매 요청마다 리스트 컴프리헨션으로 창을 재구성하던 이전 방식"""
+    
+    def __init__(self, window_size, max_requests):
+        self.window_size = window_size
+        self.max_requests = max_requests
+        self.request_times = []
+    
+    def register_request(self):
+        current_time = time.time()
+        self.request_times = [t for t in self.request_times if current_time - t < self.window_size]
+        if len(self.request_times) >= self.max_requests:
+            return False
+        self.request_times.append(current_time)
+        return True
+
+def fill_and_measure(controller, requests_in_window, complete):
+    """창을 requests_in_window 개로 채운 뒤 요청 1건 등록 비용(마이크로초) 측정"""
+    for _ in range(requests_in_window):
+        controller.register_request()
+        complete()
+    
+    start_time = time.perf_counter()
+    for _ in range(ITERATIONS):
+        controller.register_request()
+        complete()
+    elapsed = time.perf_counter() - start_time
+    return elapsed / ITERATIONS * 1_000_000
+
+def main():
+    # 로그 출력 비용은 제외하고 등록 로직만 측정
+    logging.disable(logging.CRITICAL)
+    
+    print(f"{'창 내 요청 수':>12} | {'링 버퍼 (us/요청)':>18} | {'리스트 재구성 (us/요청)':>22}")
+    for requests_in_window in WINDOW_SIZES:
+        # 측정 중 모든 요청이 허용되도록 상한을 넉넉히 설정
+        max_requests = requests_in_window + ITERATIONS + 1
+        
+        controller = BackpressureController(
+            window_size=60,
+            max_requests=max_requests,
+            max_concurrency=max_requests,
+            name="benchmark"
+        )
+        ring_cost = fill_and_measure(controller, requests_in_window, controller.complete_request)
+        
+        # 이전 방식은 창이 가득 찬 상태로 고정해 창 재구성 비용만 측정 (창이 클수록 느려짐)
+        legacy = ListWindowController(window_size=60, max_requests=requests_in_window)
+        legacy.request_times = [time.time()] * requests_in_window
+        start_time = time.perf_counter()
+        for _ in range(LEGACY_ITERATIONS):
+            legacy.register_request()
+        legacy_cost = (time.perf_counter() - start_time) / LEGACY_ITERATIONS * 1_000_000
+        
+        print(f"{requests_in_window:>12} | {ring_cost:>18.2f} | {legacy_cost:>22.2f}")
+
+if __name__ == "__main__":
+    main()
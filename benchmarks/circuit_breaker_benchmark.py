@@ -0,0 +1,75 @@
+import sys
+import os
+import time
+import logging
+import threading
+# 프로젝트 루트 디렉토리를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from common.circuit_breaker import CircuitBreaker
+
+# 동시에 요청을 처리하는 스레드 수별로 측정
+THREAD_COUNTS = [1, 8, 64]
+TOTAL_REQUESTS = 200000
+
+class GlobalLockCircuitBreaker(CircuitBreaker):
+    """비교용 - CLOSED 상태에서도 모든 호출이 공유 RLock 을 잡던 이전 방식"""
+    
+    def allow_request(self):
+        with self.lock:
+            return super().allow_request()
+    
+    def report_success(self):
+        with self.lock:
+            self._record_outcome(False, time.time())
+    
+    def record_execution_time(self, execution_time):
+        with self.lock:
+            current_time = time.time()
+            self.latency_histogram.record(execution_time, current_time)
+            self._record_slow_call(execution_time, current_time)
+
+def run_requests(circuit_breaker, requests, start_event):
+    """CLOSED 상태 성공 요청 1건 = 허용 확인 + 실행 시간 기록 + 성공 보고"""
+    start_event.wait()
+    for _ in range(requests):
+        if circuit_breaker.allow_request():
+            circuit_breaker.record_execution_time(0.02)
+            circuit_breaker.report_success()
+
+def measure(circuit_breaker_class, thread_count):
+    """thread_count 개 스레드가 TOTAL_REQUESTS 건을 나눠 처리할 때 요청당 비용(마이크로초)"""
+    circuit_breaker = circuit_breaker_class(
+        fail_threshold=5,
+        reset_timeout=10,
+        name="benchmark",
+        slow_call_threshold=1.0,
+        slow_call_rate_threshold=80
+    )
+    start_event = threading.Event()
+    threads = [
+        threading.Thread(target=run_requests, args=(circuit_breaker, TOTAL_REQUESTS // thread_count, start_event))
+        for _ in range(thread_count)
+    ]
+    for thread in threads:
+        thread.start()
+    
+    start_time = time.perf_counter()
+    start_event.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start_time
+    return elapsed / TOTAL_REQUESTS * 1_000_000
+
+def main():
+    # 로그 출력 비용은 제외하고 상태 판단/기록 로직만 측정
+    logging.disable(logging.CRITICAL)
+    
+    print(f"{'스레드 수':>8} | {'스냅샷+버퍼 (us/요청)':>20} | {'공유 잠금 (us/요청)':>18}")
+    for thread_count in THREAD_COUNTS:
+        snapshot_cost = measure(CircuitBreaker, thread_count)
+        locked_cost = measure(GlobalLockCircuitBreaker, thread_count)
+        print(f"{thread_count:>8} | {snapshot_cost:>20.2f} | {locked_cost:>18.2f}")
+
+if __name__ == "__main__":
+    main()
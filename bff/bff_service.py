@@ -1,6 +1,6 @@
 import time
+import asyncio
 import grpc
-from concurrent import futures
 import sys
 import os
 # 프로젝트 루트 디렉토리를 sys.path에 추가
@@ -10,7 +10,14 @@ from generated import bff_pb2, bff_pb2_grpc, backend_pb2, backend_pb2_grpc
 from common.logging_config import setup_logging
 from common.circuit_breaker import CircuitBreaker
 from common.backpressure import BackpressureController
-from common.deadline import DeadlineHandler, AdaptiveDeadlineHandler
+from common.deadline import DeadlineHandler, DeadlineRegistry, DeadlineBudgetExhausted
+from common.connection_manager import ConnectionManager, AsyncConnectionManager
+from common.server_factory import create_server, create_aio_server, get_server_max_workers
+from common.bulkhead import create_bulkhead_from_env
+from common.priority import PRIORITY_CRITICAL, get_request_priority, priority_metadata, parse_priority_shares
+from common.admission import create_backpressure_interceptor
+from common.shared_state import create_shared_state_store_from_env
+from common.cancellation import CancellationStats, DownstreamCancelled, call_cancellable
 
 class BffServicer(bff_pb2_grpc.BffServiceServicer):
     def __init__(self):
@@ -19,30 +26,80 @@ class BffServicer(bff_pb2_grpc.BffServiceServicer):
         # 환경 변수에서 설정 가져오기
         fail_threshold = int(os.environ.get("CIRCUIT_BREAKER_FAIL_THRESHOLD", "3"))
         reset_timeout = int(os.environ.get("CIRCUIT_BREAKER_RESET_TIMEOUT", "10"))
+        cb_window_type = os.environ.get("CIRCUIT_BREAKER_WINDOW_TYPE", "count")
+        cb_window_size = int(os.environ.get("CIRCUIT_BREAKER_WINDOW_SIZE", "20"))
+        cb_failure_rate = float(os.environ.get("CIRCUIT_BREAKER_FAILURE_RATE", "50"))
+        cb_minimum_calls = int(os.environ.get("CIRCUIT_BREAKER_MIN_CALLS", str(fail_threshold)))
+        cb_slow_call_threshold = float(os.environ.get("CIRCUIT_BREAKER_SLOW_CALL_THRESHOLD", "0"))
+        cb_slow_call_rate = float(os.environ.get("CIRCUIT_BREAKER_SLOW_CALL_RATE", "80"))
+        cb_half_open_permits = int(os.environ.get("CIRCUIT_BREAKER_HALF_OPEN_PERMITS", "2"))
+        cb_half_open_successes = int(os.environ.get("CIRCUIT_BREAKER_HALF_OPEN_SUCCESSES", "2"))
         backpressure_window = int(os.environ.get("BACKPRESSURE_WINDOW", "5"))
         backpressure_max_requests = int(os.environ.get("BACKPRESSURE_MAX_REQUESTS", "30"))
         backpressure_max_concurrency = int(os.environ.get("BACKPRESSURE_MAX_CONCURRENCY", "8"))
+        backpressure_strategy = os.environ.get("BACKPRESSURE_STRATEGY", "window")
+        backpressure_burst = int(os.environ.get("BACKPRESSURE_BURST", "0"))
+        concurrency_algorithm = os.environ.get("BACKPRESSURE_CONCURRENCY_LIMITER", "static")
+        min_concurrency = int(os.environ.get("BACKPRESSURE_MIN_CONCURRENCY", "1"))
+        max_concurrency_limit = int(os.environ.get("BACKPRESSURE_MAX_CONCURRENCY_LIMIT", "200"))
+        backpressure_queue_size = int(os.environ.get("BACKPRESSURE_QUEUE_SIZE", "0"))
+        backpressure_queue_target = float(os.environ.get("BACKPRESSURE_QUEUE_TARGET", "0.005"))
+        backpressure_queue_interval = float(os.environ.get("BACKPRESSURE_QUEUE_INTERVAL", "0.1"))
+        priority_shares = parse_priority_shares(os.environ.get("BACKPRESSURE_PRIORITY_SHARES", ""))
+        backpressure_shared_key = os.environ.get("BACKPRESSURE_SHARED_KEY", "bff")
         deadline_timeout = float(os.environ.get("DEADLINE_TIMEOUT", "0.5"))
+        deadline_safety_margin = float(os.environ.get("DEADLINE_SAFETY_MARGIN", "0.05"))
+        deadline_max_routes = int(os.environ.get("DEADLINE_MAX_ROUTES", "64"))
         
         # 에러 처리 패턴 초기화
         self.circuit_breaker = CircuitBreaker(
             fail_threshold=fail_threshold,
             reset_timeout=reset_timeout,
-            name="bff_to_backend"
+            name="bff_to_backend",
+            window_type=cb_window_type,
+            window_size=cb_window_size,
+            failure_rate_threshold=cb_failure_rate,
+            minimum_calls=cb_minimum_calls,
+            slow_call_threshold=cb_slow_call_threshold,
+            slow_call_rate_threshold=cb_slow_call_rate,
+            half_open_permits=cb_half_open_permits,
+            half_open_required_successes=cb_half_open_successes
         )
+        # 레플리카 간 공유 상태 저장소 (BACKPRESSURE_STRATEGY=shared_token_bucket 일 때 전체 예산 공유)
+        self.shared_state_store = create_shared_state_store_from_env("bff")
         self.backpressure = BackpressureController(
             window_size=backpressure_window,
             max_requests=backpressure_max_requests,
             max_concurrency=backpressure_max_concurrency,
-            name="bff"
+            name="bff",
+            strategy=backpressure_strategy,
+            burst=backpressure_burst,
+            concurrency_algorithm=concurrency_algorithm,
+            min_concurrency=min_concurrency,
+            max_concurrency_limit=max_concurrency_limit,
+            queue_size=backpressure_queue_size,
+            queue_target=backpressure_queue_target,
+            queue_interval=backpressure_queue_interval,
+            priority_shares=priority_shares,
+            shared_store=self.shared_state_store,
+            shared_key=backpressure_shared_key
+        )
+        # 서비스 공통 데드라인 (상위 호출 예산 확인, 로컬 데드라인 없는 하위 호출)
+        self.deadline_handler = DeadlineHandler(
+            timeout_seconds=deadline_timeout,
+            name="bff_to_backend",
+            safety_margin=deadline_safety_margin
         )
-        self.deadline_handler = AdaptiveDeadlineHandler(
+        # 경로(대상, 메서드, 요청 유형)별 적응형 데드라인
+        self.deadline_registry = DeadlineRegistry(
             initial_timeout=deadline_timeout,
-            name="bff_to_backend"
+            name="bff_to_backend",
+            max_routes=deadline_max_routes,
+            safety_margin=deadline_safety_margin
         )
         
-        # 서킷브레이커와 데드라인 핸들러 연동
-        self.deadline_handler.set_circuit_breaker(self.circuit_breaker)
+        # 서킷브레이커와 데드라인 레지스트리 연동
+        self.deadline_registry.set_circuit_breaker(self.circuit_breaker)
         
         # Backend 서비스 주소 매핑 (환경 변수에서 읽기)
         self.backend_addresses = {
@@ -53,23 +110,101 @@ class BffServicer(bff_pb2_grpc.BffServiceServicer):
             'all': os.environ.get('BACKEND_ALL_PATTERNS_ADDRESS', 'localhost:50056')
         }
         
+        # 백엔드 타입별 채널/스텁 관리 (주소당 하나의 멀티플렉싱 채널 유지)
+        self.backend_connections = self._create_backend_connections()
+        
+        # 서버 실행기 (serve 에서 설정, 큐 대기 시간 지표용)
+        self.server_executor = None
+        
+        # 디스패치 시점 백프레셔 인터셉터 (serve 에서 설정, 설정되면 핸들러는 백프레셔 등록/완료를 하지 않음)
+        self.backpressure_interceptor = None
+        
+        # 호출자가 떠나(취소/데드라인 만료) 처리 중에 중단한 요청 수
+        self.cancellation_stats = CancellationStats()
+        
+        # 벌크헤드 (BULKHEAD_ENABLED 일 때만 생성, slow/normal 요청 격리)
+        self.bulkhead = self._create_bulkhead()
+        
         self.logger.info(f"BFF 서비스 초기화 - 백엔드 주소: {self.backend_addresses}")
-        self.logger.info(f"BFF 서비스 초기화 - 백프레셔 설정: 창={backpressure_window}초, 최대요청={backpressure_max_requests}개, 최대동시={backpressure_max_concurrency}개")
-        self.logger.info(f"BFF 서비스 초기화 - 서킷브레이커 설정: 실패임계값={fail_threshold}, 초기화시간={reset_timeout}초")
-        self.logger.info(f"BFF 서비스 초기화 - 데드라인 설정: 초기타임아웃={deadline_timeout}초")
+        self.logger.info(f"BFF 서비스 초기화 - 백프레셔 설정: 창={backpressure_window}초, 최대요청={backpressure_max_requests}개, 최대동시={backpressure_max_concurrency}개, 전략={backpressure_strategy}, 버스트={backpressure_burst or '자동'}, 동시성제한={concurrency_algorithm}, 대기열={backpressure_queue_size}개")
+        self.logger.info(f"BFF 서비스 초기화 - 서킷브레이커 설정: 창={cb_window_type}/{cb_window_size}, 실패율임계값={cb_failure_rate}%, 최소호출={cb_minimum_calls}건, 느린호출={cb_slow_call_threshold}초/{cb_slow_call_rate}%, 시험요청={cb_half_open_permits}개/성공{cb_half_open_successes}건, 초기화시간={reset_timeout}초")
+        self.logger.info(f"BFF 서비스 초기화 - 데드라인 설정: 초기타임아웃={deadline_timeout}초, 안전여유={deadline_safety_margin}초")
+    
+    def _create_backend_connections(self):
+        """백엔드 연결 관리자 생성"""
+        return ConnectionManager(
+            addresses=self.backend_addresses,
+            stub_class=backend_pb2_grpc.BackendServiceStub,
+            initial_backoff=float(os.environ.get("BACKEND_RECONNECT_INITIAL_BACKOFF", "1.0")),
+            max_backoff=float(os.environ.get("BACKEND_RECONNECT_MAX_BACKOFF", "30.0")),
+            name="bff_to_backend"
+        )
+    
+    def _resolve_backend_type(self, backend_type):
+        """알 수 없는 백엔드 타입은 no_pattern 으로 처리"""
+        return backend_type if backend_type in self.backend_addresses else 'no_pattern'
+    
+    def _get_backend_stub(self, backend_type):
+        """백엔드 타입에 해당하는 스텁 반환 (알 수 없는 타입은 no_pattern 사용)"""
+        return self.backend_connections.get_stub(self._resolve_backend_type(backend_type))
+    
+    def _get_deadline_handler(self, backend_type, request_type):
+        """경로별 적응형 데드라인 - 클라이언트 값으로 경로가 무한히 늘지 않도록 알려진 백엔드 + slow/normal 로 정규화"""
+        route_type = "slow" if request_type == "slow" else "normal"
+        return self.deadline_registry.get(self._resolve_backend_type(backend_type), "Process", route_type)
+    
+    def _create_bulkhead(self):
+        """벌크헤드 생성 - 구획 슬롯 합계가 서버 워커 스레드 수를 넘지 않아야 함"""
+        return create_bulkhead_from_env("bff", max_workers=get_server_max_workers())
     
     def Process(self, request, context):
+        # 벌크헤드 모드: 요청 분류별 동시 처리 한도 적용 (핸들러 스레드에서 바로 처리)
+        if self.bulkhead is None:
+            return self._process(request, context)
+        
+        request_class = self.bulkhead.classify(request.request_type)
+        if not self.bulkhead.try_acquire(request_class):
+            return self._reject_bulkhead(request_class, context)
+        try:
+            return self._process(request, context)
+        finally:
+            self.bulkhead.release(request_class)
+    
+    def _reject_bulkhead(self, request_class, context):
+        """벌크헤드 구획 포화로 요청 거부"""
+        self.logger.warning(f"[BFF] 벌크헤드 패턴 발동 - {request_class} 구획 포화")
+        context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+        context.set_details(f"{request_class} 요청 처리 한도 초과입니다. 잠시 후 다시 시도해주세요.")
+        return bff_pb2.BffResponse(
+            success=False,
+            error_message=f"벌크헤드 포화 ({request_class})"
+        )
+    
+    def _reject_deadline_budget(self, budget_error, context):
+        """상위 호출의 데드라인 예산 소진으로 요청 거부"""
+        context.set_code(grpc.StatusCode.DEADLINE_EXCEEDED)
+        context.set_details(budget_error.details())
+        return bff_pb2.BffResponse(
+            success=False,
+            error_message="데드라인 예산 소진"
+        )
+    
+    def _process(self, request, context):
         backend_type = request.backend_type if request.backend_type else 'no_pattern'
         
-        self.logger.info(f"[BFF] 요청 받음: {request.request_type}, 백엔드 타입: {backend_type}")
+        priority = get_request_priority(context, request.request_type)
+        # 인터셉터가 디스패치 시점에 백프레셔를 적용했으면 핸들러에서는 등록/완료하지 않음
+        manage_backpressure = request.use_backpressure and self.backpressure_interceptor is None
+        
+        self.logger.info(f"[BFF] 요청 받음: {request.request_type}, 백엔드 타입: {backend_type}, 우선순위: {priority}")
         self.logger.info(f"[BFF] 패턴 설정 - 서킷브레이커: {request.use_circuit_breaker}, " +
                         f"데드라인: {request.use_deadline}, 백프레셔: {request.use_backpressure}")
         
         # 백프레셔 패턴 적용
-        if request.use_backpressure:
-            if not self.backpressure.register_request():
+        if manage_backpressure:
+            if not self.backpressure.register_request(priority):
                 # 과부하 상태로 요청 거부
-                self.logger.warning(f"[BFF] 백프레셔 패턴 발동 - 과부하 상태")
+                self.logger.warning(f"[BFF] 백프레셔 패턴 발동 - 과부하 상태 (우선순위: {priority})")
                 context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
                 context.set_details("서버 과부하 상태입니다. 잠시 후 다시 시도해주세요.")
                 return bff_pb2.BffResponse(
@@ -77,22 +212,32 @@ class BffServicer(bff_pb2_grpc.BffServiceServicer):
                     error_message="서버 과부하 상태"
                 )
         
+        backpressure_start_time = time.time()   # 적응형 동시성 표본 (등록 ~ 완료 시간)
+        
         try:
             # 백엔드 주소 선택
             backend_address = self.backend_addresses.get(backend_type, self.backend_addresses['no_pattern'])
             self.logger.info(f"[BFF] 연결할 백엔드 서비스: {backend_address}")
             
-            backend_channel = grpc.insecure_channel(backend_address)
-            backend_stub = backend_pb2_grpc.BackendServiceStub(backend_channel)
+            backend_stub = self._get_backend_stub(backend_type)
+            
+            # 상위 호출이 이미 포기했을 요청이면 백엔드를 호출하지 않고 바로 실패
+            budget_error = self.deadline_handler.check_budget(context)
+            if budget_error is not None:
+                if manage_backpressure:
+                    self.backpressure.complete_request()
+                return self._reject_deadline_budget(budget_error, context)
             
             # 서킷 브레이커 패턴 적용
+            circuit_permit = None   # HALF_OPEN 이면 시험 요청 허가 - 결과 보고 시 그대로 넘김
             if request.use_circuit_breaker:
                 self.logger.info("[BFF] 서킷브레이커 상태 확인 중...")
-                if not self.circuit_breaker.allow_request():
+                circuit_permit = self.circuit_breaker.allow_request()
+                if not circuit_permit:
                     self.logger.warning("[BFF] 서킷브레이커 오픈 상태 - 요청 차단됨")
                     context.set_code(grpc.StatusCode.UNAVAILABLE)
                     context.set_details("서비스 일시적으로 사용 불가")
-                    if request.use_backpressure:
+                    if manage_backpressure:
                         self.backpressure.complete_request()
                     return bff_pb2.BffResponse(
                         success=False,
@@ -103,33 +248,38 @@ class BffServicer(bff_pb2_grpc.BffServiceServicer):
             try:
                 # 데드라인 패턴 적용
                 if request.use_deadline:
-                    self.logger.info(f"[BFF] 데드라인 패턴 사용 ({self.deadline_handler.get_timeout()}초)")
+                    deadline_handler = self._get_deadline_handler(backend_type, request.request_type)
+                    self.logger.info(f"[BFF] 데드라인 패턴 사용 ({deadline_handler.get_timeout():.3f}초)")
                     # call_with_deadline_and_record 메소드 사용으로 변경
-                    response, error = self.deadline_handler.call_with_deadline_and_record(
+                    response, error = deadline_handler.call_with_deadline_and_record(
                         backend_stub.Process,
                         backend_pb2.BackendRequest(
                             request_type=request.request_type,
                             use_deadline=request.use_deadline,
                             use_circuit_breaker=request.use_circuit_breaker,
                             use_backpressure=request.use_backpressure
-                        )
+                        ),
+                        context,
+                        metadata=priority_metadata(priority)
                     )
                     
                     if error:
-                        if request.use_circuit_breaker:
-                            self.circuit_breaker.report_failure()
                         raise error
                 else:
-                    self.logger.info("[BFF] Backend 서비스 호출 (데드라인 없음)")
+                    self.logger.info("[BFF] Backend 서비스 호출 (로컬 데드라인 없음, 상위 호출 남은 시간만 적용)")
                     # 실행 시간 측정
                     start_time = time.time()
-                    response = backend_stub.Process(
+                    response = call_cancellable(
+                        backend_stub.Process,
                         backend_pb2.BackendRequest(
                             request_type=request.request_type,
                             use_deadline=request.use_deadline,
                             use_circuit_breaker=request.use_circuit_breaker,
                             use_backpressure=request.use_backpressure
-                        )
+                        ),
+                        context,
+                        timeout=self.deadline_handler.outbound_timeout(context, use_local_timeout=False),
+                        metadata=priority_metadata(priority)
                     )
                     execution_time = time.time() - start_time
                     
@@ -139,11 +289,11 @@ class BffServicer(bff_pb2_grpc.BffServiceServicer):
                 
                 # 성공 처리
                 if request.use_circuit_breaker:
-                    self.circuit_breaker.report_success()
+                    self.circuit_breaker.report_success(circuit_permit)
                 
                 self.logger.info(f"[BFF] Backend 응답 수신: {response.result}")
-                if request.use_backpressure:
-                    self.backpressure.complete_request()
+                if manage_backpressure:
+                    self.backpressure.complete_request(rtt=time.time() - backpressure_start_time)
                 
                 return bff_pb2.BffResponse(
                     result="처리 완료: " + (response.result if response.result else ""),
@@ -151,9 +301,34 @@ class BffServicer(bff_pb2_grpc.BffServiceServicer):
                     error_message=response.error_message
                 )
             
+            except DownstreamCancelled as e:
+                # 호출자가 떠나 백엔드 호출을 취소함 (백엔드 장애가 아니므로 서킷브레이커에 기록하지 않고 허가만 반환)
+                if request.use_circuit_breaker:
+                    self.circuit_breaker.release_permit(circuit_permit)
+                cancelled_count = self.cancellation_stats.record()
+                self.logger.warning(f"[BFF] 호출자 취소로 Backend 호출 중단 (누적 {cancelled_count}건)")
+                context.set_code(grpc.StatusCode.CANCELLED)
+                context.set_details(e.details())
+                
+                if manage_backpressure:
+                    self.backpressure.complete_request()
+                
+                return bff_pb2.BffResponse(
+                    success=False,
+                    error_message="호출자 취소"
+                )
+            
+            except DeadlineBudgetExhausted as e:
+                # 호출 직전에 상위 예산이 소진됨 - 백엔드를 호출하지 않았으므로 실패로 기록하지 않고 허가만 반환
+                if request.use_circuit_breaker:
+                    self.circuit_breaker.release_permit(circuit_permit)
+                if manage_backpressure:
+                    self.backpressure.complete_request()
+                return self._reject_deadline_budget(e, context)
+            
             except grpc.RpcError as e:
                 if request.use_circuit_breaker:
-                    self.circuit_breaker.report_failure()
+                    self.circuit_breaker.report_failure(circuit_permit)
                 
                 status_code = e.code()
                 details = e.details()
@@ -167,8 +342,8 @@ class BffServicer(bff_pb2_grpc.BffServiceServicer):
                     context.set_code(status_code)
                     context.set_details(f"Backend 서비스 오류: {details}")
                 
-                if request.use_backpressure:
-                    self.backpressure.complete_request()
+                if manage_backpressure:
+                    self.backpressure.complete_request(dropped=True)
                     
                 return bff_pb2.BffResponse(
                     success=False,
@@ -180,7 +355,7 @@ class BffServicer(bff_pb2_grpc.BffServiceServicer):
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(f"내부 서버 오류: {str(e)}")
             
-            if request.use_backpressure:
+            if manage_backpressure:
                 self.backpressure.complete_request()
                 
             return bff_pb2.BffResponse(
@@ -207,12 +382,14 @@ class BffServicer(bff_pb2_grpc.BffServiceServicer):
             # 백엔드 서비스 패턴 리셋 (선택적)
             if backend_type != 'none':
                 try:
-                    backend_address = self.backend_addresses.get(backend_type, self.backend_addresses['no_pattern'])
-                    backend_channel = grpc.insecure_channel(backend_address)
-                    backend_stub = backend_pb2_grpc.BackendServiceStub(backend_channel)
+                    backend_stub = self._get_backend_stub(backend_type)
                     
                     reset_request = backend_pb2.ResetRequest(pattern=pattern)
-                    backend_stub.ResetPattern(reset_request)
+                    backend_stub.ResetPattern(
+                        reset_request,
+                        timeout=self.deadline_handler.outbound_timeout(context, use_local_timeout=False),
+                        metadata=priority_metadata(PRIORITY_CRITICAL)
+                    )
                     self.logger.info(f"[BFF] 백엔드({backend_type}) 패턴 리셋 요청 완료")
                 except Exception as e:
                     self.logger.error(f"[BFF] 백엔드 패턴 리셋 중 오류: {str(e)}")
@@ -230,6 +407,57 @@ class BffServicer(bff_pb2_grpc.BffServiceServicer):
                 message=f"리셋 실패: {str(e)}"
             )
     
+    def _collect_metrics(self):
+        """GetStatus 로 내보낼 BFF 부가 지표 수집"""
+        metrics = {}
+        
+        # 백엔드 타입별 채널 상태
+        for key, health in self.backend_connections.get_health().items():
+            for name, value in health.items():
+                metrics[f"channel.{key}.{name}"] = str(value)
+        
+        # 서킷브레이커 실패율 창
+        for key, value in self.circuit_breaker.get_stats().items():
+            metrics[f"circuit_breaker.{key}"] = str(value)
+        
+        # 하위 호출 실행 시간 분포 (1m/5m/1h 창별 p50/p95/p99)
+        for key, value in self.circuit_breaker.get_latency_stats().items():
+            metrics[f"latency.{key}"] = str(value)
+        
+        # 데드라인 (기본 타임아웃, 예산 소진으로 생략한 백엔드 호출 수)
+        for key, value in self.deadline_handler.get_stats().items():
+            metrics[f"deadline.{key}"] = str(value)
+        
+        # 경로별 적응형 데드라인 (활성 경로의 현재 타임아웃)
+        for key, value in self.deadline_registry.get_stats().items():
+            metrics[f"deadline.{key}"] = str(value)
+        
+        # 백프레셔 요청률 제한 전략 상태
+        for key, value in self.backpressure.get_stats().items():
+            metrics[f"backpressure.{key}"] = str(value)
+        
+        # 서버 실행기 큐 대기 시간
+        if self.server_executor is not None:
+            for key, value in self.server_executor.get_stats().items():
+                metrics[f"server.{key}"] = str(value)
+        
+        # 호출자 취소로 중단한 진행 중 요청
+        for key, value in self.cancellation_stats.get_stats().items():
+            metrics[f"cancellation.{key}"] = str(value)
+        
+        # 벌크헤드 구획별 상태
+        if self.bulkhead is not None:
+            for request_class, stats in self.bulkhead.get_stats().items():
+                for key, value in stats.items():
+                    metrics[f"bulkhead.{request_class}.{key}"] = str(value)
+        
+        # 디스패치 시점 어드미션 (임대 슬롯 반환/회수)
+        if self.backpressure_interceptor is not None:
+            for key, value in self.backpressure_interceptor.get_stats().items():
+                metrics[f"admission.{key}"] = str(value)
+        
+        return metrics
+    
     def GetStatus(self, request, context):
         backend_type = request.backend_type if request.backend_type else 'no_pattern'
         self.logger.info(f"[BFF] 상태 확인 요청: 백엔드={backend_type}")
@@ -249,14 +477,19 @@ class BffServicer(bff_pb2_grpc.BffServiceServicer):
                 "backpressure_overloaded": False
             }
             
+            # BFF 부가 지표 (채널 상태, 실행기, 벌크헤드)
+            metrics = self._collect_metrics()
+            
             if backend_type != 'none':
                 try:
-                    backend_address = self.backend_addresses.get(backend_type, self.backend_addresses['no_pattern'])
-                    backend_channel = grpc.insecure_channel(backend_address)
-                    backend_stub = backend_pb2_grpc.BackendServiceStub(backend_channel)
+                    backend_stub = self._get_backend_stub(backend_type)
                     
                     status_request = backend_pb2.StatusRequest()
-                    response = backend_stub.GetStatus(status_request)
+                    response = backend_stub.GetStatus(
+                        status_request,
+                        timeout=self.deadline_handler.outbound_timeout(context, use_local_timeout=False),
+                        metadata=priority_metadata(PRIORITY_CRITICAL)
+                    )
                     
                     backend_status = {
                         "circuit_breaker_state": response.circuit_breaker_state,
@@ -264,15 +497,17 @@ class BffServicer(bff_pb2_grpc.BffServiceServicer):
                         "backpressure_active_requests": response.backpressure_active_requests,
                         "backpressure_overloaded": response.backpressure_overloaded
                     }
+                    for key, value in response.metrics.items():
+                        metrics[f"backend.{key}"] = value
                     
                     self.logger.info(f"[BFF] 백엔드({backend_type}) 상태 조회 완료")
                 except Exception as e:
                     self.logger.error(f"[BFF] 백엔드 상태 조회 중 오류: {str(e)}")
             
             # 추가: 서킷브레이커 최근 실행 시간 통계
-            recent_exec_times = self.circuit_breaker.get_recent_execution_times(3600)  # 최근 1시간
-            avg_exec_time = sum(recent_exec_times) / len(recent_exec_times) if recent_exec_times else 0
-            p95_exec_time = self.circuit_breaker.calculate_percentile_execution_time(95) if recent_exec_times else 0
+            recent_exec_times = self.circuit_breaker.get_execution_time_snapshot(3600)  # 최근 1시간
+            avg_exec_time = recent_exec_times.mean()
+            p95_exec_time = recent_exec_times.percentile(95) or 0
             
             self.logger.info(f"[BFF] 서킷브레이커 실행 시간 통계 - 평균: {avg_exec_time:.3f}초, P95: {p95_exec_time:.3f}초")
             
@@ -282,7 +517,8 @@ class BffServicer(bff_pb2_grpc.BffServiceServicer):
                 backpressure_active_requests=backpressure_active,
                 backpressure_overloaded=backpressure_overloaded,
                 success=True,
-                error_message=""
+                error_message="",
+                metrics=metrics
             )
         except Exception as e:
             self.logger.exception("[BFF] 상태 조회 중 오류")
@@ -291,10 +527,276 @@ class BffServicer(bff_pb2_grpc.BffServiceServicer):
                 error_message=f"상태 조회 실패: {str(e)}"
             )
 
+class AsyncBffServicer(BffServicer):
+    """grpc.aio 기반 BFF 구현 - 백엔드 호출 대기 중 스레드를 점유하지 않음
+
+    서킷브레이커/백프레셔 판단은 짧은 락만 잡고 블로킹하지 않으므로 이벤트 루프에서 그대로 사용하고,
+    백엔드 호출만 데드라인 핸들러의 비동기 메서드로 await 한다.
+    """
+    
+    def _create_backend_connections(self):
+        """aio 백엔드 연결 관리자 생성 (이벤트 루프 안에서 호출되어야 함)"""
+        return AsyncConnectionManager(
+            addresses=self.backend_addresses,
+            stub_class=backend_pb2_grpc.BackendServiceStub,
+            name="bff_to_backend_aio"
+        )
+    
+    def _create_bulkhead(self):
+        """벌크헤드 생성 (aio 서버는 워커 스레드를 점유하지 않으므로 구획 합계 제한 없음)"""
+        return create_bulkhead_from_env("bff")
+    
+    async def Process(self, request, context):
+        # 벌크헤드 모드: 요청 분류별 동시 처리 한도 적용
+        if self.bulkhead is None:
+            return await self._process(request, context)
+        
+        request_class = self.bulkhead.classify(request.request_type)
+        if not self.bulkhead.try_acquire(request_class):
+            return self._reject_bulkhead(request_class, context)
+        try:
+            return await self._process(request, context)
+        finally:
+            self.bulkhead.release(request_class)
+    
+    async def _process(self, request, context):
+        backend_type = request.backend_type if request.backend_type else 'no_pattern'
+        
+        priority = get_request_priority(context, request.request_type)
+        # 인터셉터가 디스패치 시점에 백프레셔를 적용했으면 핸들러에서는 등록/완료하지 않음
+        manage_backpressure = request.use_backpressure and self.backpressure_interceptor is None
+        
+        self.logger.info(f"[BFF-aio] 요청 받음: {request.request_type}, 백엔드 타입: {backend_type}, 우선순위: {priority}")
+        self.logger.info(f"[BFF-aio] 패턴 설정 - 서킷브레이커: {request.use_circuit_breaker}, " +
+                        f"데드라인: {request.use_deadline}, 백프레셔: {request.use_backpressure}")
+        
+        # 백프레셔 패턴 적용
+        if manage_backpressure:
+            if not await self.backpressure.register_request_async(priority):
+                self.logger.warning(f"[BFF-aio] 백프레셔 패턴 발동 - 과부하 상태 (우선순위: {priority})")
+                context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+                context.set_details("서버 과부하 상태입니다. 잠시 후 다시 시도해주세요.")
+                return bff_pb2.BffResponse(
+                    success=False,
+                    error_message="서버 과부하 상태"
+                )
+        
+        # 적응형 동시성 표본 (등록 ~ 완료 시간, 하위 호출 실패는 드롭) - finally 에서 슬롯과 함께 반환
+        backpressure_start_time = time.time()
+        backpressure_rtt = None
+        backpressure_dropped = False
+        
+        try:
+            backend_stub = self._get_backend_stub(backend_type)
+            
+            # 상위 호출이 이미 포기했을 요청이면 백엔드를 호출하지 않고 바로 실패
+            budget_error = self.deadline_handler.check_budget(context)
+            if budget_error is not None:
+                return self._reject_deadline_budget(budget_error, context)
+            
+            # 서킷 브레이커 패턴 적용
+            circuit_permit = None   # HALF_OPEN 이면 시험 요청 허가 - 결과 보고 시 그대로 넘김
+            if request.use_circuit_breaker:
+                circuit_permit = self.circuit_breaker.allow_request()
+                if not circuit_permit:
+                    self.logger.warning("[BFF-aio] 서킷브레이커 오픈 상태 - 요청 차단됨")
+                    context.set_code(grpc.StatusCode.UNAVAILABLE)
+                    context.set_details("서비스 일시적으로 사용 불가")
+                    return bff_pb2.BffResponse(
+                        success=False,
+                        error_message="서킷브레이커가 오픈 상태입니다"
+                    )
+            
+            backend_request = backend_pb2.BackendRequest(
+                request_type=request.request_type,
+                use_deadline=request.use_deadline,
+                use_circuit_breaker=request.use_circuit_breaker,
+                use_backpressure=request.use_backpressure
+            )
+            
+            # Backend 서비스 호출
+            try:
+                if request.use_deadline:
+                    deadline_handler = self._get_deadline_handler(backend_type, request.request_type)
+                    self.logger.info(f"[BFF-aio] 데드라인 패턴 사용 ({deadline_handler.get_timeout():.3f}초)")
+                    response, error = await deadline_handler.call_with_deadline_and_record_async(
+                        backend_stub.Process,
+                        backend_request,
+                        context,
+                        metadata=priority_metadata(priority)
+                    )
+                    
+                    if error:
+                        raise error
+                else:
+                    self.logger.info("[BFF-aio] Backend 서비스 호출 (로컬 데드라인 없음, 상위 호출 남은 시간만 적용)")
+                    start_time = time.time()
+                    response = await backend_stub.Process(
+                        backend_request,
+                        timeout=self.deadline_handler.outbound_timeout(context, use_local_timeout=False),
+                        metadata=priority_metadata(priority)
+                    )
+                    execution_time = time.time() - start_time
+                    
+                    if request.use_circuit_breaker:
+                        self.circuit_breaker.record_execution_time(execution_time)
+                
+                # 성공 처리
+                if request.use_circuit_breaker:
+                    self.circuit_breaker.report_success(circuit_permit)
+                
+                self.logger.info(f"[BFF-aio] Backend 응답 수신: {response.result}")
+                backpressure_rtt = time.time() - backpressure_start_time
+                return bff_pb2.BffResponse(
+                    result="처리 완료: " + (response.result if response.result else ""),
+                    success=response.success,
+                    error_message=response.error_message
+                )
+            
+            except asyncio.CancelledError:
+                # 호출자 취소는 백엔드 장애가 아니므로 서킷브레이커에 기록하지 않고 허가만 반환
+                if request.use_circuit_breaker:
+                    self.circuit_breaker.release_permit(circuit_permit)
+                raise
+            
+            except DeadlineBudgetExhausted as e:
+                # 호출 직전에 상위 예산이 소진됨 - 백엔드를 호출하지 않았으므로 실패로 기록하지 않고 허가만 반환
+                if request.use_circuit_breaker:
+                    self.circuit_breaker.release_permit(circuit_permit)
+                return self._reject_deadline_budget(e, context)
+            
+            except grpc.RpcError as e:
+                if request.use_circuit_breaker:
+                    self.circuit_breaker.report_failure(circuit_permit)
+                backpressure_dropped = True
+                
+                status_code = e.code()
+                details = e.details()
+                
+                self.logger.error(f"[BFF-aio] Backend 호출 중 오류: {status_code} - {details}")
+                
+                if status_code == grpc.StatusCode.DEADLINE_EXCEEDED:
+                    context.set_code(grpc.StatusCode.DEADLINE_EXCEEDED)
+                    context.set_details("Backend 서비스 응답 시간 초과")
+                else:
+                    context.set_code(status_code)
+                    context.set_details(f"Backend 서비스 오류: {details}")
+                
+                return bff_pb2.BffResponse(
+                    success=False,
+                    error_message=f"Backend 호출 오류: {details}"
+                )
+        
+        except asyncio.CancelledError:
+            # 호출자가 떠나 핸들러가 취소됨 - 대기 중이던 백엔드 호출도 함께 취소되어 하위로 전파됨
+            cancelled_count = self.cancellation_stats.record()
+            self.logger.warning(f"[BFF-aio] 호출자 취소로 처리 중단 (누적 {cancelled_count}건)")
+            raise
+        
+        except Exception as e:
+            self.logger.exception("[BFF-aio] 예기치 않은 오류")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"내부 서버 오류: {str(e)}")
+            return bff_pb2.BffResponse(
+                success=False,
+                error_message=f"내부 서버 오류: {str(e)}"
+            )
+        
+        finally:
+            # 모든 종료 경로(취소 포함)에서 백프레셔 슬롯 반환
+            if manage_backpressure:
+                self.backpressure.complete_request(rtt=backpressure_rtt, dropped=backpressure_dropped)
+    
+    async def ResetPattern(self, request, context):
+        pattern = request.pattern
+        backend_type = request.backend_type if request.backend_type else 'no_pattern'
+        
+        self.logger.info(f"[BFF-aio] 패턴 리셋 요청: {pattern}, 백엔드: {backend_type}")
+        
+        try:
+            if pattern == "circuit_breaker" or pattern == "all":
+                self.circuit_breaker.reset()
+                
+            if pattern == "backpressure" or pattern == "all":
+                self.backpressure.reset()
+            
+            if backend_type != 'none':
+                try:
+                    backend_stub = self._get_backend_stub(backend_type)
+                    await backend_stub.ResetPattern(
+                        backend_pb2.ResetRequest(pattern=pattern),
+                        timeout=self.deadline_handler.outbound_timeout(context, use_local_timeout=False),
+                        metadata=priority_metadata(PRIORITY_CRITICAL)
+                    )
+                    self.logger.info(f"[BFF-aio] 백엔드({backend_type}) 패턴 리셋 요청 완료")
+                except Exception as e:
+                    self.logger.error(f"[BFF-aio] 백엔드 패턴 리셋 중 오류: {str(e)}")
+            
+            return bff_pb2.ResetResponse(
+                success=True,
+                message=f"{pattern} 패턴 리셋 완료"
+            )
+        except Exception as e:
+            self.logger.exception("[BFF-aio] 패턴 리셋 중 오류")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"패턴 리셋 실패: {str(e)}")
+            return bff_pb2.ResetResponse(
+                success=False,
+                message=f"리셋 실패: {str(e)}"
+            )
+    
+    async def GetStatus(self, request, context):
+        backend_type = request.backend_type if request.backend_type else 'no_pattern'
+        self.logger.info(f"[BFF-aio] 상태 확인 요청: 백엔드={backend_type}")
+        
+        try:
+            metrics = self._collect_metrics()
+            
+            if backend_type != 'none':
+                try:
+                    backend_stub = self._get_backend_stub(backend_type)
+                    response = await backend_stub.GetStatus(
+                        backend_pb2.StatusRequest(),
+                        timeout=self.deadline_handler.outbound_timeout(context, use_local_timeout=False),
+                        metadata=priority_metadata(PRIORITY_CRITICAL)
+                    )
+                    for key, value in response.metrics.items():
+                        metrics[f"backend.{key}"] = value
+                except Exception as e:
+                    self.logger.error(f"[BFF-aio] 백엔드 상태 조회 중 오류: {str(e)}")
+            
+            return bff_pb2.StatusResponse(
+                circuit_breaker_state=self.circuit_breaker.state,
+                circuit_breaker_failures=self.circuit_breaker.failure_count,
+                backpressure_active_requests=self.backpressure.active_requests,
+                backpressure_overloaded=self.backpressure.is_overloaded(),
+                success=True,
+                error_message="",
+                metrics=metrics
+            )
+        except Exception as e:
+            self.logger.exception("[BFF-aio] 상태 조회 중 오류")
+            return bff_pb2.StatusResponse(
+                success=False,
+                error_message=f"상태 조회 실패: {str(e)}"
+            )
+
 def serve():
+    # BFF_SERVER_MODE=aio 이면 grpc.aio 서버로 실행
+    if os.environ.get("BFF_SERVER_MODE", "thread").lower() == "aio":
+        asyncio.run(serve_aio())
+        return
+    
     logger = setup_logging("bff_server")
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    bff_pb2_grpc.add_BffServiceServicer_to_server(BffServicer(), server)
+    servicer = BffServicer()
+    
+    # BACKPRESSURE_ADMISSION=interceptor 이면 Process 호출 전체에 디스패치 시점 백프레셔 적용
+    servicer.backpressure_interceptor = create_backpressure_interceptor(servicer.backpressure, "bff")
+    interceptors = [servicer.backpressure_interceptor] if servicer.backpressure_interceptor is not None else None
+    
+    server, executor = create_server("bff", interceptors=interceptors)
+    servicer.server_executor = executor
+    bff_pb2_grpc.add_BffServiceServicer_to_server(servicer, server)
     
     port = int(os.environ.get("PORT", "50051"))  # 환경 변수에서 포트 읽기
     server.add_insecure_port(f"[::]:{port}")
@@ -306,6 +808,30 @@ def serve():
     except KeyboardInterrupt:
         logger.info("BFF 서비스 종료 중...")
         server.stop(0)
+        servicer.backend_connections.close()
+
+async def serve_aio():
+    logger = setup_logging("bff_server")
+    servicer = AsyncBffServicer()
+    
+    # BACKPRESSURE_ADMISSION=interceptor 이면 Process 호출 전체에 디스패치 시점 백프레셔 적용
+    servicer.backpressure_interceptor = create_backpressure_interceptor(servicer.backpressure, "bff", use_aio=True)
+    interceptors = [servicer.backpressure_interceptor] if servicer.backpressure_interceptor is not None else None
+    
+    server = create_aio_server("bff", interceptors=interceptors)
+    bff_pb2_grpc.add_BffServiceServicer_to_server(servicer, server)
+    
+    port = int(os.environ.get("PORT", "50051"))
+    server.add_insecure_port(f"[::]:{port}")
+    await server.start()
+    logger.info(f"BFF 서비스 시작됨 (aio 모드): 포트 {port}")
+    
+    try:
+        await server.wait_for_termination()
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        logger.info("BFF 서비스 종료 중...")
+        await server.stop(0)
+        await servicer.backend_connections.close()
 
 if __name__ == "__main__":
     serve()
\ No newline at end of file
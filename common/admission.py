@@ -0,0 +1,241 @@
+import os
+import time
+import asyncio
+import itertools
+import threading
+import logging
+
+import grpc
+
+from common.priority import PRIORITY_NORMAL, priority_from_metadata
+
+OVERLOADED_DETAILS = "서버 과부하 상태입니다. 잠시 후 다시 시도해주세요."
+
+def _status_code(code):
+    """context.code() 값을 grpc.StatusCode 로 변환 (grpc.aio 는 정수 코드를 반환)"""
+    if isinstance(code, int):
+        return next((status for status in grpc.StatusCode if status.value[0] == code), grpc.StatusCode.UNKNOWN)
+    return code
+
+class AdmissionLease:
+    """백프레셔 슬롯 임대 - release 를 여러 번 호출해도 complete_request 는 한 번만 실행됨"""
+
+    def __init__(self, tracker, lease_id, method, priority):
+        self.tracker = tracker
+        self.lease_id = lease_id
+        self.method = method
+        self.priority = priority
+        self.acquired_time = time.time()
+        self.released = False
+
+    def release(self, *args):
+        """슬롯 반환 (context.add_callback 등에서 인자 없이/있이 호출 가능)"""
+        self.tracker._release(self, reaped=False)
+
+    def complete(self, code, failed=False):
+        """핸들러 종료 시 슬롯 반환 - 결과로 적응형 동시성 표본 보고 (성공은 임대 시간, 호출자 취소 외의 오류는 드롭)"""
+        code = _status_code(code)
+        if code == grpc.StatusCode.CANCELLED:
+            self.tracker._release(self, reaped=False)
+        elif failed or code not in (None, grpc.StatusCode.OK):
+            self.tracker._release(self, reaped=False, dropped=True)
+        else:
+            self.tracker._release(self, reaped=False, rtt=time.time() - self.acquired_time)
+
+class _AdmissionTracker:
+    """디스패치 시점 백프레셔 적용과 임대 슬롯 추적 (스레드/aio 인터셉터 공통)"""
+
+    def __init__(self, backpressure, methods=("Process",), lease_timeout=60.0, name="default"):
+        self.backpressure = backpressure
+        self.methods = set(methods)
+        self.lease_timeout = lease_timeout   # 이 시간이 지나도 반환되지 않은 슬롯은 회수
+        self.name = name
+        self.lock = threading.Lock()
+        self.logger = logging.getLogger(f"admission.{name}")
+
+        self.leases = {}   # lease_id -> AdmissionLease (획득 순서 유지)
+        self._lease_ids = itertools.count(1)
+
+        # 통계
+        self.admitted_count = 0
+        self.rejected_count = 0
+        self.deferred_count = 0   # 대기열 대기를 위해 워커로 넘긴 요청
+        self.released_count = 0
+        self.reaped_count = 0
+
+        self.logger.warning(f"[어드미션-{self.name}] 초기화 - 대상 메서드: {', '.join(sorted(self.methods))}, 임대 만료: {lease_timeout}초")
+
+    def _is_guarded(self, method):
+        """백프레셔를 적용할 메서드인지 확인 (/패키지.서비스/메서드)"""
+        return method.rsplit("/", 1)[-1] in self.methods
+
+    def _priority(self, handler_call_details):
+        """메타데이터의 우선순위 - 없으면 normal
+
+        디스패치 시점에는 요청 본문을 역직렬화하지 않으므로 handler 모드처럼 request_type(slow/batch)으로 low 를 정하지 못한다.
+        하위 서비스 호출에는 BFF 가 우선순위 메타데이터를 붙이므로, 메타데이터 없이 들어오는 외부 호출에서만 차이가 난다.
+        """
+        return priority_from_metadata(handler_call_details.invocation_metadata) or PRIORITY_NORMAL
+
+    def _acquire_lease(self, method, priority):
+        """등록된 요청의 슬롯 임대 기록"""
+        with self.lock:
+            lease = AdmissionLease(self, next(self._lease_ids), method, priority)
+            self.leases[lease.lease_id] = lease
+            self.admitted_count += 1
+            return lease
+
+    def _release(self, lease, reaped, rtt=None, dropped=False):
+        """임대 슬롯 반환 - 이미 반환된 임대는 무시"""
+        with self.lock:
+            if lease.released:
+                return
+            lease.released = True
+            self.leases.pop(lease.lease_id, None)
+            if reaped:
+                self.reaped_count += 1
+            else:
+                self.released_count += 1
+
+        if reaped:
+            held = time.time() - lease.acquired_time
+            self.logger.error(f"[어드미션-{self.name}] 반환되지 않은 슬롯 회수: {lease.method} (우선순위 {lease.priority}, {held:.1f}초 경과)")
+        self.backpressure.complete_request(rtt=rtt, dropped=dropped)
+
+    def reap_expired_leases(self):
+        """lease_timeout 이 지나도록 반환되지 않은 슬롯 회수 (핸들러가 실행되지 못하고 끝난 호출 등)"""
+        if self.lease_timeout <= 0:
+            return
+        cutoff = time.time() - self.lease_timeout
+        with self.lock:
+            expired = []
+            for lease in self.leases.values():
+                if lease.acquired_time >= cutoff:
+                    break
+                expired.append(lease)
+        for lease in expired:
+            self._release(lease, reaped=True)
+
+    def _record_rejection(self, method, priority):
+        with self.lock:
+            self.rejected_count += 1
+        self.logger.warning(f"[어드미션-{self.name}] 디스패치 시점 거부: {method} (우선순위 {priority})")
+
+    def get_stats(self):
+        """어드미션 통계 반환"""
+        with self.lock:
+            return {
+                "active_leases": len(self.leases),
+                "admitted": self.admitted_count,
+                "rejected": self.rejected_count,
+                "deferred": self.deferred_count,
+                "released": self.released_count,
+                "reaped": self.reaped_count,
+            }
+
+class BackpressureInterceptor(_AdmissionTracker, grpc.ServerInterceptor):
+    """스레드풀 서버용 - 핸들러 디스패치 전에 백프레셔로 요청을 받거나 거부하는 인터셉터
+
+    거부된 요청은 역직렬화 없이 바로 RESOURCE_EXHAUSTED 로 끝난다.
+    등록된 요청은 핸들러 종료, 클라이언트 취소(context.add_callback), 임대 만료 회수 중 먼저 오는 시점에 한 번만 슬롯을 반환한다.
+    대기열이 설정되어 있어 기다려야 하는 요청과 공유 제한기(shared_token_bucket)로 저장소 왕복이 필요한 요청은
+    서버 폴링 스레드를 막지 않도록 워커 스레드에서 등록한다.
+    """
+
+    def intercept_service(self, continuation, handler_call_details):
+        method = handler_call_details.method
+        handler = continuation(handler_call_details)
+        if not self._is_guarded(method) or handler is None or handler.unary_unary is None:
+            return handler
+
+        self.reap_expired_leases()
+        priority = self._priority(handler_call_details)
+        admitted = self.backpressure.try_register_request(priority)
+        if admitted is False:
+            self._record_rejection(method, priority)
+            return grpc.unary_unary_rpc_method_handler(
+                self._reject,
+                response_serializer=handler.response_serializer
+            )
+
+        lease = self._acquire_lease(method, priority) if admitted else None
+        if lease is None:
+            with self.lock:
+                self.deferred_count += 1
+        return handler._replace(unary_unary=self._wrap(handler.unary_unary, method, priority, lease))
+
+    def _wrap(self, behavior, method, priority, lease):
+        """핸들러를 감싸 모든 종료 경로에서 슬롯 반환"""
+        def wrapped(request, context):
+            current_lease = lease
+            if current_lease is None:
+                # 대기열에서 슬롯을 기다린 뒤 등록 (워커 스레드에서 블로킹)
+                if not self.backpressure.register_request(priority):
+                    self._record_rejection(method, priority)
+                    self._reject(request, context)
+                current_lease = self._acquire_lease(method, priority)
+
+            # RPC 가 어떻게 끝나든(취소 포함) 슬롯 반환, 이미 끝났으면 False 반환되어 finally 에서 처리
+            context.add_callback(current_lease.release)
+            failed = True
+            try:
+                response = behavior(request, context)
+                failed = False
+                return response
+            finally:
+                current_lease.complete(context.code(), failed)
+        return wrapped
+
+    def _reject(self, request, context):
+        """과부하로 요청 거부"""
+        context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, OVERLOADED_DETAILS)
+
+class AsyncBackpressureInterceptor(_AdmissionTracker, grpc.aio.ServerInterceptor):
+    """grpc.aio 서버용 - 핸들러 디스패치 전에 백프레셔로 요청을 받거나 거부하는 인터셉터 (대기열 대기도 여기서 await)"""
+
+    async def intercept_service(self, continuation, handler_call_details):
+        method = handler_call_details.method
+        handler = await continuation(handler_call_details)
+        if not self._is_guarded(method) or handler is None or handler.unary_unary is None:
+            return handler
+
+        self.reap_expired_leases()
+        priority = self._priority(handler_call_details)
+        if not await self.backpressure.register_request_async(priority):
+            self._record_rejection(method, priority)
+            return grpc.unary_unary_rpc_method_handler(
+                self._reject,
+                response_serializer=handler.response_serializer
+            )
+
+        lease = self._acquire_lease(method, priority)
+        return handler._replace(unary_unary=self._wrap(handler.unary_unary, lease))
+
+    def _wrap(self, behavior, lease):
+        """핸들러를 감싸 모든 종료 경로(취소 포함)에서 슬롯 반환"""
+        async def wrapped(request, context):
+            context.add_done_callback(lease.release)
+            failed = True
+            try:
+                response = await behavior(request, context)
+                failed = False
+                return response
+            except asyncio.CancelledError:
+                lease.release()   # 호출자 취소는 표본 없이 반환
+                raise
+            finally:
+                lease.complete(context.code(), failed)
+        return wrapped
+
+    async def _reject(self, request, context):
+        """과부하로 요청 거부"""
+        await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, OVERLOADED_DETAILS)
+
+def create_backpressure_interceptor(backpressure, name, use_aio=False):
+    """BACKPRESSURE_ADMISSION=interceptor 이면 디스패치 시점 백프레셔 인터셉터 생성 (아니면 None)"""
+    if os.environ.get("BACKPRESSURE_ADMISSION", "handler").lower() != "interceptor":
+        return None
+
+    lease_timeout = float(os.environ.get("BACKPRESSURE_LEASE_TIMEOUT", "60"))
+    interceptor_class = AsyncBackpressureInterceptor if use_aio else BackpressureInterceptor
+    return interceptor_class(backpressure, lease_timeout=lease_timeout, name=name)
@@ -1,94 +1,361 @@
 import time
+import asyncio
 import threading
 import logging
+from collections import deque
+
+from common.rate_limiter import create_rate_limiter
+from common.concurrency_limiter import create_concurrency_limit
+from common.priority import PRIORITIES, PRIORITY_NORMAL, DEFAULT_PRIORITY_SHARES, priority_rank
+
+class _QueuedRequest:
+    """대기열에서 동시 처리 슬롯을 기다리는 요청 (스레드는 Event, aio 는 Future 로 깨움)"""
+
+    def __init__(self, enqueue_time, max_wait, priority, loop=None, rate_reserved=False):
+        self.enqueue_time = enqueue_time
+        self.priority = priority
+        self.max_wait = max_wait   # 이 시간 안에 슬롯을 받지 못하면 드롭
+        self.granted = False       # 슬롯을 넘겨받았는지 (lock 보유 상태에서만 변경)
+        self.rate_reserved = rate_reserved   # 대기열 진입 전에 요청률 토큰을 이미 가져왔는지 (공유 제한기)
+        self.shed_reason = None    # 슬롯 대신 드롭 통보를 받은 이유 (None 이면 대기 시간 초과)
+        self.loop = loop
+        if loop is None:
+            self.event = threading.Event()
+            self.future = None
+        else:
+            self.event = None
+            self.future = loop.create_future()
+
+    def wake(self):
+        """슬롯을 넘겨받은 요청 깨우기"""
+        if self.event is not None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self):
+        if not self.future.done():
+            self.future.set_result(True)
 
 class BackpressureController:
     """백프레셔 패턴 구현"""
     
-    def __init__(self, window_size=5, max_requests=30, max_concurrency=8, name="default"):
+    def __init__(self, window_size=5, max_requests=30, max_concurrency=8, name="default", bucket_count=50,
+                 strategy="window", burst=None, concurrency_algorithm="static", min_concurrency=1, max_concurrency_limit=200,
+                 queue_size=0, queue_target=0.005, queue_interval=0.1, priority_shares=None,
+                 shared_store=None, shared_key="global"):
         self.name = name
         self.window_size = window_size
         self.max_requests = max_requests
         self.max_concurrency = max_concurrency
+        self.strategy = strategy
         
-        self.request_times = []  # 요청 시간 기록
+        # 요청률 제한기 (window: 창 내 요청 수, token_bucket/gcra: 초당 max_requests/window_size 로 페이싱 + burst 허용,
+        #               shared_token_bucket: 공유 상태 저장소의 shared_key 예산을 모든 레플리카가 함께 사용)
+        self.rate_limiter = create_rate_limiter(strategy, window_size, max_requests, burst=burst, bucket_count=bucket_count,
+                                                shared_store=shared_store, shared_key=shared_key)
+        # 적응형 동시성 제한기 (static 이면 None, 그 외에는 관측 RTT 로 max_concurrency 를 조정)
+        self.concurrency_limit = create_concurrency_limit(concurrency_algorithm, max_concurrency, min_concurrency, max_concurrency_limit)
+        if self.concurrency_limit is not None:
+            self.max_concurrency = self.concurrency_limit.get_limit()
         self.active_requests = 0 # 현재 활성 요청 수
         self.lock = threading.RLock()
+        
+        # 동시 처리 한도 초과 시 대기열 (queue_size=0 이면 기존처럼 즉시 거부)
+        # CoDel: interval 동안의 최소 대기 시간이 target 을 넘으면 대기열이 고여 있는 것으로 보고
+        #        이후 요청은 target 만큼만 기다리게 해 지연이 쌓이지 않도록 함
+        self.queue_size = queue_size
+        self.queue_target = queue_target
+        self.queue_interval = queue_interval
+        self.wait_queue = deque()
+        self.queue_overloaded = False            # 대기열이 고여 있는 상태 (CoDel)
+        self._interval_min_sojourn = None        # 현재 interval 의 최소 대기 시간
+        self._interval_end = None
+        self.queued_count = 0
+        self.queue_shed_count = 0                # 대기 시간 초과로 드롭
+        self.queue_full_count = 0                # 대기열 포화로 거부
+        self.sojourn_total = 0.0
+        self.sojourn_max = 0.0
+        self.last_sojourn = 0.0
+        
+        # 우선순위별 허용 비율 - 1.0 미만으로 설정한 우선순위는 한도의 일부만 사용해 과부하 시 먼저 차단됨 (기본값은 모두 1.0)
+        self.priority_shares = dict(priority_shares or DEFAULT_PRIORITY_SHARES)
+        self.admitted_by_priority = {priority: 0 for priority in PRIORITIES}
+        self.rejected_by_priority = {priority: 0 for priority in PRIORITIES}
+        self._refund_tasks = set()   # 취소된 대기 요청의 토큰 반환 작업 (완료 전에 GC 되지 않도록 참조 유지)
         self.logger = logging.getLogger(f"backpressure.{name}")
         
-        self.logger.warning(f"[백프레셔-{self.name}] 초기화 - 설정: 창={window_size}초, 최대요청={max_requests}개, 최대동시={max_concurrency}개")
+        self.logger.warning(f"[백프레셔-{self.name}] 초기화 - 설정: 창={window_size}초, 최대요청={max_requests}개, 최대동시={max_concurrency}개, 전략={strategy}, 동시성제한={concurrency_algorithm}, 대기열={queue_size}개(목표 {queue_target}초/주기 {queue_interval}초), 우선순위 비율={self.priority_shares}")
     
     def is_overloaded(self):
         """과부하 상태 확인"""
         with self.lock:
             current_time = time.time()
             
-            # 측정 시간 창 외의 오래된 요청 제거
-            self.request_times = [t for t in self.request_times if current_time - t < self.window_size]
-            
-            # 현재 초당 요청 수 계산
-            request_rate = len(self.request_times) / self.window_size if self.window_size > 0 else 0
+            # 요청률 제한기 기준 허용 여부 (상태 변경 없음)
+            usage = self.rate_limiter.describe(current_time)
             
             # 과부하 상태 확인
-            is_rate_exceeded = len(self.request_times) >= self.max_requests
+            is_rate_exceeded = not self.rate_limiter.peek(current_time)
             is_concurrency_exceeded = self.active_requests >= self.max_concurrency
             is_overloaded = is_rate_exceeded or is_concurrency_exceeded
             
-            self.logger.warning(f"[백프레셔-{self.name}] 상태 확인: 요청수={len(self.request_times)}/{self.max_requests}, " +
+            self.logger.warning(f"[백프레셔-{self.name}] 상태 확인: {usage}, " +
                             f"동시처리={self.active_requests}/{self.max_concurrency}, 과부하={is_overloaded}")
             
             if is_rate_exceeded:
-                self.logger.warning(f"[백프레셔-{self.name}] 초당 요청 수 초과: {request_rate:.1f}/초 (최대: {self.max_requests/self.window_size}/초)")
+                self.logger.warning(f"[백프레셔-{self.name}] 요청률 초과 ({self.strategy}): {usage} (최대: {self.max_requests/self.window_size}/초)")
             
             if is_concurrency_exceeded:
                 self.logger.warning(f"[백프레셔-{self.name}] 동시 요청 수 초과: {self.active_requests} (최대: {self.max_concurrency})")
             
             return is_overloaded
     
-    def register_request(self):
-        """요청 등록 및 처리 가능 여부 반환"""
+    def _priority_share(self, priority):
+        """우선순위의 허용 비율 (알 수 없는 우선순위는 normal)"""
+        return self.priority_shares.get(priority, self.priority_shares[PRIORITY_NORMAL])
+    
+    def _concurrency_limit_for(self, priority):
+        """우선순위별 동시 처리 한도"""
+        return max(1, int(self.max_concurrency * self._priority_share(priority)))
+    
+    def _take_rate_token(self, priority):
+        """잠금 밖에서 요청률 토큰을 먼저 가져옴 (공유 제한기만 해당, 그 외에는 None 을 반환하고 잠금 안에서 peek/acquire)"""
+        if not self.rate_limiter.take_outside_lock:
+            return None
+        return self.rate_limiter.try_take(time.time(), self._priority_share(priority))
+    
+    async def _take_rate_token_async(self, priority):
+        if not self.rate_limiter.take_outside_lock:
+            return None
+        return await self.rate_limiter.try_take_async(time.time(), self._priority_share(priority))
+    
+    def register_request(self, priority=PRIORITY_NORMAL):
+        """요청 등록 및 처리 가능 여부 반환 (대기열 사용 시 슬롯이 날 때까지 블로킹 대기)"""
+        rate_reserved = self._take_rate_token(priority)
+        result = self._admit_or_enqueue(None, priority, rate_reserved=rate_reserved)
+        if isinstance(result, _QueuedRequest):
+            result.event.wait(result.max_wait)
+            result = self._finish_wait(result)
+        
+        # 요청률은 통과했지만 동시 처리 한도로 거부되면 가져온 토큰 반환
+        if rate_reserved and not result:
+            self.rate_limiter.refund(time.time())
+        return result
+    
+    async def register_request_async(self, priority=PRIORITY_NORMAL):
+        """요청 등록 및 처리 가능 여부 반환 (grpc.aio 용 - 대기 중 이벤트 루프를 막지 않음)"""
+        rate_reserved = await self._take_rate_token_async(priority)
+        result = self._admit_or_enqueue(asyncio.get_running_loop(), priority, rate_reserved=rate_reserved)
+        if isinstance(result, _QueuedRequest):
+            try:
+                await asyncio.wait_for(asyncio.shield(result.future), timeout=result.max_wait)
+            except asyncio.TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                # 대기 중 호출이 취소되면 대기열에서 빼고, 이미 넘겨받은 슬롯은 반환 (못 받았으면 토큰 반환)
+                if self._finish_wait(result):
+                    self.complete_request()
+                elif rate_reserved:
+                    task = asyncio.get_running_loop().create_task(self.rate_limiter.refund_async(time.time()))
+                    self._refund_tasks.add(task)
+                    task.add_done_callback(self._refund_tasks.discard)
+                raise
+            result = self._finish_wait(result)
+        
+        if rate_reserved and not result:
+            await self.rate_limiter.refund_async(time.time())
+        return result
+    
+    def try_register_request(self, priority=PRIORITY_NORMAL):
+        """블로킹 없이 요청 등록 시도 - 등록(True), 거부(False), 대기열 대기가 필요하면 None (이 경우 상태 변경 없음)
+
+        공유 제한기는 토큰을 가져오는 데 저장소 왕복(원격 호출)이 필요하므로 판단하지 않고 None 을 반환한다 (워커에서 register_request).
+        """
+        if self.rate_limiter.take_outside_lock:
+            return None
+        return self._admit_or_enqueue(None, priority, defer=True)
+    
+    def _admit_or_enqueue(self, loop, priority, defer=False, rate_reserved=None):
+        """즉시 등록(True), 거부(False), 또는 대기열에 넣은 _QueuedRequest 반환 (defer 이면 대기 대신 None)
+
+        rate_reserved 는 잠금 밖에서 미리 가져온 요청률 토큰 결과 (None 이면 여기서 peek/acquire).
+        """
         with self.lock:
             current_time = time.time()
             
-            # 측정 시간 창 외의 오래된 요청 제거
-            self.request_times = [t for t in self.request_times if current_time - t < self.window_size]
+            # 요청률 제한기 기준 허용 여부 (새 요청 등록 전에 확인)
+            usage = self.rate_limiter.describe(current_time)
             
-            # 현재 과부하 상태인지 확인 (새 요청 등록 전에 확인)
-            is_rate_exceeded = len(self.request_times) >= self.max_requests
-            is_concurrency_exceeded = self.active_requests >= self.max_concurrency
+            # 현재 과부하 상태인지 확인 (우선순위별 한도 적용, 같거나 높은 우선순위 요청이 기다리고 있으면 뒤에 줄 섬)
+            concurrency_limit = self._concurrency_limit_for(priority)
+            if rate_reserved is None:
+                is_rate_exceeded = not self.rate_limiter.peek(current_time, self._priority_share(priority))
+            else:
+                is_rate_exceeded = not rate_reserved
+            waiting_ahead = any(priority_rank(waiter.priority) <= priority_rank(priority) for waiter in self.wait_queue)
+            is_concurrency_exceeded = self.active_requests >= concurrency_limit or waiting_ahead
             is_overloaded = is_rate_exceeded or is_concurrency_exceeded
             
             # 상태 로깅 추가 - 더 자세한 정보
-            self.logger.warning(f"[백프레셔-{self.name}] 요청 등록 전 상태: 요청수={len(self.request_times)}/{self.max_requests}, " +
-                            f"동시처리={self.active_requests}/{self.max_concurrency}, 과부하={is_overloaded}")
+            self.logger.warning(f"[백프레셔-{self.name}] 요청 등록 전 상태: 우선순위={priority}, {usage}, " +
+                            f"동시처리={self.active_requests}/{concurrency_limit}, 대기={len(self.wait_queue)}/{self.queue_size}, 과부하={is_overloaded}")
+            
+            # 동시 처리 한도만 넘었고 대기열에 자리가 있으면 대기
+            if is_concurrency_exceeded and not is_rate_exceeded and len(self.wait_queue) < self.queue_size:
+                if defer:
+                    return None
+                max_wait = self.queue_target if self.queue_overloaded else self.queue_interval
+                waiter = _QueuedRequest(current_time, max_wait, priority, loop, rate_reserved=bool(rate_reserved))
+                self.wait_queue.append(waiter)
+                self.queued_count += 1
+                self.logger.warning(f"[백프레셔-{self.name}] 동시 요청 초과 - 대기열 진입 (대기 {len(self.wait_queue)}/{self.queue_size}, 최대 {max_wait:.3f}초)")
+                return waiter
             
             if is_overloaded:
                 # 과부하 상태이면 요청 거부
                 reject_reason = []
                 if is_rate_exceeded:
-                    reject_reason.append(f"시간당 요청 초과({len(self.request_times)}/{self.max_requests})")
+                    reject_reason.append(f"요청률 초과({self.strategy}: {usage})")
                 if is_concurrency_exceeded:
-                    reject_reason.append(f"동시 요청 초과({self.active_requests}/{self.max_concurrency})")
-                    
-                self.logger.error(f"[백프레셔-{self.name}] 요청 거부! 과부하 상태! 이유: {', '.join(reject_reason)}")
+                    reject_reason.append(f"동시 요청 초과({self.active_requests}/{concurrency_limit})")
+                    # 요청률 초과로 대기열에 넣지 않은 경우는 포화로 세지 않음
+                    if self.queue_size > 0 and len(self.wait_queue) >= self.queue_size:
+                        self.queue_full_count += 1
+                        reject_reason.append(f"대기열 포화({len(self.wait_queue)}/{self.queue_size})")
+                
+                self.rejected_by_priority[priority] = self.rejected_by_priority.get(priority, 0) + 1
+                self.logger.error(f"[백프레셔-{self.name}] 요청 거부! 과부하 상태! 우선순위={priority}, 이유: {', '.join(reject_reason)}")
                 return False
             
             # 과부하 상태가 아니면 요청 등록
-            self.request_times.append(current_time)
+            if rate_reserved is None:
+                self.rate_limiter.acquire(current_time)
             self.active_requests += 1
+            self.admitted_by_priority[priority] = self.admitted_by_priority.get(priority, 0) + 1
+            if self.queue_size > 0:
+                self._record_sojourn(0.0, current_time)
             self.logger.warning(f"[백프레셔-{self.name}] 요청 등록 완료: 활성 요청 {self.active_requests}개")
             return True
     
-    def complete_request(self):
-        """요청 완료"""
+    def _finish_wait(self, waiter):
+        """대기가 끝난 요청 처리 - 슬롯을 넘겨받았으면 True, 아니면 대기열에서 빼고 드롭"""
         with self.lock:
+            if waiter.granted:
+                return True
+            
+            if waiter in self.wait_queue:
+                self.wait_queue.remove(waiter)
+            self.queue_shed_count += 1
+            self.rejected_by_priority[waiter.priority] = self.rejected_by_priority.get(waiter.priority, 0) + 1
+            waited = time.time() - waiter.enqueue_time
+            reason = waiter.shed_reason or f"대기 시간 초과({waited:.3f}초/{waiter.max_wait:.3f}초)"
+            self.logger.error(f"[백프레셔-{self.name}] 요청 거부! 우선순위={waiter.priority}, {reason}, 누적 드롭 {self.queue_shed_count}건")
+            return False
+    
+    def _dispatch_waiters(self):
+        """빈 동시 처리 슬롯을 대기 중인 요청에 넘겨줌 - 우선순위가 높은 요청 먼저, 같으면 먼저 온 순 (lock 보유 상태에서 호출)
+
+        대기하는 동안 요청률 한도를 넘었으면 슬롯을 넘기지 않고 드롭한다 (미리 토큰을 가져온 요청은 제외).
+        """
+        while self.wait_queue:
+            waiter = None
+            for candidate in self.wait_queue:
+                if self.active_requests >= self._concurrency_limit_for(candidate.priority):
+                    continue
+                if waiter is None or priority_rank(candidate.priority) < priority_rank(waiter.priority):
+                    waiter = candidate
+            if waiter is None:
+                return
+            
+            self.wait_queue.remove(waiter)
+            current_time = time.time()
+            if not waiter.rate_reserved and not self.rate_limiter.peek(current_time, self._priority_share(waiter.priority)):
+                waiter.shed_reason = f"대기 중 요청률 초과({self.strategy}: {self.rate_limiter.describe(current_time)})"
+                waiter.wake()
+                continue
+            
+            waiter.granted = True
+            if not waiter.rate_reserved:
+                self.rate_limiter.acquire(current_time)
+            self.active_requests += 1
+            self.admitted_by_priority[waiter.priority] = self.admitted_by_priority.get(waiter.priority, 0) + 1
+            self._record_sojourn(current_time - waiter.enqueue_time, current_time)
+            waiter.wake()
+    
+    def _record_sojourn(self, sojourn, current_time):
+        """대기 시간 기록 및 CoDel 상태 갱신 (lock 보유 상태에서 호출)"""
+        self.last_sojourn = sojourn
+        self.sojourn_total += sojourn
+        self.sojourn_max = max(self.sojourn_max, sojourn)
+        
+        if self._interval_end is None:
+            self._interval_end = current_time + self.queue_interval
+        if self._interval_min_sojourn is None or sojourn < self._interval_min_sojourn:
+            self._interval_min_sojourn = sojourn
+        
+        # interval 이 끝날 때마다 최소 대기 시간으로 고인 대기열 여부 판단
+        if current_time >= self._interval_end:
+            overloaded = self._interval_min_sojourn > self.queue_target
+            if overloaded != self.queue_overloaded:
+                self.logger.warning(f"[백프레셔-{self.name}] 대기열 상태 변경: 고임={overloaded} (최소 대기 {self._interval_min_sojourn:.3f}초, 목표 {self.queue_target}초)")
+            self.queue_overloaded = overloaded
+            self._interval_min_sojourn = None
+            self._interval_end = current_time + self.queue_interval
+    
+    def complete_request(self, rtt=None, dropped=False):
+        """요청 완료 - 등록부터 완료까지 걸린 시간(rtt)이나 하위 호출 실패(dropped)를 넘기면 적응형 동시성 제한기 표본으로 반영
+
+        취소/예산 소진처럼 하위 서비스 상태를 알 수 없이 끝난 요청은 표본 없이 슬롯만 반환한다.
+        """
+        with self.lock:
+            if self.concurrency_limit is not None and (rtt is not None or dropped):
+                self._update_concurrency_limit(rtt or 0.0, dropped)
             if self.active_requests > 0:
                 self.active_requests -= 1
                 self.logger.warning(f"[백프레셔-{self.name}] 요청 완료: 활성 요청 {self.active_requests}개")
+            self._dispatch_waiters()
+    
+    def _update_concurrency_limit(self, rtt, dropped):
+        """적응형 제한기에 표본을 반영하고 max_concurrency 갱신 (lock 보유 상태에서 호출, 완료 전 in-flight 기준)"""
+        old_limit = self.max_concurrency
+        self.max_concurrency = self.concurrency_limit.on_sample(rtt, self.active_requests, dropped)
+        if self.max_concurrency != old_limit:
+            self.logger.warning(f"[백프레셔-{self.name}] 동시성 한도 조정 ({self.concurrency_limit.algorithm}): {old_limit} -> {self.max_concurrency}")
     
     def reset(self):
         """백프레셔 상태 강제 초기화"""
         with self.lock:
-            self.request_times = []
+            self.rate_limiter.reset()
             self.active_requests = 0
-            self.logger.warning(f"[백프레셔-{self.name}] 상태 수동 초기화")
\ No newline at end of file
+            self.queue_overloaded = False
+            self._interval_min_sojourn = None
+            self._interval_end = None
+            self._dispatch_waiters()
+            self.logger.warning(f"[백프레셔-{self.name}] 상태 수동 초기화")
+    
+    def get_stats(self):
+        """백프레셔 통계 반환"""
+        with self.lock:
+            stats = self.rate_limiter.get_stats(time.time())
+            stats["active_requests"] = self.active_requests
+            stats["max_concurrency"] = self.max_concurrency
+            if self.concurrency_limit is not None:
+                for key, value in self.concurrency_limit.get_stats().items():
+                    stats[f"concurrency_limit.{key}"] = value
+            for priority, share in self.priority_shares.items():
+                stats[f"priority.{priority}.share"] = share
+                stats[f"priority.{priority}.admitted"] = self.admitted_by_priority.get(priority, 0)
+                stats[f"priority.{priority}.rejected"] = self.rejected_by_priority.get(priority, 0)
+            if self.queue_size > 0:
+                admitted = self.queued_count - self.queue_shed_count - len(self.wait_queue)
+                stats["queue.size"] = self.queue_size
+                stats["queue.depth"] = len(self.wait_queue)
+                stats["queue.overloaded"] = self.queue_overloaded
+                stats["queue.queued"] = self.queued_count
+                stats["queue.shed"] = self.queue_shed_count
+                stats["queue.full"] = self.queue_full_count
+                stats["queue.sojourn_last"] = self.last_sojourn
+                stats["queue.sojourn_max"] = self.sojourn_max
+                stats["queue.sojourn_avg_queued"] = (self.sojourn_total / admitted) if admitted > 0 else 0.0
+            return stats
\ No newline at end of file
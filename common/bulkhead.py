@@ -0,0 +1,100 @@
+import os
+import threading
+import logging
+
+class _Compartment:
+    """벌크헤드 구획 하나 (기본 워커 슬롯 + 추가 슬롯 상한)"""
+
+    def __init__(self, name, max_workers, max_overflow):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_overflow = max_overflow   # 대기하지 않고 즉시 처리되는 추가 슬롯 (대기열 아님)
+        self.capacity = max_workers + max_overflow
+        self.in_flight = 0     # 처리 중
+        self.accepted_count = 0
+        self.rejected_count = 0
+
+class Bulkhead:
+    """벌크헤드 패턴 구현 - 요청 분류별로 분리된 동시성 한도
+
+    요청을 처리하는 스레드(또는 aio 태스크)에서 try_acquire/release 로 구획 슬롯을 잡는다.
+    별도 실행기에 넘기지 않으므로 요청 하나가 스레드를 하나만 점유한다.
+    """
+
+    def __init__(self, compartments, name="default"):
+        self.name = name
+        self.lock = threading.Lock()
+        self.logger = logging.getLogger(f"bulkhead.{name}")
+        self.compartments = {
+            class_name: _Compartment(class_name, max_workers, max_overflow)
+            for class_name, (max_workers, max_overflow) in compartments.items()
+        }
+
+        settings = ", ".join(f"{c.name}(워커={c.max_workers}, 추가={c.max_overflow})" for c in self.compartments.values())
+        self.logger.warning(f"[벌크헤드-{self.name}] 초기화 - 구획: {settings}")
+
+    def classify(self, request_type):
+        """요청 유형을 구획 이름으로 변환"""
+        return "slow" if request_type == "slow" else "normal"
+
+    def try_acquire(self, request_class):
+        """구획 슬롯 확보 (가득 찼으면 False)"""
+        compartment = self.compartments[request_class]
+        with self.lock:
+            if compartment.in_flight >= compartment.capacity:
+                compartment.rejected_count += 1
+                rejected = compartment.rejected_count
+            else:
+                compartment.in_flight += 1
+                compartment.accepted_count += 1
+                return True
+
+        self.logger.error(f"[벌크헤드-{self.name}] {request_class} 구획 포화 - 요청 거부 (누적 거부 {rejected}건)")
+        return False
+
+    def release(self, request_class):
+        """구획 슬롯 반환"""
+        compartment = self.compartments[request_class]
+        with self.lock:
+            if compartment.in_flight > 0:
+                compartment.in_flight -= 1
+
+    def get_stats(self):
+        """구획별 통계 반환"""
+        with self.lock:
+            stats = {}
+            for compartment in self.compartments.values():
+                stats[compartment.name] = {
+                    "max_workers": compartment.max_workers,
+                    "max_overflow": compartment.max_overflow,
+                    "in_flight": compartment.in_flight,
+                    "accepted": compartment.accepted_count,
+                    "rejected": compartment.rejected_count,
+                }
+            return stats
+
+def create_bulkhead_from_env(name, max_workers=None):
+    """환경 변수(BULKHEAD_*) 기반 벌크헤드 생성 (비활성화 시 None)
+
+    max_workers 를 주면(스레드풀 서버) 구획 슬롯 합계가 워커 스레드 수를 넘지 않는지 확인한다.
+    합계가 더 크면 한 구획이 워커를 모두 차지해 다른 구획 요청이 실행기 큐에서 기다리게 되어 격리가 깨진다.
+    """
+    if os.environ.get("BULKHEAD_ENABLED", "false").lower() not in ("1", "true", "yes"):
+        return None
+
+    compartments = {
+        "slow": (
+            int(os.environ.get("BULKHEAD_SLOW_MAX_WORKERS", "4")),
+            int(os.environ.get("BULKHEAD_SLOW_MAX_OVERFLOW", "0")),
+        ),
+        "normal": (
+            int(os.environ.get("BULKHEAD_NORMAL_MAX_WORKERS", "6")),
+            int(os.environ.get("BULKHEAD_NORMAL_MAX_OVERFLOW", "0")),
+        ),
+    }
+    if max_workers is not None:
+        total = sum(workers + overflow for workers, overflow in compartments.values())
+        if total > max_workers:
+            raise ValueError(f"벌크헤드 구획 슬롯 합계 {total}개가 서버 워커 스레드 {max_workers}개(SERVER_MAX_WORKERS)를 넘습니다")
+
+    return Bulkhead(compartments=compartments, name=name)
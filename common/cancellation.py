@@ -0,0 +1,46 @@
+import threading
+import grpc
+
+class DownstreamCancelled(grpc.RpcError):
+    """인바운드 호출이 끝나(취소/데드라인 만료) 진행 중이던 하위 호출을 취소함"""
+
+    def code(self):
+        return grpc.StatusCode.CANCELLED
+
+    def details(self):
+        return "상위 호출이 끝나 하위 호출을 취소했습니다"
+
+def call_cancellable(stub_method, request, context=None, timeout=None, metadata=None):
+    """하위 호출을 취소 가능한 future 로 보내고 인바운드 호출이 끝나면 함께 취소 (스레드풀 서버용)
+
+    context.add_callback 은 RPC 가 어떻게 끝나든(정상 종료 포함) 호출되므로, 이미 끝난 future 의 cancel 은 무시된다.
+    """
+    if context is None:
+        return stub_method(request, timeout=timeout, metadata=metadata)
+
+    future = stub_method.future(request, timeout=timeout, metadata=metadata)
+    if not context.add_callback(future.cancel):
+        # 인바운드 호출이 이미 끝남
+        future.cancel()
+    try:
+        return future.result()
+    except grpc.FutureCancelledError:
+        raise DownstreamCancelled() from None
+
+class CancellationStats:
+    """호출자가 떠나 취소된 진행 중 호출 수 (지표용)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.cancelled_count = 0
+
+    def record(self):
+        """취소 한 건 기록 후 누적 건수 반환"""
+        with self.lock:
+            self.cancelled_count += 1
+            return self.cancelled_count
+
+    def get_stats(self):
+        return {
+            "cancelled_in_flight": self.cancelled_count,
+        }
@@ -0,0 +1,158 @@
+import time
+import asyncio
+import threading
+import logging
+import grpc
+
+class ChannelPool:
+    """gRPC 채널/스텁 풀 구현 (여러 워커 스레드가 공유)"""
+
+    def __init__(self, address, stub_class, size=4, options=None, name="default"):
+        self.name = name
+        self.address = address
+        self.stub_class = stub_class
+        self.size = max(1, size)
+        # 전역 서브채널 풀을 쓰면 주소/옵션이 같은 채널들이 TCP 연결 하나를 공유하므로 채널마다 로컬 풀 사용
+        self.options = list(options or []) + [("grpc.use_local_subchannel_pool", 1)]
+
+        self.channels = []
+        self.stubs = []
+        self._next_index = 0
+        self.lock = threading.Lock()
+        self.logger = logging.getLogger(f"channel_pool.{name}")
+
+        # 채널별 연결 상태 및 연결 시작 시간 (connectivity 콜백에서 갱신)
+        self.channel_states = [None] * self.size
+        self._connect_started = [None] * self.size
+
+        # 통계
+        self.acquire_count = 0
+        self.connect_count = 0          # 연결 수립(READY 도달) 횟수
+        self.connect_time_total = 0.0   # 연결 수립에 소요된 총 시간
+        self.query_count = 0
+        self.query_time_total = 0.0     # 스텁 호출에 소요된 총 시간
+
+        for index in range(self.size):
+            channel = self._create_channel(index)
+            self.channels.append(channel)
+            self.stubs.append(self.stub_class(channel))
+
+        self.logger.info(f"[채널풀-{self.name}] 초기화 - 주소: {self.address}, 크기: {self.size}")
+
+    def _create_channel(self, index):
+        """채널 생성 및 연결 상태 구독"""
+        channel = grpc.insecure_channel(self.address, options=self.options)
+        channel.subscribe(self._make_state_callback(index), try_to_connect=False)
+        return channel
+
+    def _make_state_callback(self, index):
+        """채널 연결 상태 변화 콜백 생성"""
+        def callback(state):
+            with self.lock:
+                old_state = self.channel_states[index]
+                self.channel_states[index] = state
+
+                # IDLE -> READY 처럼 CONNECTING 이 보고되지 않을 수 있어 워밍업에서도 시작 시간을 기록
+                if state in (grpc.ChannelConnectivity.CONNECTING, grpc.ChannelConnectivity.TRANSIENT_FAILURE):
+                    if self._connect_started[index] is None:
+                        self._connect_started[index] = time.time()
+                elif state == grpc.ChannelConnectivity.READY and self._connect_started[index] is not None:
+                    self.connect_time_total += time.time() - self._connect_started[index]
+                    self.connect_count += 1
+                    self._connect_started[index] = None
+                elif state == grpc.ChannelConnectivity.SHUTDOWN:
+                    self._connect_started[index] = None
+
+            if old_state != state:
+                self.logger.info(f"[채널풀-{self.name}] 채널 {index} 상태 변경: {old_state} -> {state}")
+        return callback
+
+    def warm_up(self, timeout=5.0):
+        """모든 채널을 미리 연결 (서버 시작 시 호출)"""
+        ready = 0
+        for index, channel in enumerate(self.channels):
+            with self.lock:
+                if self._connect_started[index] is None and self.channel_states[index] != grpc.ChannelConnectivity.READY:
+                    self._connect_started[index] = time.time()
+            try:
+                grpc.channel_ready_future(channel).result(timeout=timeout)
+                ready += 1
+            except grpc.FutureTimeoutError:
+                self.logger.warning(f"[채널풀-{self.name}] 채널 {index} 워밍업 시간 초과 ({timeout}초)")
+
+        self.logger.info(f"[채널풀-{self.name}] 워밍업 완료: {ready}/{self.size}개 채널 준비됨")
+        return ready
+
+    def get_stub(self):
+        """라운드 로빈으로 스텁 반환"""
+        with self.lock:
+            index = self._next_index
+            self._next_index = (self._next_index + 1) % self.size
+            self.acquire_count += 1
+        return self.stubs[index]
+
+    def record_query_time(self, query_time):
+        """스텁 호출 소요 시간 기록"""
+        with self.lock:
+            self.query_count += 1
+            self.query_time_total += query_time
+
+    def get_stats(self):
+        """풀 통계 반환"""
+        with self.lock:
+            ready_channels = sum(1 for state in self._current_states() if state == grpc.ChannelConnectivity.READY)
+            return {
+                "size": self.size,
+                "ready_channels": ready_channels,
+                "acquire_count": self.acquire_count,
+                "connect_count": self.connect_count,
+                "connect_time_total": self.connect_time_total,
+                "connect_time_avg": self.connect_time_total / self.connect_count if self.connect_count else 0.0,
+                "query_count": self.query_count,
+                "query_time_total": self.query_time_total,
+                "query_time_avg": self.query_time_total / self.query_count if self.query_count else 0.0,
+            }
+
+    def _current_states(self):
+        """채널별 현재 연결 상태"""
+        return self.channel_states
+
+    def close(self):
+        """모든 채널 종료"""
+        for channel in self.channels:
+            channel.close()
+        self.logger.info(f"[채널풀-{self.name}] 모든 채널 종료")
+
+class AsyncChannelPool(ChannelPool):
+    """grpc.aio 채널/스텁 풀 구현 (이벤트 루프 안에서 생성해야 함)"""
+
+    def _create_channel(self, index):
+        """aio 채널 생성 (aio 채널은 subscribe 를 지원하지 않아 상태는 조회 시 확인)"""
+        return grpc.aio.insecure_channel(self.address, options=self.options)
+
+    async def warm_up(self, timeout=5.0):
+        """모든 채널을 미리 연결 (서버 시작 시 호출)"""
+        ready = 0
+        for index, channel in enumerate(self.channels):
+            start_time = time.time()
+            try:
+                await asyncio.wait_for(channel.channel_ready(), timeout=timeout)
+                ready += 1
+                with self.lock:
+                    self.connect_time_total += time.time() - start_time
+                    self.connect_count += 1
+            except asyncio.TimeoutError:
+                self.logger.warning(f"[채널풀-{self.name}] 채널 {index} 워밍업 시간 초과 ({timeout}초)")
+
+        self.logger.info(f"[채널풀-{self.name}] 워밍업 완료: {ready}/{self.size}개 채널 준비됨")
+        return ready
+
+    def _current_states(self):
+        """채널별 현재 연결 상태"""
+        return [channel.get_state(try_to_connect=False) for channel in self.channels]
+
+    async def close(self):
+        """모든 채널 종료"""
+        for channel in self.channels:
+            await channel.close()
+        self.logger.info(f"[채널풀-{self.name}] 모든 채널 종료")
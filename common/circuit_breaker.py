@@ -1,143 +1,466 @@
 import time
 import logging
 import threading
-from collections import deque
+from collections import namedtuple
 from datetime import datetime, timedelta
 
+from common.sliding_window import SlidingWindowCounter
+from common.latency_histogram import LatencyHistogram
+
+class CountBasedWindow:
+    """최근 N개 호출 결과(실패/느림 여부)를 담는 고정 크기 링 버퍼"""
+    
+    window_type = "count"
+    
+    def __init__(self, size):
+        self.size = max(1, size)
+        self.outcomes = [False] * self.size
+        self.index = 0
+        self.calls = 0
+        self.hits = 0  # 표시된(실패 또는 느린) 호출 수
+    
+    def record(self, hit, current_time):
+        """호출 결과 기록 (가득 차면 가장 오래된 결과를 밀어냄)"""
+        if self.calls == self.size:
+            self.hits -= self.outcomes[self.index]
+        else:
+            self.calls += 1
+        self.outcomes[self.index] = hit
+        self.hits += hit
+        self.index = (self.index + 1) % self.size
+    
+    def snapshot(self, current_time):
+        """(호출 수, 표시된 호출 수)"""
+        return self.calls, self.hits
+    
+    def is_expired(self, record_time, current_time):
+        """뒤늦게 반영되는 기록이 이미 창을 벗어났는지 (개수 기준 창은 항상 유효)"""
+        return False
+    
+    def reset(self):
+        self.outcomes = [False] * self.size
+        self.index = 0
+        self.calls = 0
+        self.hits = 0
+
+class TimeBasedWindow:
+    """최근 N초 호출 결과(실패/느림 여부)를 초 단위 버킷 링 버퍼로 집계"""
+    
+    window_type = "time"
+    
+    def __init__(self, size):
+        self.size = max(1, size)
+        self.calls = SlidingWindowCounter(self.size, self.size)
+        self.hits = SlidingWindowCounter(self.size, self.size)
+    
+    def record(self, hit, current_time):
+        """호출 결과 기록"""
+        self.calls.add(current_time)
+        self.hits.add(current_time, 1 if hit else 0)
+    
+    def snapshot(self, current_time):
+        """(호출 수, 표시된 호출 수)"""
+        return self.calls.count(current_time), self.hits.count(current_time)
+    
+    def is_expired(self, record_time, current_time):
+        """뒤늦게 반영되는 기록이 이미 창을 벗어났는지"""
+        return current_time - record_time >= self.size
+    
+    def reset(self):
+        self.calls.reset()
+        self.hits.reset()
+
+CIRCUIT_BREAKER_WINDOW_TYPES = ("count", "time")
+
+def create_call_window(window_type, size):
+    """창 종류 이름으로 호출 결과 슬라이딩 윈도우 생성"""
+    if window_type == "count":
+        return CountBasedWindow(size)
+    if window_type == "time":
+        return TimeBasedWindow(size)
+    raise ValueError(f"알 수 없는 서킷브레이커 창 종류: {window_type} (지원: {', '.join(CIRCUIT_BREAKER_WINDOW_TYPES)})")
+
+# 잠금 없이 읽는 불변 상태 스냅샷 (상태 변경 시 통째로 교체)
+_BreakerSnapshot = namedtuple("_BreakerSnapshot", ["state", "retry_time"])
+
+class _ProbePermit:
+    """HALF_OPEN 시험 요청 허가 - 허가를 받은 호출자만 결과를 반영하도록 allow_request 가 돌려줌"""
+    
+    __slots__ = ("generation", "settled")
+    
+    def __init__(self, generation):
+        self.generation = generation  # 허가를 낸 HALF_OPEN 구간 번호
+        self.settled = False          # 결과 보고/반환 완료 여부 (lock 보유 상태에서만 변경)
+
+class _RecordStripe:
+    """스레드별로 나눠 쓰는 CLOSED 상태 호출 결과 버퍼 (판단 직전에 창으로 합침)"""
+    
+    __slots__ = ("lock", "records")
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.records = []  # (시각, 느린 호출 표본 여부, 표시 여부)
+    
+    def append(self, record):
+        """기록 추가 후 버퍼 길이 반환"""
+        with self.lock:
+            self.records.append(record)
+            return len(self.records)
+    
+    def take(self):
+        """버퍼를 비우고 기록 반환"""
+        with self.lock:
+            records, self.records = self.records, []
+            return records
+
 class CircuitBreaker:
-    """서킷 브레이커 패턴 구현"""
+    """서킷 브레이커 패턴 구현 - 슬라이딩 윈도우 안의 실패율/느린 호출 비율로 차단 여부 결정
+    
+    CLOSED 상태의 allow_request 와 성공 기록은 공유 잠금을 잡지 않는다.
+    상태는 불변 스냅샷으로 읽고, 성공/빠른 호출은 스레드별 버퍼에 모았다가
+    실패·느린 호출·지표 조회처럼 판단이 필요한 시점이나 버퍼가 찼을 때 잠금 안에서 창에 반영한다.
+    """
+    
+    STRIPE_COUNT = 16        # 기록 버퍼 수 (스레드 ID 로 분산)
+    STRIPE_FLUSH_SIZE = 64   # 버퍼에 이만큼 쌓이면 창에 반영
     
     # 서킷 상태
     STATE_CLOSED = "CLOSED"       # 정상 작동
     STATE_OPEN = "OPEN"           # 차단됨
     STATE_HALF_OPEN = "HALF_OPEN" # 일부 허용
     
-    def __init__(self, fail_threshold=5, reset_timeout=10, name="default"):
+    def __init__(self, fail_threshold=5, reset_timeout=10, name="default",
+                 window_type="count", window_size=20, failure_rate_threshold=50.0, minimum_calls=None,
+                 slow_call_threshold=0.0, slow_call_rate_threshold=100.0,
+                 half_open_permits=1, half_open_required_successes=1):
         self.name = name
-        self.fail_threshold = fail_threshold  # 실패 임계값
+        self.fail_threshold = fail_threshold  # 실패 임계값 (minimum_calls 미지정 시 최소 호출 수로 사용)
         self.reset_timeout = reset_timeout    # 초기화 시간 (초)
         
-        self.state = self.STATE_CLOSED
-        self.failure_count = 0
+        # 실패율 판단 (count: 최근 window_size 개 호출, time: 최근 window_size 초)
+        self.window = create_call_window(window_type, window_size)
+        self.failure_rate_threshold = failure_rate_threshold  # 차단 실패율 (%)
+        self.minimum_calls = minimum_calls if minimum_calls is not None else fail_threshold  # 실패율을 판단할 최소 호출 수
+        
+        # 느린 호출 비율 판단 (성공한 호출의 실행 시간 기준, slow_call_threshold <= 0 이면 사용 안 함)
+        self.slow_window = create_call_window(window_type, window_size)
+        self.slow_call_threshold = slow_call_threshold            # 느린 호출 기준 (초)
+        self.slow_call_rate_threshold = slow_call_rate_threshold  # 차단 느린 호출 비율 (%)
+        self.open_reason = None  # 마지막 OPEN 사유 (failure_rate | slow_call_rate | half_open_probe)
+        
+        # HALF_OPEN 시험 요청 (동시에 half_open_permits 개만 허용, required_successes 번 성공하면 CLOSED)
+        # 허가는 구간 번호(generation)가 붙은 _ProbePermit 으로 나가고, 이번 구간 허가를 가진 호출자의 결과만 반영
+        # (CLOSED 일 때 들어와 뒤늦게 끝난 호출이 회로를 닫거나 받지 않은 허가를 반환하지 않도록)
+        self.half_open_permits = max(1, half_open_permits)
+        self.half_open_required_successes = max(1, half_open_required_successes)
+        self.half_open_in_flight = 0
+        self.half_open_successes = 0
+        self.half_open_last_permit_time = 0
+        self.half_open_rejected_count = 0
+        self.half_open_generation = 0
+        
+        self.failure_count = 0  # 창 안의 실패 수
         self.last_failure_time = 0
+        self._snapshot = _BreakerSnapshot(self.STATE_CLOSED, 0)
+        self._stripes = [_RecordStripe() for _ in range(self.STRIPE_COUNT)]
         self.lock = threading.RLock()
         self.logger = logging.getLogger(f"circuit_breaker.{name}")
         
-        # 서킷 브레이커 상태 변화 콜백
+        # 서킷 브레이커 상태 변화 콜백 (lock 안에서 쌓아 두었다가 lock 밖에서 호출)
         self._state_change_callbacks = []
+        self._pending_state_changes = []
         
-        # 최근 쿼리 실행 시간 기록 (최근 1시간)
-        self.execution_times = deque(maxlen=1000)  # 최대 1000개 실행 시간 저장
-        self.last_execution_time_cleanup = time.time()
+        # 최근 쿼리 실행 시간 분포 (1분/5분/1시간 창, 고정 메모리)
+        self.latency_histogram = LatencyHistogram()
+    
+    @property
+    def state(self):
+        """현재 상태 (잠금 없이 스냅샷에서 읽음)"""
+        return self._snapshot.state
+    
+    def _publish(self, state=None):
+        """상태/재시도 시각 스냅샷 교체 (lock 보유 상태에서 호출)"""
+        self._snapshot = _BreakerSnapshot(state or self._snapshot.state, self.last_failure_time + self.reset_timeout)
     
     def allow_request(self):
-        """요청 허용 여부 결정"""
+        """요청 허용 여부 결정 - CLOSED 와 초기화 시간 전의 OPEN 은 잠금 없이 판단
+        
+        HALF_OPEN 시험 요청이면 True 대신 _ProbePermit 을 반환하므로, 호출자는 반환값을 그대로
+        report_success/report_failure/release_permit 에 넘긴다.
+        """
+        snapshot = self._snapshot
+        if snapshot.state == self.STATE_CLOSED:
+            return True
+        current_time = time.time()
+        if snapshot.state == self.STATE_OPEN and current_time <= snapshot.retry_time:
+            return False
+        
         with self.lock:
-            if self.state == self.STATE_CLOSED:
-                return True
-                
-            if self.state == self.STATE_OPEN:
-                # 초기화 시간이 지났는지 확인
-                if time.time() > self.last_failure_time + self.reset_timeout:
-                    self._change_state(self.STATE_HALF_OPEN)
-                    return True
-                return False
-                
-            if self.state == self.STATE_HALF_OPEN:
-                return True
+            allowed = self._allow_request_locked(current_time)
+        self._flush_state_changes()
+        return allowed
+    
+    def _allow_request_locked(self, current_time):
+        """OPEN/HALF_OPEN 상태의 요청 허용 여부 결정 (lock 보유 상태에서 호출)"""
+        if self.state == self.STATE_OPEN:
+            # 초기화 시간이 지났는지 확인
+            if current_time > self.last_failure_time + self.reset_timeout:
+                self.half_open_in_flight = 0
+                self.half_open_successes = 0
+                self.half_open_generation += 1
+                self._change_state(self.STATE_HALF_OPEN)
+                return self._acquire_probe_permit(current_time)
+            return False
+            
+        if self.state == self.STATE_HALF_OPEN:
+            return self._acquire_probe_permit(current_time)
+        
+        return True
+    
+    def _acquire_probe_permit(self, current_time):
+        """HALF_OPEN 시험 요청 허가 획득 - 허가가 모두 나가 있으면 즉시 거부 (lock 보유 상태에서 호출)"""
+        # 결과가 보고되지 않은 채 reset_timeout 이 지난 허가는 잃어버린 것으로 보고 회수
+        if self.half_open_in_flight >= self.half_open_permits and current_time > self.half_open_last_permit_time + self.reset_timeout:
+            self.logger.warning(f"[서킷브레이커-{self.name}] 결과가 보고되지 않은 시험 요청 허가 {self.half_open_in_flight}개 회수")
+            self.half_open_in_flight = 0
+            self.half_open_generation += 1   # 회수한 허가의 뒤늦은 결과는 반영하지 않음
+        
+        if self.half_open_in_flight >= self.half_open_permits:
+            self.half_open_rejected_count += 1
+            return False
         
+        self.half_open_in_flight += 1
+        self.half_open_last_permit_time = current_time
+        self.logger.info(f"[서킷브레이커-{self.name}] 시험 요청 허용 ({self.half_open_in_flight}/{self.half_open_permits}, 성공 {self.half_open_successes}/{self.half_open_required_successes})")
+        return _ProbePermit(self.half_open_generation)
+    
+    def _settle_probe_permit(self, permit):
+        """이번 HALF_OPEN 구간의 허가이면 정산하고 True - 허가 없이 들어온 호출이나 지난 구간 허가는 False (lock 보유 상태에서 호출)"""
+        if not isinstance(permit, _ProbePermit) or permit.settled or permit.generation != self.half_open_generation:
+            self.logger.info(f"[서킷브레이커-{self.name}] 시험 요청 허가가 없는 호출 결과 무시")
+            return False
+        permit.settled = True
+        self.half_open_in_flight = max(0, self.half_open_in_flight - 1)
         return True
     
-    def report_success(self):
-        """성공 보고"""
+    def report_success(self, permit=None):
+        """성공 보고 - CLOSED 이면 스레드별 버퍼에만 기록, HALF_OPEN 이면 시험 요청 허가(permit)를 가진 호출만 반영"""
+        if self._snapshot.state == self.STATE_CLOSED:
+            self._buffer_record(time.time(), False, False)
+            return
+        
         with self.lock:
             if self.state == self.STATE_HALF_OPEN:
-                self._change_state(self.STATE_CLOSED)
-                self.failure_count = 0
+                if not self._settle_probe_permit(permit):
+                    return
+                self.half_open_successes += 1
+                if self.half_open_successes >= self.half_open_required_successes:
+                    self._change_state(self.STATE_CLOSED)
+                    self._reset_window()
+            elif self.state == self.STATE_CLOSED:
+                self._record_outcome(False, time.time())
+        self._flush_state_changes()
     
-    def report_failure(self):
-        """실패 보고"""
+    def report_failure(self, permit=None):
+        """실패 보고 - HALF_OPEN 이면 시험 요청 허가(permit)를 가진 호출만 반영"""
         with self.lock:
-            self.failure_count += 1
-            self.last_failure_time = time.time()
+            if self.state == self.STATE_HALF_OPEN and not self._settle_probe_permit(permit):
+                return
+            current_time = time.time()
+            self.last_failure_time = current_time
             
-            if self.state == self.STATE_CLOSED and self.failure_count >= self.fail_threshold:
-                self._change_state(self.STATE_OPEN)
+            if self.state == self.STATE_CLOSED:
+                self._drain_stripes(current_time)
+                self._record_outcome(True, current_time)
+                calls, failures = self.window.snapshot(current_time)
+                if calls >= self.minimum_calls and self._rate(calls, failures) >= self.failure_rate_threshold:
+                    self.open_reason = "failure_rate"
+                    self._change_state(self.STATE_OPEN)
+                else:
+                    self.logger.info(f"[서킷브레이커-{self.name}] 실패 기록: {failures}/{calls}건 ({self._rate(calls, failures):.1f}%, 임계값 {self.failure_rate_threshold}%, 최소 호출 {self.minimum_calls}건)")
                 
             elif self.state == self.STATE_HALF_OPEN:
+                self.open_reason = "half_open_probe"
                 self._change_state(self.STATE_OPEN)
-                
-            else:
-                self.logger.info(f"[서킷브레이커-{self.name}] 실패 카운트 증가: {self.failure_count}/{self.fail_threshold}")
+            
+            # OPEN 중 들어온 실패는 재시도 시각을 늦춤
+            self._publish()
+        
+        self._flush_state_changes()
+    
+    def release_permit(self, permit=None):
+        """결과 없이 시험 요청 허가만 반환 - 호출자 취소처럼 하위 서비스 상태를 알 수 없이 끝난 요청 (성공/실패로 기록하지 않음)"""
+        if self._snapshot.state != self.STATE_HALF_OPEN:
+            return
+        
+        with self.lock:
+            if self.state == self.STATE_HALF_OPEN and self._settle_probe_permit(permit):
+                self.logger.info(f"[서킷브레이커-{self.name}] 결과 없이 끝난 시험 요청 허가 반환 ({self.half_open_in_flight}/{self.half_open_permits})")
+    
+    def _buffer_record(self, current_time, slow_sample, hit):
+        """CLOSED 상태 기록을 현재 스레드의 버퍼에 추가 (가득 차면 창에 반영)"""
+        stripe = self._stripes[threading.get_ident() % self.STRIPE_COUNT]
+        if stripe.append((current_time, slow_sample, hit)) >= self.STRIPE_FLUSH_SIZE:
+            with self.lock:
+                self._drain_stripes(time.time())
+    
+    def _drain_stripes(self, current_time):
+        """모든 버퍼의 기록을 창에 반영 - CLOSED 가 아니면 버림 (lock 보유 상태에서 호출)"""
+        closed = self.state == self.STATE_CLOSED
+        for stripe in self._stripes:
+            records = stripe.take()
+            if not closed:
+                continue
+            for record_time, slow_sample, hit in records:
+                window = self.slow_window if slow_sample else self.window
+                if not window.is_expired(record_time, current_time):
+                    window.record(hit, record_time)
+        if closed:
+            self.failure_count = self.window.snapshot(current_time)[1]
+    
+    def _record_outcome(self, failed, current_time):
+        """CLOSED 상태 호출 결과를 창에 기록 (lock 보유 상태에서 호출)"""
+        self.window.record(failed, current_time)
+        self.failure_count = self.window.snapshot(current_time)[1]
+    
+    def _record_slow_call(self, execution_time, current_time):
+        """실행 시간으로 느린 호출 여부 기록 후 비율이 임계값 이상이면 OPEN (lock 보유 상태에서 호출)"""
+        if self.slow_call_threshold <= 0:
+            return
+        slow = execution_time >= self.slow_call_threshold
+        
+        if self.state == self.STATE_HALF_OPEN:
+            # 시험 요청이 느리면 아직 회복되지 않은 것으로 보고 다시 차단
+            if slow:
+                self.last_failure_time = current_time
+                self.open_reason = "half_open_probe"
+                self._change_state(self.STATE_OPEN)
+            return
+        if self.state != self.STATE_CLOSED:
+            return
+        
+        self._drain_stripes(current_time)
+        self.slow_window.record(slow, current_time)
+        calls, slow_calls = self.slow_window.snapshot(current_time)
+        if slow and calls >= self.minimum_calls and self._rate(calls, slow_calls) >= self.slow_call_rate_threshold:
+            self.last_failure_time = current_time
+            self.open_reason = "slow_call_rate"
+            self._change_state(self.STATE_OPEN)
+    
+    def _rate(self, calls, hits):
+        return hits * 100.0 / calls if calls else 0.0
+    
+    def _reset_window(self):
+        """창 초기화 (CLOSED 로 돌아갈 때 이전 실패/느린 호출이 다시 차단하지 않도록)"""
+        for stripe in self._stripes:
+            stripe.take()
+        self.window.reset()
+        self.slow_window.reset()
+        self.failure_count = 0
+    
+    def get_stats(self):
+        """지표용 실패율 창 상태"""
+        with self.lock:
+            current_time = time.time()
+            self._drain_stripes(current_time)
+            calls, failures = self.window.snapshot(current_time)
+            timed_calls, slow_calls = self.slow_window.snapshot(current_time)
+            return {
+                "window_type": self.window.window_type,
+                "window_size": self.window.size,
+                "calls": calls,
+                "failures": failures,
+                "failure_rate": round(self._rate(calls, failures), 1),
+                "failure_rate_threshold": self.failure_rate_threshold,
+                "minimum_calls": self.minimum_calls,
+                "slow_call_threshold": self.slow_call_threshold,
+                "slow_calls": slow_calls,
+                "slow_call_rate": round(self._rate(timed_calls, slow_calls), 1),
+                "slow_call_rate_threshold": self.slow_call_rate_threshold,
+                "open_reason": self.open_reason or "none",
+                "half_open_permits": self.half_open_permits,
+                "half_open_in_flight": self.half_open_in_flight if self.state == self.STATE_HALF_OPEN else 0,
+                "half_open_successes": self.half_open_successes if self.state == self.STATE_HALF_OPEN else 0,
+                "half_open_required_successes": self.half_open_required_successes,
+                "half_open_rejected": self.half_open_rejected_count,
+            }
     
     def reset(self):
         """서킷브레이커 상태 강제 초기화"""
         with self.lock:
             old_state = self.state
-            self.state = self.STATE_CLOSED
-            self.failure_count = 0
+            self._reset_window()
             self.last_failure_time = 0
+            self.open_reason = None
+            self._publish(self.STATE_CLOSED)
             self.logger.info(f"[서킷브레이커-{self.name}] 상태 수동 초기화: CLOSED")
             
-            # 상태 변경 콜백 실행
             if old_state != self.STATE_CLOSED:
-                self._notify_state_change(old_state, self.STATE_CLOSED)
+                self._pending_state_changes.append((old_state, self.STATE_CLOSED))
+        
+        # 상태 변경 콜백 실행
+        self._flush_state_changes()
     
     def record_execution_time(self, execution_time):
-        """실행 시간 기록"""
-        with self.lock:
-            current_time = time.time()
-            self.execution_times.append((current_time, execution_time))
-            
-            # 1시간에 한 번 정도 오래된 기록 정리 (매번 하면 성능에 영향)
-            if current_time - self.last_execution_time_cleanup > 3600:
-                self._cleanup_old_execution_times()
-                self.last_execution_time_cleanup = current_time
-    
-    def _cleanup_old_execution_times(self):
-        """1시간 이상 지난 실행 시간 기록 제거"""
-        one_hour_ago = time.time() - 3600
-        self.execution_times = deque(
-            [(t, e) for t, e in self.execution_times if t >= one_hour_ago],
-            maxlen=self.execution_times.maxlen
-        )
-    
-    def get_recent_execution_times(self, window_seconds=3600):
-        """최근 지정 시간 (기본 1시간) 내 실행 시간 목록 반환"""
-        with self.lock:
-            current_time = time.time()
-            cutoff_time = current_time - window_seconds
-            return [e for t, e in self.execution_times if t >= cutoff_time]
+        """실행 시간 기록 - CLOSED 상태의 빠른 호출은 잠금 없이 버퍼에만 기록"""
+        current_time = time.time()
+        self.latency_histogram.record(execution_time, current_time)
+        
+        if self.slow_call_threshold > 0:
+            slow = execution_time >= self.slow_call_threshold
+            if not slow and self._snapshot.state == self.STATE_CLOSED:
+                self._buffer_record(current_time, True, False)
+            else:
+                with self.lock:
+                    self._record_slow_call(execution_time, current_time)
+                self._flush_state_changes()
+    
+    def get_execution_time_snapshot(self, window_seconds=3600):
+        """최근 지정 시간 (기본 1시간) 실행 시간 분포 스냅샷 (count/mean/percentile)"""
+        return self.latency_histogram.snapshot(window_seconds)
     
     def calculate_percentile_execution_time(self, percentile=95, window_seconds=3600):
-        """최근 실행 시간의 지정된 백분위수 계산"""
-        times = self.get_recent_execution_times(window_seconds)
-        if not times:
-            return None
-            
-        sorted_times = sorted(times)
-        index = int(len(sorted_times) * percentile / 100)
-        return sorted_times[index]
+        """최근 실행 시간의 지정된 백분위수 계산 (기록이 없으면 None)"""
+        return self.latency_histogram.percentile(percentile, window_seconds)
+    
+    def get_latency_stats(self):
+        """지표용 창별(1m/5m/1h) 실행 시간 개수/평균/p50/p95/p99"""
+        return self.latency_histogram.get_stats()
     
     def add_state_change_callback(self, callback):
         """상태 변화 콜백 함수 추가"""
         self._state_change_callbacks.append(callback)
     
     def _change_state(self, new_state):
-        """서킷 브레이커 상태 변경 및 콜백 실행"""
+        """서킷 브레이커 상태 변경 및 콜백 예약 (lock 보유 상태에서 호출)"""
         old_state = self.state
-        self.state = new_state
+        self._publish(new_state)
         
         # 상태 변화 로깅
-        if new_state == self.STATE_OPEN:
-            self.logger.warning(f"[서킷브레이커-{self.name}] 실패 임계값 도달({self.failure_count}/{self.fail_threshold}), 상태 변경: {old_state} -> {new_state}")
+        if new_state == self.STATE_OPEN and old_state == self.STATE_HALF_OPEN:
+            self.logger.warning(f"[서킷브레이커-{self.name}] 시험 요청 실패, 상태 변경: {old_state} -> {new_state}")
+        elif new_state == self.STATE_OPEN and self.open_reason == "slow_call_rate":
+            calls, slow_calls = self.slow_window.snapshot(time.time())
+            self.logger.warning(f"[서킷브레이커-{self.name}] 느린 호출 비율 임계값 도달({slow_calls}/{calls}건이 {self.slow_call_threshold}초 이상, {self._rate(calls, slow_calls):.1f}% >= {self.slow_call_rate_threshold}%), 상태 변경: {old_state} -> {new_state}")
+        elif new_state == self.STATE_OPEN:
+            calls, failures = self.window.snapshot(time.time())
+            self.logger.warning(f"[서킷브레이커-{self.name}] 실패율 임계값 도달({failures}/{calls}건, {self._rate(calls, failures):.1f}% >= {self.failure_rate_threshold}%), 상태 변경: {old_state} -> {new_state}")
         elif new_state == self.STATE_HALF_OPEN:
             self.logger.info(f"[서킷브레이커-{self.name}] 초기화 시간 경과, 상태 변경: {old_state} -> {new_state}")
         elif new_state == self.STATE_CLOSED:
-            self.logger.info(f"[서킷브레이커-{self.name}] 요청 성공, 상태 변경: {old_state} -> {new_state}")
+            self.logger.info(f"[서킷브레이커-{self.name}] 시험 요청 {self.half_open_successes}건 성공, 상태 변경: {old_state} -> {new_state}")
         
-        # 상태 변경 콜백 실행
-        self._notify_state_change(old_state, new_state)
+        # 상태 변경 콜백은 lock 을 놓은 뒤 _flush_state_changes 에서 실행
+        self._pending_state_changes.append((old_state, new_state))
+    
+    def _flush_state_changes(self):
+        """lock 안에서 쌓인 상태 변화를 lock 밖에서 콜백으로 전달 (콜백이 다른 요청을 막지 않도록)"""
+        if not self._pending_state_changes:
+            return
+        with self.lock:
+            changes, self._pending_state_changes = self._pending_state_changes, []
+        for old_state, new_state in changes:
+            self._notify_state_change(old_state, new_state)
     
     def _notify_state_change(self, old_state, new_state):
         """등록된 모든 콜백 함수 호출"""
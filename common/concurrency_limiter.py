@@ -0,0 +1,146 @@
+import math
+from abc import ABC, abstractmethod
+
+class _ConcurrencyLimit(ABC):
+    """관측된 RTT 로 동시 처리 한도를 조정하는 제한기 공통 부분"""
+
+    algorithm = None
+
+    def __init__(self, initial_limit, min_limit=1, max_limit=200):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(self._clamp(initial_limit))
+        self.sample_count = 0
+        self.drop_count = 0
+
+    def _clamp(self, limit):
+        """한도를 [min_limit, max_limit] 범위로 제한"""
+        return max(self.min_limit, min(limit, self.max_limit))
+
+    def get_limit(self):
+        """현재 동시 처리 한도 (정수)"""
+        return int(self.limit)
+
+    def on_sample(self, rtt, in_flight, dropped=False):
+        """RTT 표본 또는 실패(드롭) 반영 후 새 한도 반환"""
+        if dropped:
+            self.drop_count += 1
+        else:
+            self.sample_count += 1
+        self.limit = float(self._clamp(self._update(rtt, in_flight, dropped)))
+        return self.get_limit()
+
+    @abstractmethod
+    def _update(self, rtt, in_flight, dropped):
+        """표본 하나를 반영한 새 한도 (범위 제한 전)"""
+
+    def get_stats(self):
+        """지표용 현재 상태"""
+        return {
+            "algorithm": self.algorithm,
+            "limit": self.get_limit(),
+            "samples": self.sample_count,
+            "drops": self.drop_count,
+        }
+
+class AimdLimit(_ConcurrencyLimit):
+    """AIMD - 한도를 절반 이상 사용 중이면 1씩 늘리고, 실패 시 backoff_ratio 배로 줄임"""
+
+    algorithm = "aimd"
+
+    def __init__(self, initial_limit, min_limit=1, max_limit=200, backoff_ratio=0.9):
+        super().__init__(initial_limit, min_limit, max_limit)
+        self.backoff_ratio = backoff_ratio
+
+    def _update(self, rtt, in_flight, dropped):
+        if dropped:
+            return self.limit * self.backoff_ratio
+        # 한도를 다 쓰지 않는 동안에는 늘릴 근거가 없음
+        if in_flight * 2 >= self.limit:
+            return self.limit + 1
+        return self.limit
+
+class VegasLimit(_ConcurrencyLimit):
+    """Vegas - 최소 RTT 대비 현재 RTT 로 대기열 길이를 추정해 alpha~beta 범위에 맞춤"""
+
+    algorithm = "vegas"
+
+    def __init__(self, initial_limit, min_limit=1, max_limit=200):
+        super().__init__(initial_limit, min_limit, max_limit)
+        self.rtt_noload = None  # 부하 없을 때의 RTT (관측된 최소값)
+
+    def _update(self, rtt, in_flight, dropped):
+        log_limit = max(1.0, math.log10(self.limit))
+        if dropped:
+            return self.limit - log_limit
+
+        if self.rtt_noload is None or rtt < self.rtt_noload:
+            self.rtt_noload = rtt
+        if rtt <= 0 or in_flight * 2 < self.limit:
+            return self.limit
+
+        queue_size = self.limit * (1 - self.rtt_noload / rtt)
+        alpha = 3 * log_limit
+        beta = 6 * log_limit
+        if queue_size <= log_limit:
+            return self.limit + beta
+        if queue_size < alpha:
+            return self.limit + log_limit
+        if queue_size > beta:
+            return self.limit - log_limit
+        return self.limit
+
+    def get_stats(self):
+        stats = super().get_stats()
+        stats["rtt_noload"] = self.rtt_noload if self.rtt_noload is not None else 0.0
+        return stats
+
+class GradientLimit(_ConcurrencyLimit):
+    """Gradient - 장기 평균 RTT 와 현재 RTT 의 비율(기울기)로 한도를 곱해 조정"""
+
+    algorithm = "gradient"
+
+    def __init__(self, initial_limit, min_limit=1, max_limit=200, tolerance=1.5, smoothing=0.2, long_window=600):
+        super().__init__(initial_limit, min_limit, max_limit)
+        self.tolerance = tolerance        # 장기 RTT 대비 허용 배율
+        self.smoothing = smoothing        # 새 한도 반영 비율
+        self.long_window = long_window    # 장기 RTT 지수 이동 평균 표본 수
+        self.long_rtt = None
+
+    def _update(self, rtt, in_flight, dropped):
+        if dropped:
+            return self.limit * 0.9
+        if rtt <= 0:
+            return self.limit
+
+        if self.long_rtt is None:
+            self.long_rtt = rtt
+        else:
+            self.long_rtt += (rtt - self.long_rtt) / self.long_window
+
+        # 한도를 절반도 쓰지 않으면 RTT 가 좋아도 늘리지 않음
+        if in_flight * 2 < self.limit:
+            return self.limit
+
+        gradient = max(0.5, min(1.0, self.tolerance * self.long_rtt / rtt))
+        new_limit = self.limit * gradient + math.sqrt(self.limit)
+        return self.limit * (1 - self.smoothing) + new_limit * self.smoothing
+
+    def get_stats(self):
+        stats = super().get_stats()
+        stats["long_rtt"] = self.long_rtt if self.long_rtt is not None else 0.0
+        return stats
+
+CONCURRENCY_LIMIT_ALGORITHMS = ("static", "aimd", "vegas", "gradient")
+
+def create_concurrency_limit(algorithm, initial_limit, min_limit=1, max_limit=200):
+    """알고리즘 이름으로 적응형 동시성 제한기 생성 (static 이면 None)"""
+    if algorithm == "static":
+        return None
+    if algorithm == "aimd":
+        return AimdLimit(initial_limit, min_limit, max_limit)
+    if algorithm == "vegas":
+        return VegasLimit(initial_limit, min_limit, max_limit)
+    if algorithm == "gradient":
+        return GradientLimit(initial_limit, min_limit, max_limit)
+    raise ValueError(f"알 수 없는 동시성 제한 알고리즘: {algorithm} (지원: {', '.join(CONCURRENCY_LIMIT_ALGORITHMS)})")
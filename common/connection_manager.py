@@ -0,0 +1,171 @@
+import time
+import threading
+import logging
+import grpc
+
+class _Connection:
+    """주소 하나에 대한 멀티플렉싱 채널과 연결 상태"""
+
+    def __init__(self, address):
+        self.address = address
+        self.channel = None
+        self.stub = None
+        self.state = None
+        self.last_state_change = time.time()
+        self.reconnect_count = 0   # 연결 실패 후 채널이 다시 READY 가 된 횟수
+        self.failure_count = 0
+        self.failed = False        # 마지막 READY 이후 연결 실패가 있었는지
+
+class ConnectionManager:
+    """키(백엔드 타입 등)별 gRPC 채널/스텁 관리 - 주소당 하나의 채널을 공유
+
+    연결이 끊기면 채널이 자체 백오프(grpc.initial/max_reconnect_backoff_ms)로 다시 연결하므로 채널을 새로 만들지 않는다.
+    이미 나간 스텁이 계속 같은 채널을 쓰므로, 채널은 주소가 바뀌거나 close 할 때만 닫는다.
+    """
+
+    def __init__(self, addresses, stub_class, options=None, channel_factory=None,
+                 initial_backoff=1.0, max_backoff=30.0, name="default"):
+        self.name = name
+        self.stub_class = stub_class
+        # 재연결 백오프는 채널 옵션으로 전달 (배수는 gRPC 기본값 1.6 고정)
+        self.options = list(options or []) + [
+            ("grpc.initial_reconnect_backoff_ms", int(initial_backoff * 1000)),
+            ("grpc.max_reconnect_backoff_ms", int(max_backoff * 1000)),
+        ]
+        self.channel_factory = channel_factory or (lambda address, options: grpc.insecure_channel(address, options=options))
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+
+        self.addresses = {}      # 키 -> 주소
+        self._connections = {}   # 주소 -> _Connection
+        self.lock = threading.RLock()
+        self.logger = logging.getLogger(f"connection_manager.{name}")
+
+        for key, address in addresses.items():
+            self.set_address(key, address)
+
+    def _open(self, connection):
+        """연결 채널 생성 및 상태 구독 (lock 보유 상태에서 호출)"""
+        channel = self.channel_factory(connection.address, self.options)
+        connection.channel = channel
+        connection.stub = self.stub_class(channel)
+        connection.state = None
+        channel.subscribe(self._make_state_callback(connection, channel), try_to_connect=True)
+
+    def _make_state_callback(self, connection, channel):
+        """채널 연결 상태 변화 콜백 생성"""
+        def callback(state):
+            with self.lock:
+                # 주소 변경으로 교체된 이전 채널의 콜백은 무시
+                if connection.channel is not channel:
+                    return
+
+                old_state = connection.state
+                connection.state = state
+                connection.last_state_change = time.time()
+
+                if state == grpc.ChannelConnectivity.TRANSIENT_FAILURE and old_state != state:
+                    connection.failure_count += 1
+                    connection.failed = True
+                elif state == grpc.ChannelConnectivity.READY and connection.failed:
+                    connection.reconnect_count += 1
+                    connection.failed = False
+
+            if old_state != state:
+                if state == grpc.ChannelConnectivity.TRANSIENT_FAILURE:
+                    self.logger.warning(f"[연결관리-{self.name}] {connection.address} 연결 실패, 채널 백오프로 재연결 대기 (최대 {self.max_backoff:.1f}초)")
+                else:
+                    self.logger.info(f"[연결관리-{self.name}] {connection.address} 상태 변경: {old_state} -> {state}")
+        return callback
+
+    def set_address(self, key, address):
+        """키의 주소 설정 (주소가 바뀌면 새 채널로 교체)"""
+        old_channel = None
+        with self.lock:
+            old_address = self.addresses.get(key)
+            if old_address == address:
+                return
+
+            self.addresses[key] = address
+            if address not in self._connections:
+                connection = _Connection(address)
+                self._open(connection)
+                self._connections[address] = connection
+
+            # 더 이상 사용하는 키가 없는 주소의 채널은 정리
+            if old_address is not None and old_address not in self.addresses.values():
+                old_channel = self._connections.pop(old_address).channel
+
+        if old_channel is not None:
+            old_channel.close()
+        self.logger.info(f"[연결관리-{self.name}] {key} 주소 설정: {old_address} -> {address}")
+
+    def get_stub(self, key):
+        """키에 해당하는 스텁 반환"""
+        with self.lock:
+            return self._connections[self.addresses[key]].stub
+
+    def get_health(self):
+        """키별 채널 상태 반환"""
+        with self.lock:
+            health = {}
+            for key, address in self.addresses.items():
+                connection = self._connections[address]
+                health[key] = {
+                    "address": address,
+                    "state": connection.state.name if connection.state is not None else "UNKNOWN",
+                    "state_age": time.time() - connection.last_state_change,
+                    "failure_count": connection.failure_count,
+                    "reconnect_count": connection.reconnect_count,
+                }
+            return health
+
+    def close(self):
+        """모든 채널 종료"""
+        with self.lock:
+            connections = list(self._connections.values())
+            self._connections = {}
+            self.addresses = {}
+
+        for connection in connections:
+            connection.channel.close()
+        self.logger.info(f"[연결관리-{self.name}] 모든 채널 종료")
+
+class AsyncConnectionManager:
+    """grpc.aio 채널용 키별 스텁 관리 - 주소당 하나의 채널 공유 (재연결은 gRPC 내부 백오프 사용)"""
+
+    def __init__(self, addresses, stub_class, options=None, name="default"):
+        self.name = name
+        self.stub_class = stub_class
+        self.options = options or []
+        self.addresses = dict(addresses)
+        self._channels = {}   # 주소 -> aio 채널
+        self._stubs = {}      # 주소 -> 스텁
+        self.logger = logging.getLogger(f"connection_manager.{name}")
+
+        # aio 채널은 실행 중인 이벤트 루프에서 생성해야 함
+        for address in set(self.addresses.values()):
+            channel = grpc.aio.insecure_channel(address, options=self.options)
+            self._channels[address] = channel
+            self._stubs[address] = self.stub_class(channel)
+
+    def get_stub(self, key):
+        """키에 해당하는 스텁 반환"""
+        return self._stubs[self.addresses[key]]
+
+    def get_health(self):
+        """키별 채널 상태 반환"""
+        health = {}
+        for key, address in self.addresses.items():
+            state = self._channels[address].get_state(try_to_connect=False)
+            health[key] = {
+                "address": address,
+                "state": state.name,
+            }
+        return health
+
+    async def close(self):
+        """모든 채널 종료"""
+        for channel in self._channels.values():
+            await channel.close()
+        self.logger.info(f"[연결관리-{self.name}] 모든 aio 채널 종료")
@@ -1,15 +1,50 @@
 import time
 import logging
+import threading
 import grpc
-from collections import deque
+from collections import OrderedDict
+
+from common.quantile_estimator import WindowedQuantileEstimator
+from common.cancellation import call_cancellable
+
+# 인바운드 남은 시간이 이보다 크면 데드라인 없는 호출로 봄 (스레드풀 서버는 데드라인이 없을 때 매우 큰 값을 반환)
+NO_DEADLINE_REMAINING = 1e9
+
+class DeadlineBudgetExhausted(grpc.RpcError):
+    """상위 호출의 남은 시간이 안전 여유 이하라 하위 호출을 보내지 않음 (DEADLINE_EXCEEDED 로 처리)"""
+    
+    def __init__(self, remaining):
+        super().__init__()
+        self.remaining = remaining
+    
+    def code(self):
+        return grpc.StatusCode.DEADLINE_EXCEEDED
+    
+    def details(self):
+        return f"상위 호출의 데드라인 예산 소진 (남은 시간 {self.remaining:.3f}초)"
+
+def inbound_time_remaining(context):
+    """인바운드 호출의 남은 시간(초) - context 가 없거나 데드라인이 없으면 None"""
+    if context is None:
+        return None
+    remaining = context.time_remaining()
+    if remaining is None or remaining > NO_DEADLINE_REMAINING:
+        return None
+    return remaining
 
 class DeadlineHandler:
-    """데드라인 패턴 구현"""
+    """데드라인 패턴 구현
+    
+    하위 호출 타임아웃은 로컬 타임아웃과 (인바운드 남은 시간 - safety_margin) 중 작은 값을 사용하고,
+    남은 예산이 없으면 하위 호출을 보내지 않고 바로 실패한다 (상위가 이미 포기한 요청의 하위 작업 낭비 방지).
+    """
     
-    def __init__(self, timeout_seconds=2, name="default"):
+    def __init__(self, timeout_seconds=2, name="default", safety_margin=0.05, logger=None):
         self.name = name
         self.timeout_seconds = timeout_seconds
-        self.logger = logging.getLogger(f"deadline.{name}")
+        self.safety_margin = safety_margin  # 응답을 돌려보낼 시간으로 남겨 둘 여유 (초)
+        self.budget_exhausted_count = 0  # 예산 소진으로 하위 호출 없이 실패한 횟수
+        self.logger = logger or logging.getLogger(f"deadline.{name}")
     
     def set_deadline(self, context=None):
         """데드라인 설정"""
@@ -30,14 +65,45 @@ class DeadlineHandler:
         self.timeout_seconds = timeout_seconds
         self.logger.info(f"[데드라인-{self.name}] 타임아웃 값 변경: {self.timeout_seconds}초")
     
-    def call_with_deadline(self, stub_method, request, context=None):
-        """데드라인과 함께 gRPC 메서드 호출"""
+    def outbound_timeout(self, context=None, use_local_timeout=True):
+        """하위 호출 타임아웃 - min(로컬 타임아웃, 인바운드 남은 시간 - 안전 여유), 둘 다 없으면 None (0 이면 예산 소진)"""
+        local_timeout = self.timeout_seconds if use_local_timeout else None
+        remaining = inbound_time_remaining(context)
+        if remaining is None:
+            return local_timeout
+        budget = max(0.0, remaining - self.safety_margin)
+        return budget if local_timeout is None else min(local_timeout, budget)
+    
+    def check_budget(self, context):
+        """인바운드 남은 시간이 안전 여유 이하이면 DeadlineBudgetExhausted 반환 (아니면 None)"""
+        remaining = inbound_time_remaining(context)
+        if remaining is None or remaining > self.safety_margin:
+            return None
+        self.budget_exhausted_count += 1
+        self.logger.warning(f"[데드라인-{self.name}] 상위 호출 데드라인 예산 소진 (남은 시간 {remaining:.3f}초, 안전 여유 {self.safety_margin}초) - 하위 호출 생략")
+        return DeadlineBudgetExhausted(remaining)
+    
+    def get_stats(self):
+        """지표용 데드라인 설정/예산 소진 횟수"""
+        return {
+            "timeout": round(self.timeout_seconds, 3),
+            "safety_margin": self.safety_margin,
+            "budget_exhausted": self.budget_exhausted_count,
+        }
+    
+    def call_with_deadline(self, stub_method, request, context=None, metadata=None):
+        """데드라인과 함께 gRPC 메서드 호출 (context 가 있으면 인바운드 남은 시간으로 타임아웃 제한, 인바운드 호출이 끝나면 취소)"""
+        error = self.check_budget(context)
+        if error is not None:
+            return None, error
+        
         try:
             start_time = time.time()
             deadline = self.set_deadline(context)
+            timeout = self.outbound_timeout(context)
             
-            self.logger.info(f"[데드라인-{self.name}] 요청 시작 (타임아웃: {self.timeout_seconds}초)")
-            response = stub_method(request, timeout=self.timeout_seconds)
+            self.logger.info(f"[데드라인-{self.name}] 요청 시작 (타임아웃: {timeout:.3f}초)")
+            response = call_cancellable(stub_method, request, context, timeout=timeout, metadata=metadata)
             
             elapsed = time.time() - start_time
             self.logger.info(f"[데드라인-{self.name}] 요청 성공 (소요 시간: {elapsed:.2f}초)")
@@ -47,6 +113,36 @@ class DeadlineHandler:
             elapsed = time.time() - start_time
             if e.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
                 self.logger.error(f"[데드라인-{self.name}] 타임아웃 발생 (소요 시간: {elapsed:.2f}초)")
+            elif e.code() == grpc.StatusCode.CANCELLED:
+                self.logger.warning(f"[데드라인-{self.name}] 상위 호출이 끝나 요청 취소 (소요 시간: {elapsed:.2f}초)")
+            else:
+                self.logger.error(f"[데드라인-{self.name}] gRPC 오류: {e.code()}, {e.details()}")
+            return None, e
+    
+    async def call_with_deadline_async(self, stub_method, request, context=None, metadata=None):
+        """데드라인과 함께 gRPC 메서드 비동기 호출 (grpc.aio 스텁용)"""
+        error = self.check_budget(context)
+        if error is not None:
+            return None, error
+        
+        try:
+            start_time = time.time()
+            deadline = self.set_deadline(context)
+            timeout = self.outbound_timeout(context)
+            
+            self.logger.info(f"[데드라인-{self.name}] 비동기 요청 시작 (타임아웃: {timeout:.3f}초)")
+            response = await stub_method(request, timeout=timeout, metadata=metadata)
+            
+            elapsed = time.time() - start_time
+            self.logger.info(f"[데드라인-{self.name}] 비동기 요청 성공 (소요 시간: {elapsed:.2f}초)")
+            return response, None
+            
+        except grpc.RpcError as e:
+            elapsed = time.time() - start_time
+            if e.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
+                self.logger.error(f"[데드라인-{self.name}] 타임아웃 발생 (소요 시간: {elapsed:.2f}초)")
+            elif e.code() == grpc.StatusCode.CANCELLED:
+                self.logger.warning(f"[데드라인-{self.name}] 상위 호출이 끝나 요청 취소 (소요 시간: {elapsed:.2f}초)")
             else:
                 self.logger.error(f"[데드라인-{self.name}] gRPC 오류: {e.code()}, {e.details()}")
             return None, e
@@ -54,13 +150,14 @@ class DeadlineHandler:
 class AdaptiveDeadlineHandler(DeadlineHandler):
     """적응형 데드라인 패턴 구현"""
 
-    def __init__(self, initial_timeout=2.0, name="adaptive", window_size=100):
-        super().__init__(timeout_seconds=initial_timeout, name=name)
-        self.execution_times = deque(maxlen=window_size)  # 최근 실행 시간 기록
+    def __init__(self, initial_timeout=2.0, name="adaptive", window_size=100, safety_margin=0.05, logger=None):
+        super().__init__(timeout_seconds=initial_timeout, name=name, safety_margin=safety_margin, logger=logger)
         self.window_size = window_size  # 분석할 최근 쿼리 수
         self.update_interval = 5  # 몇 개의 쿼리마다 타임아웃을 업데이트할지 (10에서 5로 줄임)
         self.query_counter = 0
         self.percentile = 95  # p95 사용
+        # 최근 실행 시간의 p95 추정기 (표본을 저장/정렬하지 않고 표본당 O(1) 갱신)
+        self.execution_time_estimator = WindowedQuantileEstimator(self.percentile / 100, window_size)
         self.margin = 5.0  # 마진을 1.5에서 5.0으로 크게 증가
         self.min_timeout = 0.1  # 최소 타임아웃 값 (초)
         self.max_timeout = 10.0  # 최대 타임아웃 값 (초)
@@ -73,7 +170,7 @@ class AdaptiveDeadlineHandler(DeadlineHandler):
     
     def record_execution_time(self, execution_time):
         """실행 시간을 기록하고 필요시 타임아웃 업데이트"""
-        self.execution_times.append(execution_time)
+        self.execution_time_estimator.add(execution_time)
         
         # 카운터 증가 및 필요시 타임아웃 업데이트
         self.query_counter += 1
@@ -91,14 +188,11 @@ class AdaptiveDeadlineHandler(DeadlineHandler):
     
     def update_timeout(self):
         """측정된 실행 시간을 기반으로 타임아웃 값 업데이트"""
-        if not self.execution_times:
+        # p95 추정값 (O(1) 조회)
+        p95_value = self.execution_time_estimator.value()
+        if p95_value is None:
             return
         
-        # p95 계산
-        sorted_times = sorted(self.execution_times)
-        p95_index = min(int(len(sorted_times) * self.percentile / 100), len(sorted_times) - 1)
-        p95_value = sorted_times[p95_index]
-        
         # 여유를 더한 새 타임아웃 계산
         new_timeout = p95_value * self.margin
         
@@ -121,16 +215,14 @@ class AdaptiveDeadlineHandler(DeadlineHandler):
     def _adjust_timeout_based_on_circuit_breaker(self, circuit_breaker):
         """서킷브레이커 트리거 시 타임아웃 값 조정"""
         # 서킷브레이커에서 최근 1시간 내 실행 시간 데이터 가져오기
-        execution_times = circuit_breaker.get_recent_execution_times(3600)  # 1시간
+        execution_times = circuit_breaker.get_execution_time_snapshot(3600)  # 1시간
         
-        if not execution_times or len(execution_times) < 5:  # 데이터가 충분하지 않으면 조정하지 않음
+        if execution_times.count < 5:  # 데이터가 충분하지 않으면 조정하지 않음
             self.logger.warning(f"[데드라인-{self.name}] 충분한 실행 시간 데이터가 없어 타임아웃 조정 불가")
             return
         
-        # p99 계산 (더 보수적인 값)
-        sorted_times = sorted(execution_times)
-        p99_index = min(int(len(sorted_times) * 99 / 100), len(sorted_times) - 1)
-        p99_value = sorted_times[p99_index]
+        # p99 계산 (더 보수적인 값, 히스토그램 버킷 순회만 하고 정렬하지 않음)
+        p99_value = execution_times.percentile(99)
         
         # 여유를 더한 새 타임아웃 계산 (더 큰 마진)
         new_timeout = p99_value * 8.0  # 2.0에서 8.0으로 마진 증가
@@ -152,7 +244,7 @@ class AdaptiveDeadlineHandler(DeadlineHandler):
         circuit_breaker.add_state_change_callback(self.circuit_breaker_triggered_callback)
         self.logger.info(f"[데드라인-{self.name}] 서킷브레이커({circuit_breaker.name}) 연동 완료")
 
-    def call_with_deadline_and_record(self, stub_method, request, context=None):
+    def call_with_deadline_and_record(self, stub_method, request, context=None, metadata=None):
         """데드라인을 설정하고 실행 시간 기록"""
         # 매 요청마다 현재 타임아웃 값 로깅
         self.logger.info(f"[데드라인-{self.name}] 현재 적용 타임아웃: {self.timeout_seconds:.3f}초")
@@ -160,19 +252,115 @@ class AdaptiveDeadlineHandler(DeadlineHandler):
         start_time = time.time()
         
         try:
-            response, error = self.call_with_deadline(stub_method, request, context)
+            response, error = self.call_with_deadline(stub_method, request, context, metadata)
+            
+            # 성공 시에만 실행 시간 기록
+            if error is None:
+                self._record_call(time.time() - start_time)
+            
+            return response, error
+            
+        except Exception as e:
+            self.logger.error(f"[데드라인-{self.name}] 예외 발생: {str(e)}")
+            raise
+    
+    async def call_with_deadline_and_record_async(self, stub_method, request, context=None, metadata=None):
+        """데드라인을 설정하고 실행 시간 기록 (grpc.aio 스텁용)"""
+        self.logger.info(f"[데드라인-{self.name}] 현재 적용 타임아웃: {self.timeout_seconds:.3f}초")
+        
+        start_time = time.time()
+        
+        try:
+            response, error = await self.call_with_deadline_async(stub_method, request, context, metadata)
             
             # 성공 시에만 실행 시간 기록
             if error is None:
-                execution_time = time.time() - start_time
-                self.record_execution_time(execution_time)
-                
-                # 서킷브레이커가 설정되어 있으면 실행 시간 기록
-                if self.circuit_breaker:
-                    self.circuit_breaker.record_execution_time(execution_time)
+                self._record_call(time.time() - start_time)
             
             return response, error
             
         except Exception as e:
             self.logger.error(f"[데드라인-{self.name}] 예외 발생: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+    
+    def _record_call(self, execution_time):
+        """성공한 호출의 실행 시간을 핸들러와 서킷브레이커에 기록"""
+        self.record_execution_time(execution_time)
+        
+        # 서킷브레이커가 설정되어 있으면 실행 시간 기록
+        if self.circuit_breaker:
+            self.circuit_breaker.record_execution_time(execution_time)
+
+class DeadlineRegistry:
+    """경로(대상, 메서드, 요청 유형)별 적응형 데드라인 - slow/normal 처럼 지연 분포가 다른 호출의 p95 를 섞지 않음
+    
+    호출하는 쪽은 클라이언트가 보낸 값을 그대로 쓰지 말고 정규화한 키(알려진 대상, slow/normal)를 넘긴다.
+    경로는 최대 max_routes 개까지 유지하고, 넘치면 가장 오래 사용하지 않은 경로부터 제거한다 (LRU).
+    서킷브레이커 상태 변화 콜백은 레지스트리가 한 번만 등록하고 살아 있는 경로 핸들러에 전달한다.
+    """
+    
+    def __init__(self, initial_timeout=2.0, name="registry", max_routes=64, window_size=100, safety_margin=0.05):
+        self.initial_timeout = initial_timeout
+        self.name = name
+        self.max_routes = max(1, max_routes)
+        self.window_size = window_size
+        self.safety_margin = safety_margin
+        self.routes = OrderedDict()  # (target, method, request_type) -> AdaptiveDeadlineHandler (최근 사용 순)
+        self.evicted_count = 0
+        self.circuit_breaker = None
+        self.lock = threading.Lock()
+        self.logger = logging.getLogger(f"deadline.{name}")
+    
+    def get(self, target, method, request_type):
+        """경로의 적응형 데드라인 핸들러 반환 (없으면 초기 타임아웃으로 생성)"""
+        key = (target, method, request_type)
+        with self.lock:
+            handler = self.routes.get(key)
+            if handler is not None:
+                self.routes.move_to_end(key)
+                return handler
+            
+            handler = AdaptiveDeadlineHandler(
+                initial_timeout=self.initial_timeout,
+                name=f"{self.name}.{target}.{method}.{request_type}",
+                window_size=self.window_size,
+                safety_margin=self.safety_margin,
+                logger=self.logger   # 경로마다 로거를 만들면 logging 모듈에 계속 쌓이므로 공유
+            )
+            # 실행 시간 기록만 연동 (상태 변화 콜백은 레지스트리에서 전달)
+            handler.circuit_breaker = self.circuit_breaker
+            self.routes[key] = handler
+            
+            if len(self.routes) > self.max_routes:
+                evicted_key, _ = self.routes.popitem(last=False)
+                self.evicted_count += 1
+                self.logger.info(f"[데드라인-{self.name}] 오래 사용하지 않은 경로 제거: {'/'.join(evicted_key)} (최대 {self.max_routes}개)")
+            return handler
+    
+    def set_circuit_breaker(self, circuit_breaker):
+        """서킷브레이커 설정 및 콜백 등록 (경로 수와 관계없이 한 번만 등록)"""
+        self.circuit_breaker = circuit_breaker
+        with self.lock:
+            for handler in self.routes.values():
+                handler.circuit_breaker = circuit_breaker
+        circuit_breaker.add_state_change_callback(self.circuit_breaker_triggered_callback)
+        self.logger.info(f"[데드라인-{self.name}] 서킷브레이커({circuit_breaker.name}) 연동 완료")
+    
+    def circuit_breaker_triggered_callback(self, circuit_breaker, old_state, new_state):
+        """서킷브레이커 상태 변화를 모든 경로 핸들러에 전달"""
+        with self.lock:
+            handlers = list(self.routes.values())
+        for handler in handlers:
+            handler.circuit_breaker_triggered_callback(circuit_breaker, old_state, new_state)
+    
+    def get_stats(self):
+        """지표용 경로별 현재 타임아웃 (키 예: route.all.Process.slow)"""
+        with self.lock:
+            stats = {
+                "routes": len(self.routes),
+                "max_routes": self.max_routes,
+                "evicted": self.evicted_count,
+            }
+            for (target, method, request_type), handler in self.routes.items():
+                stats[f"route.{target}.{method}.{request_type}"] = round(handler.timeout_seconds, 3)
+            return stats
@@ -0,0 +1,234 @@
+import time
+import threading
+from array import array
+
+# 로그-선형 버킷: 마이크로초 값을 2의 거듭제곱 구간마다 SUB_BUCKETS 개의 균등 구간으로 나눔 (상대 오차 약 3%)
+SUB_BUCKET_BITS = 4
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+MAX_VALUE_US = 1 << 30   # 약 1073초 - 이보다 큰 값은 마지막 버킷에 기록
+BUCKET_COUNT = (30 - SUB_BUCKET_BITS + 1) * SUB_BUCKETS
+
+def bucket_index(seconds):
+    """실행 시간(초) -> 버킷 번호"""
+    value = min(max(int(seconds * 1_000_000), 0), MAX_VALUE_US - 1)
+    if value < 2 * SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS - 1
+    return SUB_BUCKETS * (shift + 1) + (value >> shift) - SUB_BUCKETS
+
+def bucket_value(index):
+    """버킷 번호 -> 대표값(초, 구간 중앙)"""
+    if index < 2 * SUB_BUCKETS:
+        return index / 1_000_000
+    shift = index // SUB_BUCKETS - 1
+    low = (index % SUB_BUCKETS + SUB_BUCKETS) << shift
+    return (low + (1 << shift) / 2) / 1_000_000
+
+class HistogramSnapshot:
+    """특정 기간의 버킷별 개수 (다른 스냅샷과 병합 가능, 예: 프리포크 워커 간)"""
+
+    def __init__(self, counts=None, total=0.0):
+        self.counts = counts if counts is not None else array("Q", bytes(8 * BUCKET_COUNT))
+        self.count = sum(self.counts)
+        self.total = total   # 실행 시간 합계 (평균 계산용)
+
+    def merge(self, other):
+        """다른 스냅샷을 더한 새 스냅샷 반환"""
+        counts = array("Q", (a + b for a, b in zip(self.counts, other.counts)))
+        return HistogramSnapshot(counts, self.total + other.total)
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percentile):
+        """백분위수(초) - 버킷 수만큼만 순회 (기록이 없으면 None)"""
+        if not self.count:
+            return None
+        rank = max(1, int(self.count * percentile / 100 + 0.5))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return bucket_value(index)
+        return bucket_value(BUCKET_COUNT - 1)
+
+class _TimeBucketedCounts:
+    """슬라이스(slice_seconds 초) 링 버퍼 + 창 전체 합계 - 만료된 슬라이스는 합계에서 빼고 비움"""
+
+    def __init__(self, slice_seconds, slice_count):
+        self.slice_seconds = slice_seconds
+        self.slice_count = slice_count
+        self.slices = [array("I", bytes(4 * BUCKET_COUNT)) for _ in range(slice_count)]
+        self.slice_totals = [0.0] * slice_count
+        self.counts = array("Q", bytes(8 * BUCKET_COUNT))   # 창 안의 모든 슬라이스 합
+        self.total = 0.0
+        self.current_slice = None   # 마지막으로 기록한 절대 슬라이스 번호
+
+    def _expire(self, position):
+        slice_counts = self.slices[position]
+        counts = self.counts
+        for index, bucket_count in enumerate(slice_counts):
+            if bucket_count:
+                counts[index] -= bucket_count
+                slice_counts[index] = 0
+        self.total -= self.slice_totals[position]
+        self.slice_totals[position] = 0.0
+
+    def advance(self, current_time):
+        """현재 시각까지 지나간 슬라이스를 비움"""
+        current = int(current_time // self.slice_seconds)
+        if self.current_slice is None:
+            self.current_slice = current
+            return
+        elapsed = current - self.current_slice
+        if elapsed <= 0:
+            return
+        for step in range(1, min(elapsed, self.slice_count) + 1):
+            self._expire((self.current_slice + step) % self.slice_count)
+        self.current_slice = current
+
+    def add_counts(self, slice_counts, seconds_total):
+        """다른 슬라이스의 버킷별 개수를 현재 슬라이스와 창 합계에 더함"""
+        position = self.current_slice % self.slice_count
+        current = self.slices[position]
+        counts = self.counts
+        for index, bucket_count in enumerate(slice_counts):
+            if bucket_count:
+                current[index] += bucket_count
+                counts[index] += bucket_count
+        self.slice_totals[position] += seconds_total
+        self.total += seconds_total
+
+    def reset(self):
+        for position in range(self.slice_count):
+            self._expire(position)
+        self.current_slice = None
+
+class _PendingStripe:
+    """스레드별로 나눠 쓰는 현재 구간 기록 배열 (구간이 바뀔 때 창에 반영)"""
+
+    __slots__ = ("lock", "slice", "counts", "count", "total")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.slice = None   # 기록 중인 절대 구간 번호
+        self.counts = array("I", bytes(4 * BUCKET_COUNT))
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, index, seconds):
+        """기록 하나 추가 (stripe lock 보유 상태에서 호출)"""
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+
+    def take(self, current):
+        """current 이전 구간에 모인 기록을 꺼내고 current 구간으로 비움 - (구간 번호, 개수, 합계) 또는 None"""
+        with self.lock:
+            if self.slice is not None and self.slice >= current:
+                return None
+            taken = (self.slice, self.counts, self.total) if self.count else None
+            self.slice = current
+            self.counts = array("I", bytes(4 * BUCKET_COUNT))
+            self.count = 0
+            self.total = 0.0
+            return taken
+
+class LatencyHistogram:
+    """시간 구간별 로그-선형 실행 시간 히스토그램 (고정 메모리, 기록 O(1), 백분위수 조회 O(버킷 수))
+
+    기록은 현재 스레드의 PENDING_SECONDS 초 구간 배열(스레드 ID 로 나눈 스트라이프)에만 더하므로 공유 잠금을 잡지 않는다.
+    구간이 바뀌면 모든 스트라이프를 창마다 슬라이스 링 버퍼와 창 합계에 한꺼번에 반영하고,
+    조회는 창 합계 + 스트라이프의 현재 구간만 더하므로 슬라이스를 다시 합치지 않는다.
+    """
+
+    PENDING_SECONDS = 10
+    STRIPE_COUNT = 16   # 현재 구간 기록 배열 수 (스레드 ID 로 분산)
+
+    # 창 길이(초) -> (슬라이스 길이, 슬라이스 수), 슬라이스 길이는 PENDING_SECONDS 의 배수
+    DEFAULT_WINDOWS = {
+        60: (10, 6),
+        300: (10, 30),
+        3600: (60, 60),
+    }
+
+    def __init__(self, windows=None):
+        self.windows = {
+            window_seconds: _TimeBucketedCounts(slice_seconds, slice_count)
+            for window_seconds, (slice_seconds, slice_count) in (windows or self.DEFAULT_WINDOWS).items()
+        }
+        self._stripes = [_PendingStripe() for _ in range(self.STRIPE_COUNT)]
+        self.lock = threading.Lock()   # 창 반영/조회용 (기록 경로에서는 구간이 바뀔 때만 잡음)
+
+    def _roll_pending(self, current):
+        """current 이전 구간의 스트라이프 기록을 오래된 구간부터 모든 창에 반영 (lock 보유 상태에서 호출)"""
+        taken = [pending for pending in (stripe.take(current) for stripe in self._stripes) if pending is not None]
+        for pending_slice, counts, seconds_total in sorted(taken, key=lambda pending: pending[0]):
+            pending_time = pending_slice * self.PENDING_SECONDS
+            for window in self.windows.values():
+                window.advance(pending_time)
+                window.add_counts(counts, seconds_total)
+
+    def record(self, seconds, current_time=None):
+        """실행 시간 기록 - 현재 스레드의 스트라이프에만 더함"""
+        if current_time is None:
+            current_time = time.time()
+        index = bucket_index(seconds)
+        current = int(current_time // self.PENDING_SECONDS)
+        stripe = self._stripes[threading.get_ident() % self.STRIPE_COUNT]
+        with stripe.lock:
+            if stripe.slice == current:
+                stripe.add(index, seconds)
+                return
+        
+        # 구간이 바뀜 - 모든 스트라이프의 지난 구간을 창에 반영한 뒤 기록
+        with self.lock:
+            self._roll_pending(current)
+            with stripe.lock:
+                stripe.add(index, seconds)
+
+    def _window_for(self, window_seconds):
+        """요청한 길이 이상인 가장 짧은 창 (없으면 가장 긴 창)"""
+        candidates = [length for length in self.windows if length >= window_seconds]
+        return self.windows[min(candidates) if candidates else max(self.windows)]
+
+    def snapshot(self, window_seconds=3600, current_time=None):
+        """최근 window_seconds 초 스냅샷 (창 합계 + 아직 반영하지 않은 현재 구간)"""
+        if current_time is None:
+            current_time = time.time()
+        with self.lock:
+            self._roll_pending(int(current_time // self.PENDING_SECONDS))
+            window = self._window_for(window_seconds)
+            window.advance(current_time)
+            counts = array("Q", window.counts)
+            seconds_total = window.total
+            for stripe in self._stripes:
+                with stripe.lock:
+                    for index, bucket_count in enumerate(stripe.counts):
+                        if bucket_count:
+                            counts[index] += bucket_count
+                    seconds_total += stripe.total
+            return HistogramSnapshot(counts, seconds_total)
+
+    def percentile(self, percentile, window_seconds=3600):
+        """최근 window_seconds 초 백분위수(초, 기록이 없으면 None)"""
+        return self.snapshot(window_seconds).percentile(percentile)
+
+    def get_stats(self, percentiles=(50, 95, 99)):
+        """창별 개수/평균/백분위수 (지표용, 키 예: 1m.p95)"""
+        stats = {}
+        for window_seconds in sorted(self.windows):
+            label = f"{window_seconds // 3600}h" if window_seconds % 3600 == 0 else f"{window_seconds // 60}m"
+            snapshot = self.snapshot(window_seconds)
+            stats[f"{label}.count"] = snapshot.count
+            stats[f"{label}.mean"] = round(snapshot.mean(), 4)
+            for percentile in percentiles:
+                value = snapshot.percentile(percentile)
+                stats[f"{label}.p{percentile}"] = round(value, 4) if value is not None else 0.0
+        return stats
+
+    def reset(self):
+        with self.lock:
+            for window in self.windows.values():
+                window.reset()
+            self._stripes = [_PendingStripe() for _ in range(self.STRIPE_COUNT)]
@@ -0,0 +1,71 @@
+import logging
+
+# 요청 우선순위 (앞쪽일수록 높음)
+PRIORITY_CRITICAL = "critical"   # 헬스체크, GetStatus/ResetPattern 같은 제어 호출
+PRIORITY_NORMAL = "normal"       # 사용자 대화형 요청
+PRIORITY_LOW = "low"             # slow/batch 요청 - 과부하 시 가장 먼저 차단
+PRIORITIES = (PRIORITY_CRITICAL, PRIORITY_NORMAL, PRIORITY_LOW)
+
+# 우선순위를 전달하는 gRPC 메타데이터 키
+PRIORITY_METADATA_KEY = "x-request-priority"
+
+# 우선순위별 기본 허용 비율 (각 한도의 몇 %까지 이 우선순위 요청을 받을지)
+# 기본값은 모두 1.0 (설정한 한도를 그대로 사용) - 낮은 우선순위를 먼저 차단하려면 BACKPRESSURE_PRIORITY_SHARES 로 지정
+DEFAULT_PRIORITY_SHARES = {
+    PRIORITY_CRITICAL: 1.0,
+    PRIORITY_NORMAL: 1.0,
+    PRIORITY_LOW: 1.0,
+}
+
+# 저우선순위로 분류하는 요청 유형
+LOW_PRIORITY_REQUEST_TYPES = ("slow", "batch")
+
+logger = logging.getLogger("priority")
+
+def priority_rank(priority):
+    """우선순위 순서 (작을수록 높음, 알 수 없으면 normal 취급)"""
+    if priority in PRIORITIES:
+        return PRIORITIES.index(priority)
+    return PRIORITIES.index(PRIORITY_NORMAL)
+
+def priority_from_request_type(request_type):
+    """요청 유형으로 우선순위 결정"""
+    return PRIORITY_LOW if request_type in LOW_PRIORITY_REQUEST_TYPES else PRIORITY_NORMAL
+
+def priority_from_metadata(metadata):
+    """메타데이터의 우선순위 (없거나 알 수 없는 값이면 None)"""
+    for key, value in metadata or ():
+        if key == PRIORITY_METADATA_KEY:
+            if value in PRIORITIES:
+                return value
+            logger.warning(f"[우선순위] 알 수 없는 우선순위 메타데이터 무시: {value}")
+            break
+    return None
+
+def get_request_priority(context, request_type=None):
+    """메타데이터의 우선순위, 없으면 요청 유형에서 결정"""
+    priority = priority_from_metadata(context.invocation_metadata()) if context is not None else None
+    return priority or priority_from_request_type(request_type)
+
+def priority_metadata(priority):
+    """하위 서비스 호출에 붙일 우선순위 메타데이터"""
+    return ((PRIORITY_METADATA_KEY, priority),)
+
+def parse_priority_shares(value):
+    """'critical:1.0,normal:0.9,low:0.5' 형식 문자열을 우선순위별 허용 비율로 변환 (지정하지 않은 우선순위는 1.0)"""
+    shares = dict(DEFAULT_PRIORITY_SHARES)
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        parts = item.split(":")
+        if len(parts) != 2:
+            raise ValueError(f"잘못된 우선순위 비율 형식: {item.strip()} (예: normal:0.9,low:0.5)")
+        priority, share = parts[0].strip(), parts[1].strip()
+        if priority not in PRIORITIES:
+            raise ValueError(f"알 수 없는 우선순위: {priority} (지원: {', '.join(PRIORITIES)})")
+        try:
+            share = float(share)
+        except ValueError:
+            raise ValueError(f"잘못된 우선순위 비율 값: {item.strip()} (0.0~1.0 사이 숫자)") from None
+        shares[priority] = max(0.0, min(share, 1.0))
+    return shares
@@ -0,0 +1,112 @@
+import threading
+
+class P2QuantileEstimator:
+    """P² 알고리즘 - 표본을 저장하지 않고 마커 5개로 분위수를 추정 (표본당 O(1), 고정 메모리)
+
+    스레드 안전하지 않음 - 여러 스레드에서 쓸 때는 WindowedQuantileEstimator 처럼 잠금으로 감싼다.
+    """
+
+    def __init__(self, quantile):
+        self.quantile = quantile
+        self.count = 0
+        self.heights = []                       # 마커 높이 (추정값)
+        self.positions = [1, 2, 3, 4, 5]        # 마커 실제 위치
+        self.desired = [1, 1 + 2 * quantile, 1 + 4 * quantile, 3 + 2 * quantile, 5]   # 마커 목표 위치
+        self.increments = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+
+    def add(self, value):
+        """표본 하나 반영"""
+        self.count += 1
+        heights = self.heights
+        if self.count <= 5:
+            heights.append(value)
+            if self.count == 5:
+                heights.sort()
+            return
+
+        # 표본이 들어갈 칸을 찾고 극값 마커 갱신
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+
+        positions = self.positions
+        for index in range(cell + 1, 5):
+            positions[index] += 1
+        for index in range(5):
+            self.desired[index] += self.increments[index]
+
+        # 중간 마커를 목표 위치 쪽으로 한 칸씩 이동 (포물선 보간, 단조성이 깨지면 선형 보간)
+        for index in (1, 2, 3):
+            offset = self.desired[index] - positions[index]
+            if (offset >= 1 and positions[index + 1] - positions[index] > 1) or \
+               (offset <= -1 and positions[index - 1] - positions[index] < -1):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(index, step)
+                if not heights[index - 1] < height < heights[index + 1]:
+                    height = self._linear(index, step)
+                heights[index] = height
+                positions[index] += step
+
+    def _parabolic(self, index, step):
+        heights, positions = self.heights, self.positions
+        return heights[index] + step / (positions[index + 1] - positions[index - 1]) * (
+            (positions[index] - positions[index - 1] + step) * (heights[index + 1] - heights[index]) / (positions[index + 1] - positions[index])
+            + (positions[index + 1] - positions[index] - step) * (heights[index] - heights[index - 1]) / (positions[index] - positions[index - 1])
+        )
+
+    def _linear(self, index, step):
+        heights, positions = self.heights, self.positions
+        return heights[index] + step * (heights[index + step] - heights[index]) / (positions[index + step] - positions[index])
+
+    def value(self):
+        """현재 분위수 추정값 (표본이 없으면 None, 5개 미만이면 정렬해서 계산)"""
+        if self.count == 0:
+            return None
+        if self.count < 5:
+            ordered = sorted(self.heights)
+            return ordered[min(int(self.count * self.quantile), self.count - 1)]
+        return self.heights[2]
+
+class WindowedQuantileEstimator:
+    """최근 약 window_size 개 표본의 분위수 - P² 추정기를 window_size 개마다 새로 시작하고 직전 구간 값과 섞어 사용
+
+    여러 핸들러 스레드가 함께 기록하므로 마커 갱신/조회/구간 교체를 잠금 안에서 처리한다.
+    """
+
+    def __init__(self, quantile, window_size=100):
+        self.quantile = quantile
+        self.window_size = max(5, window_size)
+        self.current = P2QuantileEstimator(quantile)
+        self.previous_value = None   # 직전 구간의 최종 추정값
+        self.lock = threading.Lock()
+
+    def add(self, value):
+        """표본 하나 반영 (O(1))"""
+        with self.lock:
+            self.current.add(value)
+            if self.current.count >= self.window_size:
+                self.previous_value = self.current.value()
+                self.current = P2QuantileEstimator(self.quantile)
+
+    def value(self):
+        """현재 추정값 - 새 구간의 표본이 적을수록 직전 구간 값의 비중을 크게 둠"""
+        with self.lock:
+            current_value = self.current.value()
+            if self.previous_value is None:
+                return current_value
+            if current_value is None:
+                return self.previous_value
+            weight = self.current.count / self.window_size
+            return current_value * weight + self.previous_value * (1 - weight)
+
+    def reset(self):
+        with self.lock:
+            self.current = P2QuantileEstimator(self.quantile)
+            self.previous_value = None
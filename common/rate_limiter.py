@@ -0,0 +1,280 @@
+import math
+import threading
+
+from common.shared_state import SharedStateError
+from common.sliding_window import SlidingWindowCounter
+
+class WindowRateLimiter:
+    """슬라이딩 윈도우 방식 - 창 안의 요청 수가 max_requests 미만이면 허용"""
+
+    strategy = "window"
+    take_outside_lock = False   # 확인/소모가 로컬 연산이라 컨트롤러 잠금 안에서 peek/acquire
+
+    def __init__(self, window_size, max_requests, bucket_count=50):
+        self.window_size = window_size
+        self.max_requests = max_requests
+        self.counter = SlidingWindowCounter(window_size, bucket_count)
+
+    def peek(self, current_time, share=1.0):
+        """지금 요청 하나를 허용할 수 있는지 확인 (상태 변경 없음, share 는 사용 가능한 한도 비율)"""
+        return self.counter.count(current_time) < self.max_requests * share
+
+    def acquire(self, current_time):
+        """요청 하나를 기록"""
+        self.counter.add(current_time)
+
+    def describe(self, current_time):
+        """로그용 현재 사용량"""
+        return f"요청수={self.counter.count(current_time)}/{self.max_requests}"
+
+    def get_stats(self, current_time):
+        """지표용 현재 상태"""
+        return {
+            "strategy": self.strategy,
+            "window_requests": self.counter.count(current_time),
+            "max_requests": self.max_requests,
+        }
+
+    def reset(self):
+        """상태 초기화"""
+        self.counter.reset()
+
+class TokenBucketRateLimiter:
+    """토큰 버킷 방식 - 초당 rate 개씩 토큰을 채우고 최대 burst 개까지 모아 둠"""
+
+    strategy = "token_bucket"
+    take_outside_lock = False
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.last_refill = None
+
+    def _refill(self, current_time):
+        """지난 시간만큼 토큰 보충"""
+        if self.last_refill is not None and current_time > self.last_refill:
+            self.tokens = min(self.burst, self.tokens + (current_time - self.last_refill) * self.rate)
+        if self.last_refill is None or current_time > self.last_refill:
+            self.last_refill = current_time
+
+    def peek(self, current_time, share=1.0):
+        """지금 요청 하나를 허용할 수 있는지 확인 (토큰 소모 없음, share 미만 우선순위는 버스트 일부를 남겨 둠)"""
+        self._refill(current_time)
+        reserve = (1 - share) * (self.burst - 1)
+        return self.tokens >= 1 + reserve
+
+    def acquire(self, current_time):
+        """토큰 하나 소모"""
+        self._refill(current_time)
+        self.tokens -= 1
+
+    def describe(self, current_time):
+        """로그용 현재 사용량"""
+        self._refill(current_time)
+        return f"토큰={self.tokens:.1f}/{self.burst} (보충 {self.rate:.1f}/초)"
+
+    def get_stats(self, current_time):
+        """지표용 현재 상태"""
+        self._refill(current_time)
+        return {
+            "strategy": self.strategy,
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": round(self.tokens, 3),
+        }
+
+    def reset(self):
+        """토큰을 가득 채운 상태로 초기화"""
+        self.tokens = float(self.burst)
+        self.last_refill = None
+
+class GcraRateLimiter:
+    """GCRA(Generic Cell Rate Algorithm) 방식 - 이론적 도착 시각(TAT)만으로 요청 간격을 고르게 유지"""
+
+    strategy = "gcra"
+    take_outside_lock = False
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.emission_interval = 1.0 / rate if rate > 0 else 0.0   # 요청 하나가 차지하는 시간
+        self.tolerance = (self.burst - 1) * self.emission_interval   # 연속 허용 가능한 앞당김 한도
+        self.tat = None   # 다음 요청의 이론적 도착 시각
+
+    def peek(self, current_time, share=1.0):
+        """지금 요청 하나를 허용할 수 있는지 확인 (TAT 변경 없음, share 만큼의 버스트 허용치만 사용)"""
+        if self.emission_interval <= 0:
+            return False
+        tat = self.tat if self.tat is not None else current_time
+        return tat - current_time <= self.tolerance * share
+
+    def acquire(self, current_time):
+        """TAT 를 요청 간격만큼 뒤로 이동"""
+        tat = self.tat if self.tat is not None else current_time
+        self.tat = max(tat, current_time) + self.emission_interval
+
+    def _retry_after(self, current_time):
+        """다음 요청이 허용되기까지 남은 시간"""
+        if self.tat is None:
+            return 0.0
+        return max(0.0, self.tat - self.tolerance - current_time)
+
+    def describe(self, current_time):
+        """로그용 현재 사용량"""
+        return f"간격={self.emission_interval:.3f}초, 버스트={self.burst}, 재시도까지={self._retry_after(current_time):.3f}초"
+
+    def get_stats(self, current_time):
+        """지표용 현재 상태"""
+        return {
+            "strategy": self.strategy,
+            "rate": self.rate,
+            "burst": self.burst,
+            "retry_after": round(self._retry_after(current_time), 3),
+        }
+
+    def reset(self):
+        """상태 초기화"""
+        self.tat = None
+
+class SharedTokenBucketRateLimiter:
+    """공유 토큰 버킷 방식 - 공유 상태 저장소의 키 하나를 모든 레플리카가 함께 소모 (레플리카 수와 무관한 전체 예산)
+
+    저장소에 접근할 수 없으면 같은 rate/burst 의 레플리카별 로컬 토큰 버킷으로 대체한다.
+    """
+
+    strategy = "shared_token_bucket"
+    take_outside_lock = True   # 저장소 왕복이 필요하므로 컨트롤러가 잠금 밖에서 try_take 로 한 번에 확인+소모
+
+    def __init__(self, rate, burst, store, key):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.store = store
+        self.key = key
+        self.lock = threading.Lock()   # 잠금 밖에서 동시에 호출되므로 로컬 버킷/지표 보호
+        self.fallback = TokenBucketRateLimiter(rate, burst)
+        self.fallback_count = 0   # 저장소 대신 로컬 버킷으로 판단한 횟수
+        self.refund_count = 0     # 동시 처리 한도 초과로 돌려준 토큰 수
+        self.last_tokens = float(self.burst)   # 마지막으로 확인한 잔여 토큰 (로그/지표용, 저장소 재조회 없음)
+
+    def _min_tokens(self, share):
+        return 1 + (1 - share) * (self.burst - 1)
+
+    def _on_taken(self, current_time, allowed, tokens):
+        """저장소 결과 반영 - 허용된 토큰은 로컬 버킷에서도 소모해 대체 시 버스트가 한꺼번에 풀리지 않게 함"""
+        with self.lock:
+            self.last_tokens = tokens
+            if allowed:
+                self.fallback.acquire(current_time)
+        return allowed
+
+    def _take_fallback(self, current_time, share):
+        with self.lock:
+            self.fallback_count += 1
+            if not self.fallback.peek(current_time, share):
+                return False
+            self.fallback.acquire(current_time)
+            return True
+
+    def try_take(self, current_time, share=1.0):
+        """잔여 토큰이 1 + 예비분 이상이면 하나 소모 - 확인과 소모를 저장소 왕복 한 번으로 처리"""
+        try:
+            allowed, tokens = self.store.take_tokens(self.key, self.rate, self.burst, amount=1.0, min_tokens=self._min_tokens(share))
+        except SharedStateError:
+            return self._take_fallback(current_time, share)
+        return self._on_taken(current_time, allowed, tokens)
+
+    async def try_take_async(self, current_time, share=1.0):
+        """try_take 의 grpc.aio 용 (원격 저장소 호출 중 이벤트 루프를 막지 않음)"""
+        try:
+            allowed, tokens = await self.store.take_tokens_async(self.key, self.rate, self.burst, amount=1.0, min_tokens=self._min_tokens(share))
+        except SharedStateError:
+            return self._take_fallback(current_time, share)
+        return self._on_taken(current_time, allowed, tokens)
+
+    def _on_refunded(self, tokens):
+        with self.lock:
+            self.refund_count += 1
+            self.fallback.tokens = min(self.fallback.burst, self.fallback.tokens + 1)
+            if tokens is not None:
+                self.last_tokens = tokens
+
+    def refund(self, current_time):
+        """try_take 로 가져간 토큰 하나 반환 (요청률은 통과했지만 동시 처리 한도로 거부된 경우)"""
+        tokens = None
+        try:
+            _, tokens = self.store.take_tokens(self.key, self.rate, self.burst, amount=-1.0, min_tokens=float("-inf"))
+        except SharedStateError:
+            pass
+        self._on_refunded(tokens)
+
+    async def refund_async(self, current_time):
+        """refund 의 grpc.aio 용"""
+        tokens = None
+        try:
+            _, tokens = await self.store.take_tokens_async(self.key, self.rate, self.burst, amount=-1.0, min_tokens=float("-inf"))
+        except SharedStateError:
+            pass
+        self._on_refunded(tokens)
+
+    def peek(self, current_time, share=1.0):
+        """마지막으로 확인한 잔여 토큰 기준 허용 여부 (저장소 왕복 없음, 상태 확인용)"""
+        return self.last_tokens >= self._min_tokens(share)
+
+    def acquire(self, current_time):
+        """저장소에서 토큰 하나를 조건 없이 소모 (컨트롤러는 try_take 사용)"""
+        try:
+            allowed, tokens = self.store.take_tokens(self.key, self.rate, self.burst, amount=1.0, min_tokens=float("-inf"))
+        except SharedStateError:
+            with self.lock:
+                self.fallback_count += 1
+                self.fallback.acquire(current_time)
+            return
+        self._on_taken(current_time, allowed, tokens)
+
+    def describe(self, current_time):
+        """로그용 현재 사용량"""
+        return f"공유토큰[{self.key}]={self.last_tokens:.1f}/{self.burst} (보충 {self.rate:.1f}/초, 로컬 대체 {self.fallback_count}회)"
+
+    def get_stats(self, current_time):
+        """지표용 현재 상태"""
+        return {
+            "strategy": self.strategy,
+            "shared_key": self.key,
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": round(self.last_tokens, 3),
+            "fallbacks": self.fallback_count,
+            "refunds": self.refund_count,
+        }
+
+    def reset(self):
+        """공유 키 초기화 (모든 레플리카에 적용됨)"""
+        with self.lock:
+            self.fallback.reset()
+            self.last_tokens = float(self.burst)
+        try:
+            self.store.reset_key(self.key)
+        except SharedStateError:
+            pass
+
+RATE_LIMIT_STRATEGIES = ("window", "token_bucket", "gcra", "shared_token_bucket")
+
+def create_rate_limiter(strategy, window_size, max_requests, burst=None, bucket_count=50, shared_store=None, shared_key="global"):
+    """전략 이름으로 요청률 제한기 생성 (rate 는 max_requests / window_size, burst 미지정 시 1초 분량)"""
+    if strategy == "window":
+        return WindowRateLimiter(window_size, max_requests, bucket_count)
+
+    rate = max_requests / window_size if window_size > 0 else 0.0
+    if burst is None or burst <= 0:
+        burst = max(1, math.ceil(rate))
+
+    if strategy == "token_bucket":
+        return TokenBucketRateLimiter(rate, burst)
+    if strategy == "gcra":
+        return GcraRateLimiter(rate, burst)
+    if strategy == "shared_token_bucket":
+        if shared_store is None:
+            raise ValueError("shared_token_bucket 전략에는 공유 상태 저장소(SHARED_STATE_BACKEND)가 필요합니다")
+        return SharedTokenBucketRateLimiter(rate, burst, shared_store, shared_key)
+    raise ValueError(f"알 수 없는 요청률 제한 전략: {strategy} (지원: {', '.join(RATE_LIMIT_STRATEGIES)})")
@@ -0,0 +1,113 @@
+import os
+import time
+import threading
+import logging
+from collections import deque
+from concurrent import futures
+
+import grpc
+
+class QueueTimeExecutor(futures.ThreadPoolExecutor):
+    """작업이 큐에서 워커를 기다린 시간을 측정하는 스레드풀"""
+
+    def __init__(self, max_workers, name="default", queue_warn_threshold=1.0):
+        super().__init__(max_workers=max_workers, thread_name_prefix=f"{name}_worker")
+        self.name = name
+        self.max_workers = max_workers
+        self.queue_warn_threshold = queue_warn_threshold  # 이 시간 이상 대기하면 경고 로그
+        self.lock = threading.Lock()
+        self.logger = logging.getLogger(f"server_executor.{name}")
+
+        self.queued = 0               # 워커를 기다리는 작업 수
+        self.running = 0              # 실행 중인 작업 수
+        self.completed_count = 0
+        self.queue_time_total = 0.0
+        self.queue_time_max = 0.0
+        self.recent_queue_times = deque(maxlen=1000)  # 백분위수 계산용 최근 대기 시간
+
+    def submit(self, fn, *args, **kwargs):
+        """작업 제출 - 제출 시각을 기록해 워커가 집어갈 때 대기 시간 계산"""
+        enqueue_time = time.time()
+        with self.lock:
+            self.queued += 1
+
+        def run():
+            queue_time = time.time() - enqueue_time
+            with self.lock:
+                self.queued -= 1
+                self.running += 1
+                self.queue_time_total += queue_time
+                self.queue_time_max = max(self.queue_time_max, queue_time)
+                self.recent_queue_times.append(queue_time)
+                queued = self.queued
+            if queue_time >= self.queue_warn_threshold:
+                self.logger.warning(f"[실행기-{self.name}] 큐 대기 시간 {queue_time:.3f}초 (대기 중 {queued}개, 워커 {self.max_workers}개)")
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self.lock:
+                    self.running -= 1
+                    self.completed_count += 1
+
+        return super().submit(run)
+
+    def get_stats(self):
+        """실행기 통계 반환"""
+        with self.lock:
+            started = len(self.recent_queue_times)
+            sorted_times = sorted(self.recent_queue_times)
+            p95 = sorted_times[min(int(started * 95 / 100), started - 1)] if started else 0.0
+            picked_up = self.completed_count + self.running
+            return {
+                "max_workers": self.max_workers,
+                "queued": self.queued,
+                "running": self.running,
+                "completed": self.completed_count,
+                "queue_time_avg": self.queue_time_total / picked_up if picked_up else 0.0,
+                "queue_time_p95": p95,
+                "queue_time_max": self.queue_time_max,
+            }
+
+def _get_max_concurrent_rpcs():
+    """환경 변수의 gRPC 동시 RPC 상한 (0 또는 미설정이면 제한 없음)"""
+    value = int(os.environ.get("SERVER_MAX_CONCURRENT_RPCS", "0"))
+    return value if value > 0 else None
+
+def get_server_max_workers(default_max_workers=10):
+    """환경 변수의 스레드풀 서버 워커 스레드 수"""
+    return int(os.environ.get("SERVER_MAX_WORKERS", str(default_max_workers)))
+
+def create_server(name, default_max_workers=10, options=None, interceptors=None):
+    """설정 기반 스레드풀 gRPC 서버 생성 - (server, executor) 반환"""
+    max_workers = get_server_max_workers(default_max_workers)
+    max_concurrent_rpcs = _get_max_concurrent_rpcs()
+    queue_warn_threshold = float(os.environ.get("SERVER_QUEUE_WARN_THRESHOLD", "1.0"))
+
+    executor = QueueTimeExecutor(max_workers=max_workers, name=name, queue_warn_threshold=queue_warn_threshold)
+    server = grpc.server(
+        executor,
+        options=options,
+        interceptors=interceptors,
+        maximum_concurrent_rpcs=max_concurrent_rpcs
+    )
+
+    logging.getLogger(f"server_factory.{name}").info(
+        f"[서버-{name}] 생성 - 워커 스레드: {max_workers}개, 최대 동시 RPC: {max_concurrent_rpcs or '제한 없음'}"
+    )
+    return server, executor
+
+def create_aio_server(name, maximum_concurrent_rpcs=None, options=None, interceptors=None):
+    """설정 기반 grpc.aio 서버 생성 (실행기 큐가 없으므로 동시 RPC 상한만 적용)"""
+    if maximum_concurrent_rpcs is None:
+        maximum_concurrent_rpcs = _get_max_concurrent_rpcs()
+
+    server = grpc.aio.server(
+        options=options,
+        interceptors=interceptors,
+        maximum_concurrent_rpcs=maximum_concurrent_rpcs
+    )
+
+    logging.getLogger(f"server_factory.{name}").info(
+        f"[서버-{name}] aio 서버 생성 - 최대 동시 RPC: {maximum_concurrent_rpcs or '제한 없음'}"
+    )
+    return server
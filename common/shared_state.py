@@ -0,0 +1,245 @@
+import os
+import time
+import mmap
+import fcntl
+import struct
+import tempfile
+import threading
+import logging
+import hashlib
+from abc import ABC, abstractmethod
+
+import grpc
+
+from generated import shared_state_pb2, shared_state_pb2_grpc
+
+class SharedStateError(Exception):
+    """공유 상태 저장소에 접근할 수 없음 (호출자가 로컬 상태로 대체)"""
+
+class SharedStateStore(ABC):
+    """레플리카 간 공유 상태 저장소 인터페이스 - 키별 토큰 버킷을 원자적으로 갱신
+
+    take_tokens 는 (rate, burst) 로 토큰을 보충한 뒤 tokens >= min_tokens 이면 허용하고,
+    peek 이 아니면 허용된 경우에만 amount 만큼 소모한다 (확인과 소모가 한 번에 일어나 다른 레플리카와 경합하지 않음).
+    amount 가 음수이면 토큰을 돌려준다 (burst 를 넘지 않음).
+    """
+
+    @abstractmethod
+    def take_tokens(self, key, rate, burst, amount=1.0, min_tokens=1.0, peek=False):
+        """(허용 여부, 남은 토큰 수) 반환"""
+
+    async def take_tokens_async(self, key, rate, burst, amount=1.0, min_tokens=1.0, peek=False):
+        """take_tokens 의 grpc.aio 용 (로컬 저장소는 짧은 잠금 구간뿐이라 그대로 호출)"""
+        return self.take_tokens(key, rate, burst, amount=amount, min_tokens=min_tokens, peek=peek)
+
+    @abstractmethod
+    def reset_key(self, key):
+        """키 상태 초기화 (다음 호출 시 burst 로 가득 찬 상태에서 시작)"""
+
+    def close(self):
+        """저장소 자원 정리"""
+
+def _refill_and_take(tokens, last_refill, now, rate, burst, amount, min_tokens, peek):
+    """토큰 버킷 한 번 갱신 - (허용 여부, 새 토큰 수, 새 보충 시각)"""
+    if now > last_refill:
+        tokens = min(burst, tokens + (now - last_refill) * rate)
+        last_refill = now
+    allowed = tokens >= min_tokens
+    if allowed and not peek:
+        tokens = min(burst, tokens - amount)
+    return allowed, tokens, last_refill
+
+class LocalStateStore(SharedStateStore):
+    """프로세스 내부 저장소 (단일 프로세스, 공유 상태 서버의 백엔드로 사용)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buckets = {}   # 키 -> [tokens, last_refill]
+
+    def take_tokens(self, key, rate, burst, amount=1.0, min_tokens=1.0, peek=False):
+        now = time.time()
+        with self.lock:
+            tokens, last_refill = self.buckets.get(key, (burst, now))
+            allowed, tokens, last_refill = _refill_and_take(tokens, last_refill, now, rate, burst, amount, min_tokens, peek)
+            self.buckets[key] = (tokens, last_refill)
+            return allowed, tokens
+
+    def reset_key(self, key):
+        with self.lock:
+            self.buckets.pop(key, None)
+
+class MmapStateStore(SharedStateStore):
+    """공유 메모리(mmap) 저장소 - 같은 호스트의 프로세스(프리포크 워커, /dev/shm 을 공유하는 컨테이너)가 공유
+
+    파일은 헤더 + 고정 크기 슬롯 배열이고, 키는 64비트 해시로 슬롯을 찾는다 (선형 탐사, 서로 다른 키가 버킷을 공유하지 않도록 해시 전체를 비교).
+    슬롯이 모두 차면 제한 없이 허용하지 않고 SharedStateError 를 던진다 (제한기는 레플리카별 로컬 버킷으로 대체).
+    갱신은 fcntl.flock 으로 프로세스 간, threading.Lock 으로 스레드 간 직렬화한다.
+    """
+
+    MAGIC = b"GRPCSS02"
+    HEADER = struct.Struct("<8sI4x")   # magic, 슬롯 수
+    SLOT = struct.Struct("<Qdd")       # 키 해시(0 이면 빈 슬롯), tokens, last_refill
+
+    def __init__(self, path=None, slots=64, name="default"):
+        self.path = path or os.path.join("/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(), "grpc_shared_state")
+        self.slots = slots
+        self.size = self.HEADER.size + self.SLOT.size * slots
+        self.lock = threading.Lock()
+        self.logger = logging.getLogger(f"shared_state.{name}")
+
+        self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self.fd).st_size < self.size:
+                os.ftruncate(self.fd, self.size)
+            self.mm = mmap.mmap(self.fd, self.size)
+            magic, existing_slots = self.HEADER.unpack_from(self.mm, 0)
+            if magic != self.MAGIC:
+                self.mm[:self.size] = b"\x00" * self.size
+                self.HEADER.pack_into(self.mm, 0, self.MAGIC, slots)
+            elif existing_slots != slots:
+                self.slots = min(slots, existing_slots)
+                self.logger.warning(f"[공유상태-{name}] 기존 파일 슬롯 수 {existing_slots}개 사용 (요청 {slots}개)")
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+        self.logger.info(f"[공유상태-{name}] mmap 저장소 사용: {self.path} (슬롯 {self.slots}개)")
+
+    def _key_hash(self, key):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "little") or 1
+
+    def _find_slot(self, key_hash):
+        """키 슬롯 위치 (없으면 빈 슬롯을 차지, 가득 찼으면 None) - 잠금 보유 상태에서 호출"""
+        start = key_hash % self.slots
+        for step in range(self.slots):
+            offset = self.HEADER.size + self.SLOT.size * ((start + step) % self.slots)
+            slot_hash, _, _ = self.SLOT.unpack_from(self.mm, offset)
+            if slot_hash == key_hash:
+                return offset, False
+            if slot_hash == 0:
+                return offset, True
+        return None, False
+
+    def take_tokens(self, key, rate, burst, amount=1.0, min_tokens=1.0, peek=False):
+        key_hash = self._key_hash(key)
+        with self.lock:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+            try:
+                now = time.time()
+                offset, is_new = self._find_slot(key_hash)
+                if offset is None:
+                    self.logger.error(f"[공유상태] 슬롯 부족 ({self.slots}개) - {key} 키는 로컬 제한으로 대체")
+                    raise SharedStateError(f"{self.path}: 슬롯 부족")
+                if is_new:
+                    tokens, last_refill = burst, now
+                else:
+                    _, tokens, last_refill = self.SLOT.unpack_from(self.mm, offset)
+                allowed, tokens, last_refill = _refill_and_take(tokens, last_refill, now, rate, burst, amount, min_tokens, peek)
+                self.SLOT.pack_into(self.mm, offset, key_hash, tokens, last_refill)
+                return allowed, tokens
+            finally:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+    def reset_key(self, key):
+        key_hash = self._key_hash(key)
+        with self.lock:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+            try:
+                offset, is_new = self._find_slot(key_hash)
+                if offset is not None and not is_new:
+                    # 탐사 체인이 끊기지 않도록 슬롯은 유지하고 마지막 보충 시각만 과거로 돌려 가득 채움
+                    self.SLOT.pack_into(self.mm, offset, key_hash, 0.0, 0.0)
+            finally:
+                fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+    def close(self):
+        self.mm.close()
+        os.close(self.fd)
+
+class GrpcStateStore(SharedStateStore):
+    """원격 공유 상태 서버 저장소 - 여러 호스트의 레플리카가 하나의 예산을 공유
+
+    서버에 닿지 못하면 오류 수를 세고 SharedStateError 를 던진다 (제한기는 레플리카별 로컬 버킷으로 대체).
+    """
+
+    def __init__(self, address, timeout=0.05, retry_interval=1.0, name="default"):
+        self.address = address
+        self.timeout = timeout
+        self.retry_interval = retry_interval   # 실패 후 이 시간 동안은 호출 없이 바로 실패 (잠금 보유 중 타임아웃 반복 방지)
+        self.unavailable_until = 0.0
+        self.channel = grpc.insecure_channel(address)
+        self.stub = shared_state_pb2_grpc.SharedStateServiceStub(self.channel)
+        self.aio_channel = None   # grpc.aio 서버용 채널 (이벤트 루프 안에서 처음 호출될 때 생성)
+        self.aio_stub = None
+        self.error_count = 0
+        self.logger = logging.getLogger(f"shared_state.{name}")
+        self.logger.info(f"[공유상태-{name}] 원격 저장소 사용: {address} (타임아웃 {timeout}초)")
+
+    def _check_available(self):
+        if time.time() < self.unavailable_until:
+            raise SharedStateError(f"{self.address}: 재시도 대기 중")
+
+    def _on_error(self, e):
+        self.error_count += 1
+        self.unavailable_until = time.time() + self.retry_interval
+        raise SharedStateError(f"{self.address}: {e.code()}") from e
+
+    def _on_take_error(self, e):
+        self.logger.error(f"[공유상태] 원격 저장소 호출 실패 ({e.code()}) - {self.retry_interval}초간 로컬 제한으로 대체 (누적 오류 {self.error_count + 1}건)")
+        self._on_error(e)
+
+    def take_tokens(self, key, rate, burst, amount=1.0, min_tokens=1.0, peek=False):
+        self._check_available()
+        try:
+            response = self.stub.TakeTokens(shared_state_pb2.TakeTokensRequest(
+                key=key, rate=rate, burst=burst, amount=amount, min_tokens=min_tokens, peek=peek
+            ), timeout=self.timeout)
+            return response.allowed, response.tokens
+        except grpc.RpcError as e:
+            self._on_take_error(e)
+
+    async def take_tokens_async(self, key, rate, burst, amount=1.0, min_tokens=1.0, peek=False):
+        self._check_available()
+        if self.aio_stub is None:
+            self.aio_channel = grpc.aio.insecure_channel(self.address)
+            self.aio_stub = shared_state_pb2_grpc.SharedStateServiceStub(self.aio_channel)
+        try:
+            response = await self.aio_stub.TakeTokens(shared_state_pb2.TakeTokensRequest(
+                key=key, rate=rate, burst=burst, amount=amount, min_tokens=min_tokens, peek=peek
+            ), timeout=self.timeout)
+            return response.allowed, response.tokens
+        except grpc.RpcError as e:
+            self._on_take_error(e)
+
+    def reset_key(self, key):
+        try:
+            self.stub.ResetKey(shared_state_pb2.ResetKeyRequest(key=key), timeout=self.timeout)
+        except grpc.RpcError as e:
+            self.logger.error(f"[공유상태] 원격 저장소 초기화 실패 ({e.code()})")
+            self._on_error(e)
+
+    def close(self):
+        self.channel.close()
+
+def create_shared_state_store_from_env(name):
+    """환경 변수(SHARED_STATE_*) 기반 공유 상태 저장소 생성 (none 이면 None)"""
+    backend = os.environ.get("SHARED_STATE_BACKEND", "none").lower()
+    if backend == "none":
+        return None
+    if backend == "local":
+        return LocalStateStore()
+    if backend == "mmap":
+        return MmapStateStore(
+            path=os.environ.get("SHARED_STATE_PATH") or None,
+            slots=int(os.environ.get("SHARED_STATE_SLOTS", "64")),
+            name=name
+        )
+    if backend == "grpc":
+        return GrpcStateStore(
+            address=os.environ.get("SHARED_STATE_ADDRESS", "localhost:50058"),
+            timeout=float(os.environ.get("SHARED_STATE_TIMEOUT", "0.05")),
+            retry_interval=float(os.environ.get("SHARED_STATE_RETRY_INTERVAL", "1.0")),
+            name=name
+        )
+    raise ValueError(f"알 수 없는 공유 상태 저장소: {backend} (지원: none, local, mmap, grpc)")
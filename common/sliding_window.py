@@ -0,0 +1,52 @@
+class SlidingWindowCounter:
+    """시간 버킷 링 버퍼 기반 슬라이딩 윈도우 카운터 (갱신/조회 분할상환 O(1), 고정 메모리)"""
+
+    def __init__(self, window_size, bucket_count=50):
+        self.window_size = window_size
+        self.bucket_count = max(1, bucket_count)
+        self.bucket_width = window_size / self.bucket_count if window_size > 0 else 0
+        self.buckets = [0] * self.bucket_count
+        self.total = 0
+        self.current_bucket = None  # 마지막으로 기록한 절대 버킷 번호
+
+    def _advance(self, current_time):
+        """현재 시각까지 지나간 버킷을 비움 (버킷 수 이상 지나면 전체 초기화)"""
+        bucket = int(current_time / self.bucket_width)
+        if self.current_bucket is None:
+            self.current_bucket = bucket
+            return
+
+        elapsed = bucket - self.current_bucket
+        if elapsed <= 0:
+            return
+
+        if elapsed >= self.bucket_count:
+            self.buckets = [0] * self.bucket_count
+            self.total = 0
+        else:
+            for step in range(1, elapsed + 1):
+                slot = (self.current_bucket + step) % self.bucket_count
+                self.total -= self.buckets[slot]
+                self.buckets[slot] = 0
+        self.current_bucket = bucket
+
+    def count(self, current_time):
+        """윈도우 내 요청 수"""
+        if self.bucket_width <= 0:
+            return 0
+        self._advance(current_time)
+        return self.total
+
+    def add(self, current_time, amount=1):
+        """현재 버킷에 요청 기록"""
+        if self.bucket_width <= 0:
+            return
+        self._advance(current_time)
+        self.buckets[self.current_bucket % self.bucket_count] += amount
+        self.total += amount
+
+    def reset(self):
+        """카운터 초기화"""
+        self.buckets = [0] * self.bucket_count
+        self.total = 0
+        self.current_bucket = None
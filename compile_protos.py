@@ -0,0 +1,46 @@
+import glob
+import logging
+import os
+import re
+import sys
+
+from grpc_tools import protoc
+
+from common.logging_config import setup_logging
+
+# 프로젝트 루트 기준 경로
+ROOT_DIR = os.path.abspath(os.path.dirname(__file__))
+PROTO_DIR = os.path.join(ROOT_DIR, "proto")
+GENERATED_DIR = os.path.join(ROOT_DIR, "generated")
+
+logger = logging.getLogger("compile_protos")
+
+def compile_protos():
+    """proto 파일을 generated 패키지로 컴파일"""
+    proto_files = sorted(glob.glob(os.path.join(PROTO_DIR, "*.proto")))
+
+    result = protoc.main([
+        "grpc_tools.protoc",
+        f"-I{PROTO_DIR}",
+        f"--python_out={GENERATED_DIR}",
+        f"--grpc_python_out={GENERATED_DIR}",
+    ] + proto_files)
+
+    if result != 0:
+        logger.error(f"proto 컴파일 실패 (코드: {result})")
+        return result
+
+    # generated 패키지 안에서 임포트되도록 *_pb2_grpc.py 의 임포트를 상대 경로로 변경
+    for grpc_file in glob.glob(os.path.join(GENERATED_DIR, "*_pb2_grpc.py")):
+        with open(grpc_file, "r", encoding="utf-8") as f:
+            content = f.read()
+        content = re.sub(r"^import (\w+_pb2) as", r"from . import \1 as", content, flags=re.MULTILINE)
+        with open(grpc_file, "w", encoding="utf-8") as f:
+            f.write(content)
+
+    logger.info(f"proto 컴파일 완료: {len(proto_files)}개 파일")
+    return 0
+
+if __name__ == "__main__":
+    setup_logging("compile_protos")
+    sys.exit(compile_protos())
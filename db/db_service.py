@@ -1,21 +1,25 @@
 import time
+import asyncio
+import threading
 import grpc
-from concurrent import futures
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
 
 from generated import db_pb2, db_pb2_grpc
 from common.logging_config import setup_logging
+from common.server_factory import create_server, create_aio_server
+from common.cancellation import CancellationStats
 
 class DbServicer(db_pb2_grpc.DbServiceServicer):
     def __init__(self):
         self.logger = setup_logging("db_service")
         self.slow_query_delay = float(os.environ.get("SLOW_QUERY_DELAY", "2.0"))  # 환경 변수에서 지연 시간 읽기
         self.execution_times = {}  # 쿼리 유형별 실행 시간 기록
+        self.cancellation_stats = CancellationStats()  # 호출자가 떠나 중단한 쿼리 수
     
     def Query(self, request, context):
-        """쿼리 실행 - 중복 메소드 제거 및 기능 통합"""
+        """쿼리 실행 - 호출자 데드라인 만료/취소 시 슬로우 쿼리 대기를 즉시 중단"""
         query_type = request.query_type
         self.logger.info(f"[DB] 쿼리 요청 받음: {query_type}")
         
@@ -24,7 +28,15 @@ class DbServicer(db_pb2_grpc.DbServiceServicer):
         try:
             if query_type == "slow":
                 self.logger.info(f"[DB] 슬로우 쿼리 실행 중... ({self.slow_query_delay}초 지연)")
-                time.sleep(self.slow_query_delay)
+                # RPC 가 끝나면(취소/데드라인 만료) 깨어나 워커 스레드를 바로 반환
+                caller_gone = threading.Event()
+                if not context.add_callback(caller_gone.set) or caller_gone.wait(self.slow_query_delay):
+                    cancelled_count = self.cancellation_stats.record()
+                    self.logger.warning(f"[DB] 쿼리 취소됨: {query_type} ({time.time() - start_time:.3f}초 경과, 누적 취소 {cancelled_count}건)")
+                    return db_pb2.DbResponse(
+                        success=False,
+                        error_message="호출자 취소"
+                    )
                 self.logger.info("[DB] 슬로우 쿼리 완료")
             else:
                 self.logger.info("[DB] 일반 쿼리 실행")
@@ -33,31 +45,89 @@ class DbServicer(db_pb2_grpc.DbServiceServicer):
             self.logger.info(f"[DB] 쿼리 실행 시간: {execution_time:.3f}초")
             
             # 쿼리 유형별 실행 시간 기록
-            if query_type not in self.execution_times:
-                self.execution_times[query_type] = []
+            self._record_execution_time(query_type, execution_time)
             
-            self.execution_times[query_type].append(execution_time)
+            return db_pb2.DbResponse(
+                result="쿼리 결과 데이터",
+                success=True
+            )
+        except Exception as e:
+            self.logger.exception(f"[DB] 쿼리 실행 중 오류: {str(e)}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(f"쿼리 실패: {str(e)}")
+            return db_pb2.DbResponse(
+                success=False,
+                error_message=f"쿼리 오류: {str(e)}"
+            )
+
+    def _record_execution_time(self, query_type, execution_time):
+        """쿼리 유형별 실행 시간 기록"""
+        if query_type not in self.execution_times:
+            self.execution_times[query_type] = []
+        
+        self.execution_times[query_type].append(execution_time)
+        
+        # 최대 1000개까지만 저장
+        if len(self.execution_times[query_type]) > 1000:
+            self.execution_times[query_type].pop(0)
+
+class AsyncDbServicer(DbServicer):
+    """grpc.aio 기반 DB 구현 - 슬로우 쿼리를 asyncio.sleep 으로 시뮬레이션하여 스레드를 점유하지 않음"""
+    
+    def __init__(self, max_inflight_queries=1000):
+        super().__init__()
+        self.max_inflight_queries = max_inflight_queries
+        self.inflight_queries = 0
+        self.logger.info(f"[DB-aio] 초기화 - 최대 동시 쿼리: {max_inflight_queries}개")
+    
+    async def Query(self, request, context):
+        """쿼리 실행 - 호출자 데드라인 만료/취소 시 즉시 중단"""
+        query_type = request.query_type
+        self.inflight_queries += 1
+        self.logger.info(f"[DB-aio] 쿼리 요청 받음: {query_type} (진행 중: {self.inflight_queries}개)")
+        
+        start_time = time.time()
+        
+        try:
+            if query_type == "slow":
+                self.logger.info(f"[DB-aio] 슬로우 쿼리 실행 중... ({self.slow_query_delay}초 지연)")
+                await asyncio.sleep(self.slow_query_delay)
+                self.logger.info("[DB-aio] 슬로우 쿼리 완료")
+            else:
+                self.logger.info("[DB-aio] 일반 쿼리 실행")
             
-            # 최대 1000개까지만 저장
-            if len(self.execution_times[query_type]) > 1000:
-                self.execution_times[query_type].pop(0)
+            execution_time = time.time() - start_time
+            self.logger.info(f"[DB-aio] 쿼리 실행 시간: {execution_time:.3f}초")
+            self._record_execution_time(query_type, execution_time)
             
             return db_pb2.DbResponse(
                 result="쿼리 결과 데이터",
                 success=True
             )
+        except asyncio.CancelledError:
+            # 호출자의 데드라인 만료 또는 취소 - 남은 작업을 버리고 슬롯 반환
+            cancelled_count = self.cancellation_stats.record()
+            self.logger.warning(f"[DB-aio] 쿼리 취소됨: {query_type} ({time.time() - start_time:.3f}초 경과, 누적 취소 {cancelled_count}건)")
+            raise
         except Exception as e:
-            self.logger.exception(f"[DB] 쿼리 실행 중 오류: {str(e)}")
+            self.logger.exception(f"[DB-aio] 쿼리 실행 중 오류: {str(e)}")
             context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(f"쿼리 실패: {str(e)}")
             return db_pb2.DbResponse(
                 success=False,
                 error_message=f"쿼리 오류: {str(e)}"
             )
+        finally:
+            self.inflight_queries -= 1
 
 def serve():
+    # DB_SERVER_MODE=aio 이면 grpc.aio 서버로 실행
+    if os.environ.get("DB_SERVER_MODE", "thread").lower() == "aio":
+        asyncio.run(serve_aio())
+        return
+    
     logger = setup_logging("db_server")
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    server, executor = create_server("db")
     db_pb2_grpc.add_DbServiceServicer_to_server(DbServicer(), server)
     
     port = int(os.environ.get("PORT", "50057"))  # 환경 변수에서 포트 읽기
@@ -71,5 +141,24 @@ def serve():
         logger.info("DB 서비스 종료 중...")
         server.stop(0)
 
+async def serve_aio():
+    logger = setup_logging("db_server")
+    
+    # 최대 동시 쿼리 수 - 초과 요청은 gRPC 가 RESOURCE_EXHAUSTED 로 거부
+    max_inflight_queries = int(os.environ.get("DB_MAX_INFLIGHT_QUERIES", "1000"))
+    server = create_aio_server("db", maximum_concurrent_rpcs=max_inflight_queries)
+    db_pb2_grpc.add_DbServiceServicer_to_server(AsyncDbServicer(max_inflight_queries), server)
+    
+    port = int(os.environ.get("PORT", "50057"))
+    server.add_insecure_port(f"[::]:{port}")
+    await server.start()
+    logger.info(f"DB 서비스 시작됨 (aio 모드): 포트 {port}")
+    
+    try:
+        await server.wait_for_termination()
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        logger.info("DB 서비스 종료 중...")
+        await server.stop(0)
+
 if __name__ == "__main__":
     serve()
\ No newline at end of file
@@ -17,6 +17,8 @@ import datetime
 
 from generated import bff_pb2, bff_pb2_grpc
 from common.logging_config import setup_logging
+from common.connection_manager import ConnectionManager
+from common.priority import priority_from_request_type, priority_metadata
 
 # gRPC 환경 변수 설정 추가 - 디버그 로그 세부화
 os.environ['GRPC_VERBOSITY'] = 'DEBUG'
@@ -52,6 +54,10 @@ werkzeug_logger.addHandler(werkzeug_handler)
 BFF_ADDRESS = os.environ.get("BFF_SERVICE_ADDRESS", "localhost:50051")
 logger.info(f"BFF 서비스 주소: {BFF_ADDRESS}")
 
+# BFF 호출 전체 타임아웃 (0 이면 무제한) - 남은 시간이 BFF -> 백엔드 -> DB 로 전파됨
+FRONT_REQUEST_TIMEOUT = float(os.environ.get("FRONT_REQUEST_TIMEOUT", "0")) or None
+logger.info(f"BFF 요청 타임아웃: {FRONT_REQUEST_TIMEOUT or '무제한'}")
+
 # 로그 메시지 큐
 log_queue = queue.Queue()
 
@@ -391,8 +397,8 @@ def log_monitor_thread(log_watcher):
             time.sleep(1)
 
 # gRPC 채널 생성 함수
-def create_channel(address, log_queue=None, service_name="bff_client"):
-    """인터셉터가 포함된 gRPC 채널 생성"""
+def create_channel(address, log_queue=None, service_name="bff_client", extra_options=None):
+    """인터셉터가 포함된 gRPC 채널 생성 (extra_options: 재연결 백오프 등 추가 채널 옵션)"""
     # 향상된 채널 옵션 설정
     options = [
         ('grpc.enable_http_proxy', 0),
@@ -403,7 +409,7 @@ def create_channel(address, log_queue=None, service_name="bff_client"):
         ('grpc.http2.max_pings_without_data', 0),
         ('grpc.http2.min_time_between_pings_ms', 10000),  # 10 seconds
         ('grpc.http2.min_ping_interval_without_data_ms', 5000)  # 5 seconds
-    ]
+    ] + list(extra_options or [])
     
     if log_queue:
         interceptor = DetailedGrpcInterceptor(log_queue, service_name=service_name)
@@ -414,6 +420,33 @@ def create_channel(address, log_queue=None, service_name="bff_client"):
     else:
         return grpc.insecure_channel(address, options=options)
 
+# 프로세스 전역 BFF 채널 관리 (첫 호출 시 생성)
+bff_connections = None
+bff_connections_lock = threading.Lock()
+
+def get_bff_stub():
+    """재사용 가능한 BFF 스텁 반환 (BFF_SERVICE_ADDRESS 변경 시 채널 재생성)"""
+    global bff_connections, BFF_ADDRESS
+    
+    address = os.environ.get("BFF_SERVICE_ADDRESS", "localhost:50051")
+    
+    with bff_connections_lock:
+        if bff_connections is None:
+            bff_connections = ConnectionManager(
+                addresses={'bff': address},
+                stub_class=bff_pb2_grpc.BffServiceStub,
+                channel_factory=lambda addr, options: create_channel(addr, log_queue, "bff_client", extra_options=options),
+                initial_backoff=float(os.environ.get("BFF_RECONNECT_INITIAL_BACKOFF", "1.0")),
+                max_backoff=float(os.environ.get("BFF_RECONNECT_MAX_BACKOFF", "30.0")),
+                name="front_to_bff"
+            )
+        elif address != BFF_ADDRESS:
+            logger.info(f"BFF 서비스 주소 변경: {BFF_ADDRESS} -> {address}")
+            bff_connections.set_address('bff', address)
+        BFF_ADDRESS = address
+    
+    return bff_connections.get_stub('bff')
+
 # BFF 서비스 호출 함수
 def call_bff(request_type, use_deadline, use_circuit_breaker, use_backpressure, backend_type):
     """BFF 서비스 호출"""
@@ -422,9 +455,8 @@ def call_bff(request_type, use_deadline, use_circuit_breaker, use_backpressure,
     start_time = time.time()
     
     try:
-        # 인터셉터가 포함된 채널 생성
-        channel = create_channel(BFF_ADDRESS, log_queue, "bff_client")
-        stub = bff_pb2_grpc.BffServiceStub(channel)
+        # 재사용 채널의 스텁 사용
+        stub = get_bff_stub()
         
         request = bff_pb2.BffRequest(
             request_type=request_type,
@@ -434,7 +466,9 @@ def call_bff(request_type, use_deadline, use_circuit_breaker, use_backpressure,
             backend_type=backend_type
         )
         
-        response = stub.Process(request)
+        # 요청 유형으로 정한 우선순위를 전달 (BFF 디스패치 시점 백프레셔에서 사용)
+        priority = priority_from_request_type(request_type)
+        response = stub.Process(request, timeout=FRONT_REQUEST_TIMEOUT, metadata=priority_metadata(priority))
         elapsed_time = time.time() - start_time
         
         logger.info(f"[Front] BFF 응답 수신 (소요 시간: {elapsed_time:.2f}초)")
@@ -534,9 +568,8 @@ def reset_api():
     logger.info(f"[Front] 패턴 리셋 API 호출 - 패턴: {pattern}, 백엔드: {backend_type}")
     
     try:
-        # 채널 생성
-        channel = create_channel(BFF_ADDRESS, log_queue, "bff_client")
-        stub = bff_pb2_grpc.BffServiceStub(channel)
+        # 재사용 채널의 스텁 사용
+        stub = get_bff_stub()
         
         reset_request = bff_pb2.ResetRequest(
             pattern=pattern,
@@ -613,9 +646,8 @@ def status_api():
     logger.info(f"[Front] 패턴 상태 조회 API 호출 - 백엔드: {backend_type}")
     
     try:
-        # 채널 생성
-        channel = create_channel(BFF_ADDRESS, log_queue, "bff_client")
-        stub = bff_pb2_grpc.BffServiceStub(channel)
+        # 재사용 채널의 스텁 사용
+        stub = get_bff_stub()
         
         status_request = bff_pb2.StatusRequest(
             backend_type=backend_type
@@ -656,7 +688,8 @@ def status_api():
                 "backpressure": {
                     "active_requests": response.backpressure_active_requests,
                     "is_overloaded": response.backpressure_overloaded
-                }
+                },
+                "metrics": dict(response.metrics)
             })
         else:
             log_content += f"상태 조회 실패: {response.error_message}"
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: shared_state.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x12shared_state.proto\x12\x0cshared_state\"o\n\x11TakeTokensRequest\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x0c\n\x04rate\x18\x02 \x01(\x01\x12\r\n\x05\x62urst\x18\x03 \x01(\x01\x12\x0e\n\x06\x61mount\x18\x04 \x01(\x01\x12\x12\n\nmin_tokens\x18\x05 \x01(\x01\x12\x0c\n\x04peek\x18\x06 \x01(\x08\"5\n\x12TakeTokensResponse\x12\x0f\n\x07\x61llowed\x18\x01 \x01(\x08\x12\x0e\n\x06tokens\x18\x02 \x01(\x01\"\x1e\n\x0fResetKeyRequest\x12\x0b\n\x03key\x18\x01 \x01(\t\"#\n\x10ResetKeyResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x32\xb0\x01\n\x12SharedStateService\x12O\n\nTakeTokens\x12\x1f.shared_state.TakeTokensRequest\x1a .shared_state.TakeTokensResponse\x12I\n\x08ResetKey\x12\x1d.shared_state.ResetKeyRequest\x1a\x1e.shared_state.ResetKeyResponseb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'shared_state_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _globals['_TAKETOKENSREQUEST']._serialized_start=36
+  _globals['_TAKETOKENSREQUEST']._serialized_end=147
+  _globals['_TAKETOKENSRESPONSE']._serialized_start=149
+  _globals['_TAKETOKENSRESPONSE']._serialized_end=202
+  _globals['_RESETKEYREQUEST']._serialized_start=204
+  _globals['_RESETKEYREQUEST']._serialized_end=234
+  _globals['_RESETKEYRESPONSE']._serialized_start=236
+  _globals['_RESETKEYRESPONSE']._serialized_end=271
+  _globals['_SHAREDSTATESERVICE']._serialized_start=274
+  _globals['_SHAREDSTATESERVICE']._serialized_end=450
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,102 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+
+from . import shared_state_pb2 as shared__state__pb2
+
+
+class SharedStateServiceStub(object):
+    """여러 호스트의 레플리카가 공유하는 요청률 예산 (토큰 버킷)
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.TakeTokens = channel.unary_unary(
+                '/shared_state.SharedStateService/TakeTokens',
+                request_serializer=shared__state__pb2.TakeTokensRequest.SerializeToString,
+                response_deserializer=shared__state__pb2.TakeTokensResponse.FromString,
+                )
+        self.ResetKey = channel.unary_unary(
+                '/shared_state.SharedStateService/ResetKey',
+                request_serializer=shared__state__pb2.ResetKeyRequest.SerializeToString,
+                response_deserializer=shared__state__pb2.ResetKeyResponse.FromString,
+                )
+
+
+class SharedStateServiceServicer(object):
+    """여러 호스트의 레플리카가 공유하는 요청률 예산 (토큰 버킷)
+    """
+
+    def TakeTokens(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ResetKey(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_SharedStateServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'TakeTokens': grpc.unary_unary_rpc_method_handler(
+                    servicer.TakeTokens,
+                    request_deserializer=shared__state__pb2.TakeTokensRequest.FromString,
+                    response_serializer=shared__state__pb2.TakeTokensResponse.SerializeToString,
+            ),
+            'ResetKey': grpc.unary_unary_rpc_method_handler(
+                    servicer.ResetKey,
+                    request_deserializer=shared__state__pb2.ResetKeyRequest.FromString,
+                    response_serializer=shared__state__pb2.ResetKeyResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'shared_state.SharedStateService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+
+
+ # This class is part of an EXPERIMENTAL API.
+class SharedStateService(object):
+    """여러 호스트의 레플리카가 공유하는 요청률 예산 (토큰 버킷)
+    """
+
+    @staticmethod
+    def TakeTokens(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/shared_state.SharedStateService/TakeTokens',
+            shared__state__pb2.TakeTokensRequest.SerializeToString,
+            shared__state__pb2.TakeTokensResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def ResetKey(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/shared_state.SharedStateService/ResetKey',
+            shared__state__pb2.ResetKeyRequest.SerializeToString,
+            shared__state__pb2.ResetKeyResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
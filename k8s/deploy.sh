@@ -12,12 +12,14 @@ kubectl apply -f configmap.yaml
 # 이미지 빌드 (미니쿠베 환경 내에서)
 eval $(minikube docker-env)
 docker build -t grpc-error-handling-db:latest -f db/Dockerfile .
+docker build -t grpc-error-handling-shared-state:latest -f shared_state/Dockerfile .
 docker build -t grpc-error-handling-backend:latest -f backend/Dockerfile .
 docker build -t grpc-error-handling-bff:latest -f bff/Dockerfile .
 docker build -t grpc-error-handling-frontend:latest -f front/Dockerfile .
 
 # 서비스 배포
 kubectl apply -f db-service.yaml
+kubectl apply -f shared-state-service.yaml
 kubectl apply -f backend-service.yaml
 kubectl apply -f bff-service.yaml
 kubectl apply -f frontend.yaml
@@ -0,0 +1,79 @@
+import asyncio
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+
+from generated import shared_state_pb2, shared_state_pb2_grpc
+from common.logging_config import setup_logging
+from common.server_factory import create_server, create_aio_server
+from common.shared_state import LocalStateStore
+
+class SharedStateServicer(shared_state_pb2_grpc.SharedStateServiceServicer):
+    """여러 호스트의 레플리카가 공유하는 토큰 버킷 서버 (단일 인스턴스, 메모리 저장)"""
+
+    def __init__(self):
+        self.logger = setup_logging("shared_state_service")
+        self.store = LocalStateStore()
+
+    def TakeTokens(self, request, context):
+        """키의 토큰 버킷을 보충 후 확인/소모"""
+        allowed, tokens = self.store.take_tokens(
+            request.key, request.rate, request.burst,
+            amount=request.amount, min_tokens=request.min_tokens, peek=request.peek
+        )
+        return shared_state_pb2.TakeTokensResponse(allowed=allowed, tokens=tokens)
+
+    def ResetKey(self, request, context):
+        """키 상태 초기화"""
+        self.store.reset_key(request.key)
+        self.logger.info(f"[공유상태] 키 초기화: {request.key}")
+        return shared_state_pb2.ResetKeyResponse(success=True)
+
+class AsyncSharedStateServicer(SharedStateServicer):
+    """grpc.aio 기반 구현 - 저장소 갱신은 짧은 잠금 구간뿐이라 이벤트 루프에서 바로 처리"""
+
+    async def TakeTokens(self, request, context):
+        return super().TakeTokens(request, context)
+
+    async def ResetKey(self, request, context):
+        return super().ResetKey(request, context)
+
+def serve():
+    # SHARED_STATE_SERVER_MODE=aio 이면 grpc.aio 서버로 실행
+    if os.environ.get("SHARED_STATE_SERVER_MODE", "thread").lower() == "aio":
+        asyncio.run(serve_aio())
+        return
+
+    logger = setup_logging("shared_state_server")
+    server, executor = create_server("shared_state")
+    shared_state_pb2_grpc.add_SharedStateServiceServicer_to_server(SharedStateServicer(), server)
+
+    port = int(os.environ.get("PORT", "50058"))
+    server.add_insecure_port(f"[::]:{port}")
+    server.start()
+    logger.info(f"공유 상태 서비스 시작됨: 포트 {port}")
+
+    try:
+        server.wait_for_termination()
+    except KeyboardInterrupt:
+        logger.info("공유 상태 서비스 종료 중...")
+        server.stop(0)
+
+async def serve_aio():
+    logger = setup_logging("shared_state_server")
+    server = create_aio_server("shared_state")
+    shared_state_pb2_grpc.add_SharedStateServiceServicer_to_server(AsyncSharedStateServicer(), server)
+
+    port = int(os.environ.get("PORT", "50058"))
+    server.add_insecure_port(f"[::]:{port}")
+    await server.start()
+    logger.info(f"공유 상태 서비스 시작됨 (aio 모드): 포트 {port}")
+
+    try:
+        await server.wait_for_termination()
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        logger.info("공유 상태 서비스 종료 중...")
+        await server.stop(0)
+
+if __name__ == "__main__":
+    serve()
@@ -0,0 +1,209 @@
+import asyncio
+import unittest
+from collections import namedtuple
+from unittest import mock
+
+import grpc
+
+from common.admission import AsyncBackpressureInterceptor, BackpressureInterceptor
+
+_CallDetails = namedtuple("_CallDetails", ["method", "invocation_metadata"])
+
+class _Aborted(Exception):
+    pass
+
+class _FakeBackpressure:
+    """등록 결과를 정해 두고 complete_request 호출을 기록"""
+
+    def __init__(self, admit=True, register=True):
+        self.admit = admit          # try_register_request 결과 (True/False/None)
+        self.register = register    # register_request(_async) 결과
+        self.registered = []
+        self.completions = []
+
+    def try_register_request(self, priority):
+        self.registered.append(priority)
+        return self.admit
+
+    def register_request(self, priority):
+        self.registered.append(priority)
+        return self.register
+
+    async def register_request_async(self, priority):
+        self.registered.append(priority)
+        return self.register
+
+    def complete_request(self, rtt=None, dropped=False):
+        self.completions.append((rtt is not None, dropped))
+
+class _FakeContext:
+    def __init__(self):
+        self.callbacks = []
+        self.status = None
+
+    def add_callback(self, callback):
+        self.callbacks.append(callback)
+        return True
+
+    def add_done_callback(self, callback):
+        self.callbacks.append(callback)
+
+    def set_code(self, code):
+        self.status = code
+
+    def code(self):
+        return self.status
+
+    def abort(self, code, details):
+        self.status = code
+        raise _Aborted(details)
+
+    def cancel(self):
+        """클라이언트 취소 - 등록된 콜백 실행"""
+        for callback in self.callbacks:
+            callback()
+
+class _FakeAsyncContext(_FakeContext):
+    async def abort(self, code, details):
+        self.status = code
+        raise _Aborted(details)
+
+def _call_details(metadata=()):
+    return _CallDetails("/backend.BackendService/Process", metadata)
+
+class BackpressureInterceptorTest(unittest.TestCase):
+    """스레드 서버 인터셉터 - 모든 종료 경로에서 슬롯 한 번 반환"""
+
+    def intercept(self, behavior, backpressure, metadata=()):
+        interceptor = BackpressureInterceptor(backpressure, lease_timeout=60)
+        handler = interceptor.intercept_service(
+            lambda details: grpc.unary_unary_rpc_method_handler(behavior), _call_details(metadata))
+        return interceptor, handler
+
+    def test_success_completes_with_rtt(self):
+        backpressure = _FakeBackpressure()
+        interceptor, handler = self.intercept(lambda request, context: "ok", backpressure)
+        self.assertEqual(handler.unary_unary(None, _FakeContext()), "ok")
+        self.assertEqual(backpressure.completions, [(True, False)])
+        self.assertEqual(interceptor.get_stats()["active_leases"], 0)
+
+    def test_error_status_completes_as_drop(self):
+        def behavior(request, context):
+            context.set_code(grpc.StatusCode.UNAVAILABLE)
+            return "unavailable"
+        backpressure = _FakeBackpressure()
+        _, handler = self.intercept(behavior, backpressure)
+        handler.unary_unary(None, _FakeContext())
+        self.assertEqual(backpressure.completions, [(False, True)])
+
+    def test_handler_exception_releases_lease(self):
+        def behavior(request, context):
+            raise RuntimeError("boom")
+        backpressure = _FakeBackpressure()
+        interceptor, handler = self.intercept(behavior, backpressure)
+        with self.assertRaises(RuntimeError):
+            handler.unary_unary(None, _FakeContext())
+        self.assertEqual(backpressure.completions, [(False, True)])
+        self.assertEqual(interceptor.get_stats()["released"], 1)
+
+    def test_cancel_callback_releases_once_without_sample(self):
+        def behavior(request, context):
+            context.cancel()
+            return "late"
+        backpressure = _FakeBackpressure()
+        interceptor, handler = self.intercept(behavior, backpressure)
+        handler.unary_unary(None, _FakeContext())
+        self.assertEqual(backpressure.completions, [(False, False)])
+        self.assertEqual(interceptor.get_stats()["released"], 1)
+
+    def test_double_release_completes_once(self):
+        backpressure = _FakeBackpressure()
+        interceptor = BackpressureInterceptor(backpressure)
+        lease = interceptor._acquire_lease("Process", "normal")
+        lease.release()
+        lease.release(None)
+        self.assertEqual(len(backpressure.completions), 1)
+
+    def test_rejected_request_never_reaches_handler(self):
+        behavior = mock.Mock()
+        backpressure = _FakeBackpressure(admit=False)
+        interceptor, handler = self.intercept(behavior, backpressure)
+        with self.assertRaises(_Aborted):
+            handler.unary_unary(None, _FakeContext())
+        behavior.assert_not_called()
+        self.assertEqual(backpressure.completions, [])
+        self.assertEqual(interceptor.get_stats()["rejected"], 1)
+
+    def test_deferred_request_registers_on_worker(self):
+        backpressure = _FakeBackpressure(admit=None)
+        interceptor, handler = self.intercept(lambda request, context: "ok", backpressure, [("x-request-priority", "low")])
+        self.assertEqual(backpressure.registered, ["low"])
+        self.assertEqual(handler.unary_unary(None, _FakeContext()), "ok")
+        self.assertEqual(backpressure.registered, ["low", "low"])
+        self.assertEqual(backpressure.completions, [(True, False)])
+        self.assertEqual(interceptor.get_stats()["deferred"], 1)
+
+    def test_priority_comes_from_metadata_only(self):
+        backpressure = _FakeBackpressure()
+        self.intercept(lambda request, context: "ok", backpressure)
+        self.intercept(lambda request, context: "ok", backpressure, [("x-request-priority", "critical")])
+        self.intercept(lambda request, context: "ok", backpressure, [("x-request-priority", "urgent")])
+        self.assertEqual(backpressure.registered, ["normal", "critical", "normal"])
+
+    def test_reaper_releases_expired_leases(self):
+        backpressure = _FakeBackpressure()
+        interceptor = BackpressureInterceptor(backpressure, lease_timeout=5)
+        with mock.patch("common.admission.time.time", return_value=100.0):
+            stale = interceptor._acquire_lease("Process", "normal")
+        with mock.patch("common.admission.time.time", return_value=103.0):
+            fresh = interceptor._acquire_lease("Process", "normal")
+        with mock.patch("common.admission.time.time", return_value=106.0):
+            interceptor.reap_expired_leases()
+        self.assertTrue(stale.released)
+        self.assertFalse(fresh.released)
+        stale.release()
+        stats = interceptor.get_stats()
+        self.assertEqual((stats["reaped"], stats["released"], stats["active_leases"]), (1, 0, 1))
+        self.assertEqual(len(backpressure.completions), 1)
+
+class AsyncBackpressureInterceptorTest(unittest.TestCase):
+    """grpc.aio 인터셉터 - 취소 포함 모든 종료 경로에서 슬롯 한 번 반환"""
+
+    def run_handler(self, behavior, backpressure, context=None):
+        async def run():
+            interceptor = AsyncBackpressureInterceptor(backpressure, lease_timeout=60)
+
+            async def continuation(details):
+                return grpc.unary_unary_rpc_method_handler(behavior)
+            handler = await interceptor.intercept_service(continuation, _call_details())
+            return interceptor, await handler.unary_unary(None, context or _FakeAsyncContext())
+        return asyncio.run(run())
+
+    def test_success_completes_with_rtt(self):
+        async def behavior(request, context):
+            context.set_code(0)   # grpc.aio 는 정수 상태 코드를 반환
+            return "ok"
+        backpressure = _FakeBackpressure()
+        interceptor, response = self.run_handler(behavior, backpressure)
+        self.assertEqual(response, "ok")
+        self.assertEqual(backpressure.completions, [(True, False)])
+        self.assertEqual(interceptor.get_stats()["active_leases"], 0)
+
+    def test_cancelled_handler_releases_without_sample(self):
+        async def behavior(request, context):
+            raise asyncio.CancelledError()
+        backpressure = _FakeBackpressure()
+        with self.assertRaises(asyncio.CancelledError):
+            self.run_handler(behavior, backpressure)
+        self.assertEqual(backpressure.completions, [(False, False)])
+
+    def test_rejected_request_aborts(self):
+        behavior = mock.AsyncMock()
+        backpressure = _FakeBackpressure(register=False)
+        with self.assertRaises(_Aborted):
+            self.run_handler(behavior, backpressure)
+        behavior.assert_not_called()
+        self.assertEqual(backpressure.completions, [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+
+from common.backpressure import BackpressureController
+
+class AdaptiveConcurrencySampleTest(unittest.TestCase):
+    """백프레셔 등록~완료 경로에서 적응형 동시성 표본 수집"""
+
+    def make_controller(self):
+        return BackpressureController(max_requests=1000, max_concurrency=4, concurrency_algorithm="aimd",
+                                      min_concurrency=1, max_concurrency_limit=10)
+
+    def test_completion_with_rtt_is_a_sample(self):
+        controller = self.make_controller()
+        for _ in range(2):
+            self.assertTrue(controller.register_request())
+        controller.complete_request(rtt=0.01)
+        stats = controller.concurrency_limit.get_stats()
+        self.assertEqual((stats["samples"], stats["drops"]), (1, 0))
+        self.assertEqual(controller.max_concurrency, 5)   # 한도 절반 이상 사용 중 성공 -> +1
+        self.assertEqual(controller.active_requests, 1)
+
+    def test_dropped_completion_shrinks_limit(self):
+        controller = self.make_controller()
+        self.assertTrue(controller.register_request())
+        controller.complete_request(dropped=True)
+        stats = controller.concurrency_limit.get_stats()
+        self.assertEqual((stats["samples"], stats["drops"]), (0, 1))
+        self.assertEqual(controller.max_concurrency, 3)
+        self.assertEqual(controller.active_requests, 0)
+
+    def test_completion_without_outcome_is_not_a_sample(self):
+        controller = self.make_controller()
+        self.assertTrue(controller.register_request())
+        controller.complete_request()
+        stats = controller.concurrency_limit.get_stats()
+        self.assertEqual((stats["samples"], stats["drops"]), (0, 0))
+        self.assertEqual(controller.max_concurrency, 4)
+
+class QueueFullAccountingTest(unittest.TestCase):
+    """대기열 포화 거부 집계"""
+
+    def test_rate_rejection_with_free_queue_is_not_queue_full(self):
+        controller = BackpressureController(window_size=1, max_requests=1, max_concurrency=1, queue_size=4)
+        self.assertTrue(controller.register_request())
+        self.assertFalse(controller.register_request())   # 요청률과 동시 처리 한도를 모두 넘었지만 대기열은 비어 있음
+        self.assertEqual(controller.queue_full_count, 0)
+
+    def test_full_queue_rejection_is_counted(self):
+        controller = BackpressureController(max_requests=1000, max_concurrency=1, queue_size=1)
+        self.assertTrue(controller.register_request())
+        waiter = controller._admit_or_enqueue(None, "normal")
+        self.assertIsNotNone(waiter)
+        self.assertFalse(controller.try_register_request())
+        self.assertEqual(controller.queue_full_count, 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from unittest import mock
+
+from common.sliding_window import SlidingWindowCounter
+from common.circuit_breaker import CircuitBreaker, CountBasedWindow, TimeBasedWindow
+
+class SlidingWindowCounterTest(unittest.TestCase):
+    """시간 버킷 링 버퍼 롤오버"""
+
+    def test_counts_until_bucket_expires(self):
+        counter = SlidingWindowCounter(window_size=1.0, bucket_count=10)
+        for _ in range(3):
+            counter.add(100.0)
+        self.assertEqual(counter.count(100.5), 3)
+        self.assertEqual(counter.count(100.95), 3)
+        self.assertEqual(counter.count(101.0), 0)
+
+    def test_partial_rollover_drops_only_expired_buckets(self):
+        counter = SlidingWindowCounter(window_size=1.0, bucket_count=10)
+        counter.add(100.0, amount=2)
+        counter.add(100.5)
+        self.assertEqual(counter.count(100.9), 3)
+        self.assertEqual(counter.count(101.02), 1)
+        self.assertEqual(counter.count(101.55), 0)
+
+    def test_long_gap_resets_all_buckets(self):
+        counter = SlidingWindowCounter(window_size=1.0, bucket_count=10)
+        counter.add(100.0)
+        counter.add(100.3)
+        self.assertEqual(counter.count(250.0), 0)
+        counter.add(250.0)
+        self.assertEqual(counter.count(250.0), 1)
+
+class CallWindowTest(unittest.TestCase):
+    """서킷브레이커 호출 결과 창"""
+
+    def test_count_window_pushes_out_oldest(self):
+        window = CountBasedWindow(3)
+        for hit in (True, True, False):
+            window.record(hit, 0)
+        self.assertEqual(window.snapshot(0), (3, 2))
+        window.record(False, 0)
+        self.assertEqual(window.snapshot(0), (3, 1))
+        window.record(False, 0)
+        self.assertEqual(window.snapshot(0), (3, 0))
+
+    def test_time_window_rolls_over(self):
+        window = TimeBasedWindow(10)
+        window.record(True, 1000.0)
+        window.record(False, 1005.0)
+        self.assertEqual(window.snapshot(1009.5), (2, 1))
+        self.assertEqual(window.snapshot(1010.5), (1, 0))
+        self.assertEqual(window.snapshot(1016.0), (0, 0))
+        self.assertTrue(window.is_expired(1000.0, 1010.0))
+        self.assertFalse(window.is_expired(1005.0, 1010.0))
+
+class FailureRateWindowTest(unittest.TestCase):
+    """실패율 판단에 창 밖 실패가 섞이지 않는지"""
+
+    def test_failures_outside_time_window_do_not_trip(self):
+        breaker = CircuitBreaker(window_type="time", window_size=10, failure_rate_threshold=50.0, minimum_calls=3)
+        with mock.patch("common.circuit_breaker.time.time", return_value=1000.0):
+            breaker.report_failure()
+            breaker.report_failure()
+        with mock.patch("common.circuit_breaker.time.time", return_value=1011.0):
+            breaker.report_success()
+            breaker.report_success()
+            breaker.report_failure()
+            self.assertEqual(breaker.state, CircuitBreaker.STATE_CLOSED)
+            self.assertEqual(breaker.get_stats()["calls"], 3)
+
+    def test_failure_rate_over_count_window_trips(self):
+        breaker = CircuitBreaker(window_type="count", window_size=4, failure_rate_threshold=50.0, minimum_calls=4)
+        breaker.report_success()
+        breaker.report_success()
+        breaker.report_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.STATE_CLOSED)
+        breaker.report_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.STATE_OPEN)
+        self.assertEqual(breaker.open_reason, "failure_rate")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+import threading
+import unittest
+from unittest import mock
+
+from common.circuit_breaker import CircuitBreaker
+
+class _Clock:
+    """테스트용 시각 (common.circuit_breaker 의 time.time 대체)"""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+class HalfOpenPermitTest(unittest.TestCase):
+    """HALF_OPEN 시험 요청 허가 수 관리"""
+
+    def setUp(self):
+        self.clock = _Clock()
+        patcher = mock.patch("common.circuit_breaker.time.time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.breaker = CircuitBreaker(fail_threshold=1, reset_timeout=10, minimum_calls=1,
+                                      half_open_permits=2, half_open_required_successes=2)
+        self.breaker.report_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.STATE_OPEN)
+        self.clock.now += 11
+
+    def test_only_permits_in_flight_are_allowed(self):
+        self.assertTrue(self.breaker.allow_request())
+        self.assertEqual(self.breaker.state, CircuitBreaker.STATE_HALF_OPEN)
+        self.assertTrue(self.breaker.allow_request())
+        self.assertFalse(self.breaker.allow_request())
+        stats = self.breaker.get_stats()
+        self.assertEqual(stats["half_open_in_flight"], 2)
+        self.assertEqual(stats["half_open_rejected"], 1)
+
+    def test_success_returns_permit_and_closes_after_required_successes(self):
+        first = self.breaker.allow_request()
+        self.assertTrue(first)
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.report_success(first)
+        self.assertEqual(self.breaker.half_open_in_flight, 1)
+        third = self.breaker.allow_request()
+        self.assertTrue(third)
+        self.breaker.report_success(third)
+        self.assertEqual(self.breaker.state, CircuitBreaker.STATE_CLOSED)
+
+    def test_release_permit_records_no_outcome(self):
+        permit = self.breaker.allow_request()
+        self.assertTrue(permit)
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.release_permit(permit)
+        self.assertEqual(self.breaker.half_open_in_flight, 1)
+        self.assertEqual(self.breaker.half_open_successes, 0)
+        self.assertEqual(self.breaker.state, CircuitBreaker.STATE_HALF_OPEN)
+        self.assertTrue(self.breaker.allow_request())
+
+    def test_release_permit_outside_half_open_is_ignored(self):
+        self.breaker.reset()
+        self.breaker.release_permit()
+        self.assertEqual(self.breaker.half_open_in_flight, 0)
+        self.assertEqual(self.breaker.state, CircuitBreaker.STATE_CLOSED)
+
+    def test_probe_failure_reopens(self):
+        permit = self.breaker.allow_request()
+        self.assertTrue(permit)
+        self.breaker.report_failure(permit)
+        self.assertEqual(self.breaker.state, CircuitBreaker.STATE_OPEN)
+        self.assertEqual(self.breaker.open_reason, "half_open_probe")
+        self.assertFalse(self.breaker.allow_request())
+
+    def test_unreported_permits_are_reclaimed_after_reset_timeout(self):
+        self.assertTrue(self.breaker.allow_request())
+        self.assertTrue(self.breaker.allow_request())
+        self.clock.now += 5
+        self.assertFalse(self.breaker.allow_request())
+        self.clock.now += 6
+        self.assertTrue(self.breaker.allow_request())
+        self.assertEqual(self.breaker.half_open_in_flight, 1)
+
+    def test_results_without_probe_permit_are_ignored(self):
+        permit = self.breaker.allow_request()
+        self.assertTrue(permit)
+        # CLOSED 때 허가 없이 들어온 호출(True)이 뒤늦게 끝남
+        self.breaker.report_success(True)
+        self.breaker.report_success()
+        self.breaker.release_permit()
+        self.breaker.report_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.STATE_HALF_OPEN)
+        self.assertEqual((self.breaker.half_open_in_flight, self.breaker.half_open_successes), (1, 0))
+
+    def test_permit_is_settled_once(self):
+        permit = self.breaker.allow_request()
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.report_success(permit)
+        self.breaker.report_success(permit)
+        self.breaker.release_permit(permit)
+        self.assertEqual((self.breaker.half_open_in_flight, self.breaker.half_open_successes), (1, 1))
+        self.assertEqual(self.breaker.state, CircuitBreaker.STATE_HALF_OPEN)
+
+    def test_permit_from_earlier_half_open_is_ignored(self):
+        stale = self.breaker.allow_request()
+        fresh = self.breaker.allow_request()
+        self.breaker.report_failure(fresh)
+        self.clock.now += 11
+        self.assertTrue(self.breaker.allow_request())
+        self.breaker.report_success(stale)
+        self.assertEqual((self.breaker.half_open_in_flight, self.breaker.half_open_successes), (1, 0))
+
+class ClosedFastPathTest(unittest.TestCase):
+    """CLOSED 상태의 잠금 없는 경로"""
+
+    def test_allow_request_does_not_take_lock_when_closed(self):
+        breaker = CircuitBreaker()
+        acquired = threading.Event()
+        release = threading.Event()
+
+        def hold_lock():
+            with breaker.lock:
+                acquired.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        try:
+            acquired.wait(5)
+            result = []
+            caller = threading.Thread(target=lambda: result.append((breaker.allow_request(), breaker.report_success())))
+            caller.start()
+            caller.join(1)
+            self.assertFalse(caller.is_alive())
+            self.assertEqual(result, [(True, None)])
+        finally:
+            release.set()
+            holder.join()
+
+    def test_buffered_successes_are_counted_once_drained(self):
+        breaker = CircuitBreaker(window_size=200)
+        threads = [threading.Thread(target=lambda: [breaker.report_success() for _ in range(50)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(breaker.get_stats()["calls"], 200)
+
+    def test_failure_sees_buffered_successes(self):
+        breaker = CircuitBreaker(window_size=10, failure_rate_threshold=50.0, minimum_calls=4)
+        for _ in range(3):
+            breaker.report_success()
+        breaker.report_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.STATE_CLOSED)
+        stats = breaker.get_stats()
+        self.assertEqual((stats["calls"], stats["failures"]), (4, 1))
+
+    def test_state_change_callback_runs_outside_lock(self):
+        breaker = CircuitBreaker(fail_threshold=1, minimum_calls=1)
+        lock_free = []
+
+        def try_lock():
+            # RLock 이라 같은 스레드에서는 항상 잡히므로 다른 스레드에서 확인
+            acquired = breaker.lock.acquire(blocking=False)
+            lock_free.append(acquired)
+            if acquired:
+                breaker.lock.release()
+
+        def callback(circuit_breaker, old_state, new_state):
+            probe = threading.Thread(target=try_lock)
+            probe.start()
+            probe.join()
+
+        breaker.add_state_change_callback(callback)
+        breaker.report_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.STATE_OPEN)
+        self.assertEqual(lock_free, [True])
+
+if __name__ == "__main__":
+    unittest.main()
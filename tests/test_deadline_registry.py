@@ -0,0 +1,57 @@
+import logging
+import unittest
+
+from common.circuit_breaker import CircuitBreaker
+from common.deadline import DeadlineRegistry
+
+class DeadlineRegistryTest(unittest.TestCase):
+    """경로별 적응형 데드라인 LRU"""
+
+    def test_same_route_returns_same_handler(self):
+        registry = DeadlineRegistry(initial_timeout=0.5, max_routes=4)
+        handler = registry.get("db", "Query", "normal")
+        self.assertIs(registry.get("db", "Query", "normal"), handler)
+        self.assertIsNot(registry.get("db", "Query", "slow"), handler)
+        self.assertEqual(handler.get_timeout(), 0.5)
+
+    def test_evicts_least_recently_used_route(self):
+        registry = DeadlineRegistry(max_routes=2)
+        normal = registry.get("db", "Query", "normal")
+        registry.get("db", "Query", "slow")
+        registry.get("db", "Query", "normal")      # normal 을 최근 사용으로 갱신
+        registry.get("db", "Query", "batch")       # slow 제거
+        self.assertEqual(list(registry.routes), [("db", "Query", "normal"), ("db", "Query", "batch")])
+        self.assertIs(registry.get("db", "Query", "normal"), normal)
+        stats = registry.get_stats()
+        self.assertEqual((stats["routes"], stats["max_routes"], stats["evicted"]), (2, 2, 1))
+        self.assertNotIn("route.db.Query.slow", stats)
+
+    def test_evicted_route_starts_from_initial_timeout(self):
+        registry = DeadlineRegistry(initial_timeout=0.5, max_routes=1)
+        handler = registry.get("db", "Query", "slow")
+        handler.timeout_seconds = 3.0
+        registry.get("db", "Query", "normal")
+        recreated = registry.get("db", "Query", "slow")
+        self.assertIsNot(recreated, handler)
+        self.assertEqual(recreated.get_timeout(), 0.5)
+        self.assertEqual(registry.get_stats()["evicted"], 2)
+
+    def test_circuit_breaker_is_shared_and_registered_once(self):
+        registry = DeadlineRegistry(max_routes=8)
+        existing = registry.get("db", "Query", "normal")
+        breaker = CircuitBreaker(name="test")
+        registry.set_circuit_breaker(breaker)
+        created = registry.get("db", "Query", "slow")
+        self.assertIs(existing.circuit_breaker, breaker)
+        self.assertIs(created.circuit_breaker, breaker)
+        self.assertEqual(len(breaker._state_change_callbacks), 1)
+
+    def test_route_handlers_share_registry_logger(self):
+        registry = DeadlineRegistry(name="bff-test", max_routes=2)
+        before = set(logging.Logger.manager.loggerDict)
+        handlers = [registry.get("db", "Query", f"type-{i}") for i in range(10)]
+        self.assertTrue(all(handler.logger is registry.logger for handler in handlers))
+        self.assertEqual(set(logging.Logger.manager.loggerDict) - before, set())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import random
+import threading
+import unittest
+
+from common.latency_histogram import LatencyHistogram, HistogramSnapshot, bucket_index, bucket_value, BUCKET_COUNT
+
+# 버킷 대표값(구간 중앙)의 최대 상대 오차 - 2의 거듭제곱 구간을 16칸으로 나누므로 1/32
+MAX_RELATIVE_ERROR = 1 / 32 + 1e-9
+
+def exact_percentile(values, percentile):
+    """HistogramSnapshot.percentile 과 같은 순위 정의로 정렬된 표본에서 계산"""
+    ordered = sorted(values)
+    rank = max(1, int(len(ordered) * percentile / 100 + 0.5))
+    return ordered[rank - 1]
+
+class BucketTest(unittest.TestCase):
+    """로그-선형 버킷 경계"""
+
+    def test_bucket_value_stays_within_relative_error(self):
+        for microseconds in list(range(32, 5000)) + [10_000, 123_456, 2_000_000, 60_000_000]:
+            seconds = microseconds / 1_000_000
+            value = bucket_value(bucket_index(seconds))
+            self.assertLessEqual(abs(value - seconds) / seconds, MAX_RELATIVE_ERROR, microseconds)
+
+    def test_bucket_index_is_monotonic_and_bounded(self):
+        previous = -1
+        for microseconds in range(0, 200_000, 7):
+            index = bucket_index(microseconds / 1_000_000)
+            self.assertGreaterEqual(index, previous)
+            previous = index
+        self.assertEqual(bucket_index(-1.0), 0)
+        self.assertEqual(bucket_index(10_000.0), BUCKET_COUNT - 1)
+
+class PercentileTest(unittest.TestCase):
+    """백분위수가 정렬된 표본 값의 버킷 오차 안에 있는지"""
+
+    def test_percentiles_within_bucket_error(self):
+        rng = random.Random(7)
+        values = [rng.lognormvariate(-3.0, 1.0) for _ in range(5000)]
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value, current_time=1000.0)
+        snapshot = histogram.snapshot(60, current_time=1000.0)
+        self.assertEqual(snapshot.count, len(values))
+        self.assertAlmostEqual(snapshot.mean(), sum(values) / len(values), places=9)
+        for percentile in (50, 90, 95, 99, 99.9):
+            expected = exact_percentile(values, percentile)
+            actual = snapshot.percentile(percentile)
+            self.assertLessEqual(abs(actual - expected) / expected, MAX_RELATIVE_ERROR, percentile)
+
+    def test_empty_snapshot(self):
+        self.assertIsNone(HistogramSnapshot().percentile(95))
+        self.assertIsNone(LatencyHistogram().percentile(95))
+
+    def test_merge_adds_counts(self):
+        first, second = LatencyHistogram(), LatencyHistogram()
+        for _ in range(3):
+            first.record(0.01, current_time=1000.0)
+        second.record(1.0, current_time=1000.0)
+        merged = first.snapshot(60, 1000.0).merge(second.snapshot(60, 1000.0))
+        self.assertEqual(merged.count, 4)
+        self.assertLessEqual(abs(merged.percentile(100) - 1.0), MAX_RELATIVE_ERROR)
+
+class WindowTest(unittest.TestCase):
+    """창별 만료"""
+
+    def test_old_samples_leave_short_window_first(self):
+        histogram = LatencyHistogram()
+        histogram.record(0.5, current_time=1000.0)
+        histogram.record(0.01, current_time=1100.0)
+        self.assertEqual(histogram.snapshot(60, current_time=1100.0).count, 1)
+        self.assertEqual(histogram.snapshot(300, current_time=1100.0).count, 2)
+        self.assertEqual(histogram.snapshot(3600, current_time=1100.0).count, 2)
+        self.assertEqual(histogram.snapshot(300, current_time=1500.0).count, 0)
+        self.assertEqual(histogram.snapshot(3600, current_time=1500.0).count, 2)
+        self.assertEqual(histogram.snapshot(3600, current_time=5000.0).count, 0)
+
+    def test_reset_clears_all_windows(self):
+        histogram = LatencyHistogram()
+        histogram.record(0.2, current_time=1000.0)
+        histogram.record(0.2, current_time=1020.0)
+        histogram.reset()
+        self.assertEqual(histogram.snapshot(3600, current_time=1030.0).count, 0)
+
+class ConcurrentRecordTest(unittest.TestCase):
+    """스레드별 스트라이프 기록"""
+
+    def test_concurrent_records_across_slices_are_all_counted(self):
+        histogram = LatencyHistogram()
+        threads, per_thread = 8, 2000
+
+        def worker(offset):
+            for i in range(per_thread):
+                histogram.record(0.001 * (offset + 1), current_time=1000.0 + i * 0.05)
+
+        workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        snapshot = histogram.snapshot(3600, current_time=1100.0)
+        self.assertEqual(snapshot.count, threads * per_thread)
+        self.assertAlmostEqual(snapshot.total, 0.001 * per_thread * sum(range(1, threads + 1)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,22 @@
+import unittest
+
+from common.priority import DEFAULT_PRIORITY_SHARES, parse_priority_shares
+
+class ParsePrioritySharesTest(unittest.TestCase):
+    """BACKPRESSURE_PRIORITY_SHARES 파싱"""
+
+    def test_empty_value_uses_defaults(self):
+        self.assertEqual(parse_priority_shares(""), DEFAULT_PRIORITY_SHARES)
+
+    def test_parses_and_clamps_shares(self):
+        shares = parse_priority_shares(" normal : 0.9, low:1.5 ,")
+        self.assertEqual(shares, {"critical": 1.0, "normal": 0.9, "low": 1.0})
+
+    def test_rejects_malformed_items(self):
+        for value in ("low", "low:0.5:1", "low:half", "urgent:0.5"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_priority_shares(value)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import math
+import random
+import sys
+import threading
+import unittest
+
+from common.quantile_estimator import P2QuantileEstimator, WindowedQuantileEstimator
+
+def exact_quantile(values, quantile):
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * quantile), len(ordered) - 1)]
+
+class P2QuantileEstimatorTest(unittest.TestCase):
+    """P² 추정값과 정렬된 표본의 분위수 비교"""
+
+    def assert_close(self, values, quantile, tolerance):
+        estimator = P2QuantileEstimator(quantile)
+        for value in values:
+            estimator.add(value)
+        expected = exact_quantile(values, quantile)
+        self.assertLessEqual(abs(estimator.value() - expected) / expected, tolerance)
+
+    def test_p95_of_exponential_sample(self):
+        rng = random.Random(1)
+        self.assert_close([rng.expovariate(10.0) for _ in range(10_000)], 0.95, 0.03)
+
+    def test_p95_of_lognormal_sample(self):
+        rng = random.Random(2)
+        self.assert_close([rng.lognormvariate(-2.0, 0.5) for _ in range(10_000)], 0.95, 0.03)
+
+    def test_median_of_uniform_sample(self):
+        rng = random.Random(3)
+        self.assert_close([rng.uniform(0.1, 0.2) for _ in range(5_000)], 0.5, 0.02)
+
+    def test_small_samples_are_exact(self):
+        estimator = P2QuantileEstimator(0.5)
+        self.assertIsNone(estimator.value())
+        for value in (0.3, 0.1, 0.2):
+            estimator.add(value)
+        self.assertEqual(estimator.value(), 0.2)
+
+    def test_markers_stay_ordered(self):
+        rng = random.Random(4)
+        estimator = P2QuantileEstimator(0.95)
+        for _ in range(2_000):
+            estimator.add(rng.choice((0.01, 0.02, 2.0)) * rng.uniform(0.9, 1.1))
+            if estimator.count >= 5:
+                self.assertEqual(estimator.heights, sorted(estimator.heights))
+
+class WindowedQuantileEstimatorTest(unittest.TestCase):
+    """window_size 개마다 새로 시작하는 추정기"""
+
+    def test_concurrent_adds_keep_markers_consistent(self):
+        # 작은 구간으로 초기 5개 구간과 구간 교체를 자주 겪게 해 경합을 드러냄
+        estimator = WindowedQuantileEstimator(0.95, window_size=100)
+        original_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, original_interval)
+        errors = []
+
+        def worker(seed):
+            rng = random.Random(seed)
+            try:
+                for _ in range(20_000):
+                    estimator.add(rng.choice((0.01, 0.02, 2.0)) * rng.uniform(0.9, 1.1))
+                    estimator.value()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        current = estimator.current
+        self.assertEqual(current.count, (8 * 20_000) % 100)
+        self.assertEqual(current.heights, sorted(current.heights))
+        self.assertTrue(math.isfinite(estimator.previous_value))
+        self.assertTrue(math.isfinite(estimator.value()))
+
+    def test_follows_distribution_shift(self):
+        rng = random.Random(5)
+        estimator = WindowedQuantileEstimator(0.95, window_size=200)
+        for _ in range(1_000):
+            estimator.add(rng.uniform(0.01, 0.02))
+        self.assertLess(estimator.value(), 0.021)
+        shifted = [rng.uniform(1.0, 2.0) for _ in range(400)]
+        for value in shifted:
+            estimator.add(value)
+        expected = exact_quantile(shifted[-200:], 0.95)
+        self.assertLessEqual(abs(estimator.value() - expected) / expected, 0.05)
+
+    def test_blends_previous_window_at_rollover(self):
+        estimator = WindowedQuantileEstimator(0.5, window_size=10)
+        for _ in range(10):
+            estimator.add(1.0)
+        self.assertEqual(estimator.previous_value, 1.0)
+        self.assertEqual(estimator.value(), 1.0)
+        for _ in range(5):
+            estimator.add(3.0)
+        self.assertAlmostEqual(estimator.value(), 2.0)
+
+    def test_reset(self):
+        estimator = WindowedQuantileEstimator(0.95, window_size=10)
+        for value in range(25):
+            estimator.add(float(value))
+        estimator.reset()
+        self.assertIsNone(estimator.value())
+
+if __name__ == "__main__":
+    unittest.main()